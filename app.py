@@ -1,22 +1,19 @@
 # app.py
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Blueprint, current_app, render_template, request, jsonify, Response, stream_with_context
+import json
+import secrets
 import traceback # For debugging
 import math # For isnan, isinf
-import numpy as np # For numpy float types
-
-# Import core modules
-from core.materials import MATERIALS_LIB, get_material
-from core.cross_sections import create_cross_section
-from core.elements import Beam, Column
-from core.beam_solvers import (
-    solve_simply_supported_beam_point_load,
-    solve_cantilever_beam_point_load_end,
-    solve_simply_supported_beam_udl,
-    solve_cantilever_beam_udl
-)
-from core.column_solvers import solve_column_axial_buckling
+import os
+import re
+
+# Core modules are resolved lazily (see core/__init__.py): solvers and NumPy
+# load on first use, or up front via create_app(prewarm_core=True).
+import core
+from live_channel import LiveChannelRegistry
+from single_flight import SingleFlight, canonical_key, default_store_dir
 
-app = Flask(__name__)
+bp = Blueprint('structural', __name__)
 
 # --- Helper to prepare results for JSON (handle NaN/Inf) ---
 def make_results_json_safe(data_to_clean):
@@ -28,9 +25,8 @@ def make_results_json_safe(data_to_clean):
         return {k: make_results_json_safe(v) for k, v in data_to_clean.items()}
     elif isinstance(data_to_clean, list):
         return [make_results_json_safe(i) for i in data_to_clean]
-    # Updated line to be compatible with NumPy 2.0+
-    elif isinstance(data_to_clean, np.floating): # Use np.floating to catch all NumPy float types
-        data_to_clean = float(data_to_clean)
+    elif hasattr(data_to_clean, 'tolist'): # NumPy arrays and scalars, without importing NumPy here
+        return make_results_json_safe(data_to_clean.tolist())
     
     if isinstance(data_to_clean, float):
         if math.isnan(data_to_clean):
@@ -41,93 +37,323 @@ def make_results_json_safe(data_to_clean):
 
 
 # --- Routes ---
-@app.route('/')
+@bp.route('/')
 def index():
-    material_names = list(MATERIALS_LIB.keys())
+    material_names = list(core.MATERIALS_LIB.keys())
     return render_template('index.html', material_names=material_names)
 
-@app.route('/calculate', methods=['POST'])
-def calculate():
-    try:
-        data = request.get_json()
-        app.logger.info(f"Received data for calculation: {data}")
+class AnalysisRequestError(ValueError):
+    """Unsupported combination in the request payload (reported verbatim as a 400)."""
+
+
+def run_analysis(data):
+    """
+    Builds the element described by a /calculate payload, runs the matching solver
+    and returns the JSON-safe response body.
+    """
+    element_type = data.get('elementType')
+    length_m = float(data.get('length'))
+    material_name = data.get('material')
+    
+    section_type = data.get('sectionType')
+    section_params_str = data.get('sectionParams', []) 
+    section_params_mm = [float(p) for p in section_params_str]
 
-        element_type = data.get('elementType')
-        length_m = float(data.get('length'))
-        material_name = data.get('material')
+    results = {}
+    element_info = {}
+    
+    if element_type == 'beam':
+        beam_support_type = data.get('beamSupportType')
+        load_type = data.get('beamLoadType')
         
-        section_type = data.get('sectionType')
-        section_params_str = data.get('sectionParams', []) 
-        section_params_mm = [float(p) for p in section_params_str]
+        beam = core.Beam(length_m, material_name, section_type, section_params_mm, beam_support_type)
 
-        results = {}
-        element_info = {}
+        # Load-only changes are served from cached unit-load responses (see core/response_cache.py)
+        load_pos_a_m = None
+        if beam_support_type == "simplySupported":
+            if load_type == "pointLoad":
+                load_p_kn = float(data.get('pointLoad'))
+                load_pos_a_m_ratio = float(data.get('pointLoadPositionRatio', 0.5))
+                load_pos_a_m = length_m * load_pos_a_m_ratio
+                load_N = load_p_kn * 1000
+            elif load_type == "udl":
+                udl_w_kn_per_m = float(data.get('udlValue'))
+                load_N = udl_w_kn_per_m * 1000
+            else:
+                raise AnalysisRequestError(f"Load type '{load_type}' not implemented for Simply Supported beams")
         
-        if element_type == 'beam':
-            beam_support_type = data.get('beamSupportType')
-            load_type = data.get('beamLoadType')
-            
-            beam = Beam(length_m, material_name, section_type, section_params_mm, beam_support_type)
-
-            if beam_support_type == "simplySupported":
-                if load_type == "pointLoad":
-                    load_p_kn = float(data.get('pointLoad'))
-                    load_pos_a_m_ratio = float(data.get('pointLoadPositionRatio', 0.5))
-                    load_pos_a_m = length_m * load_pos_a_m_ratio
-                    analysis_results = solve_simply_supported_beam_point_load(beam, load_p_kn * 1000, load_pos_a_m)
-                elif load_type == "udl":
-                    udl_w_kn_per_m = float(data.get('udlValue'))
-                    analysis_results = solve_simply_supported_beam_udl(beam, udl_w_kn_per_m * 1000)
-                else:
-                    return jsonify({"error": f"Load type '{load_type}' not implemented for Simply Supported beams"}), 400
-            
-            elif beam_support_type == "cantilever":
-                if load_type == "pointLoadEnd":
-                    load_p_kn = float(data.get('pointLoad'))
-                    analysis_results = solve_cantilever_beam_point_load_end(beam, load_p_kn * 1000)
-                elif load_type == "udl":
-                    udl_w_kn_per_m = float(data.get('udlValue'))
-                    analysis_results = solve_cantilever_beam_udl(beam, udl_w_kn_per_m * 1000)
-                else:
-                    return jsonify({"error": f"Load type '{load_type}' not implemented for Cantilever beams"}), 400
+        elif beam_support_type == "cantilever":
+            if load_type == "pointLoadEnd":
+                load_p_kn = float(data.get('pointLoad'))
+                load_N = load_p_kn * 1000
+            elif load_type == "udl":
+                udl_w_kn_per_m = float(data.get('udlValue'))
+                load_N = udl_w_kn_per_m * 1000
             else:
-                return jsonify({"error": f"Beam support type '{beam_support_type}' not implemented"}), 400
-            
-            results = analysis_results
-            element_info = beam.get_element_info()
-
-        elif element_type == 'column':
-            eff_length_factor_Kx = float(data.get('effLengthFactorKx', 1.0))
-            eff_length_factor_Ky = float(data.get('effLengthFactorKy', 1.0))
-            axial_load_kn = float(data.get('axialLoad'))
-
-            column = Column(length_m, material_name, section_type, section_params_mm, eff_length_factor_Kx, eff_length_factor_Ky)
-            analysis_results = solve_column_axial_buckling(column, axial_load_kn * 1000)
-            results = analysis_results
-            element_info = column.get_element_info()
-            
+                raise AnalysisRequestError(f"Load type '{load_type}' not implemented for Cantilever beams")
         else:
-            return jsonify({"error": "Unknown element type"}), 400
+            raise AnalysisRequestError(f"Beam support type '{beam_support_type}' not implemented")
 
-        safe_results = make_results_json_safe(results)
-        safe_element_info = make_results_json_safe(element_info)
+        analysis_results = core.unit_load_cache.solve(beam, load_type, load_N, load_pos_a_m)
         
-        return jsonify({
-            "success": True,
-            "element_info": safe_element_info,
-            "results": safe_results
-        })
+        results = analysis_results
+        max_plot_points = data.get('maxPlotPoints')
+        if max_plot_points:
+            # Stress field (below) still uses the full-resolution diagrams
+            results = dict(results)
+            for key, value_key in (("sfd_points", "v"), ("bmd_points", "m"), ("deflection_points", "d")):
+                results[key] = core.downsample_diagram_points(analysis_results[key], value_key, int(max_plot_points))
+        if data.get('includeStressField'):
+            results["stress_field"] = core.compute_beam_stress_field(
+                beam, analysis_results,
+                nx=data.get('stressFieldNx'),
+                ny=int(data.get('stressFieldNy', 41)),
+            )
+        if data.get('includeSensitivities'):
+            results = dict(results)
+            results["sensitivities"] = core.beam_element_sensitivities(beam, load_type, load_N, load_pos_a_m)
+        if data.get('includeModal'):
+            results = dict(results)
+            results["modal"] = core.beam_modal_analysis(beam, n_modes=int(data.get('modalModes', 3)))
+        element_info = beam.get_element_info()
+
+    elif element_type == 'column':
+        eff_length_factor_Kx = float(data.get('effLengthFactorKx', 1.0))
+        eff_length_factor_Ky = float(data.get('effLengthFactorKy', 1.0))
+        axial_load_kn = float(data.get('axialLoad'))
+
+        column = core.Column(length_m, material_name, section_type, section_params_mm, eff_length_factor_Kx, eff_length_factor_Ky)
+        analysis_results = core.solve_column_axial_buckling(column, axial_load_kn * 1000)
+        results = analysis_results
+        if data.get('includeSensitivities'):
+            results = dict(results)
+            results["sensitivities"] = core.column_element_sensitivities(column, axial_load_kn * 1000)
+        element_info = column.get_element_info()
+
+    elif element_type == 'beamColumn':
+        # Beam fields plus axialLoad (kN, compression positive) and effective length factors
+        load_type = data.get('beamLoadType')
+        beam = core.Beam(length_m, material_name, section_type, section_params_mm, data.get('beamSupportType'))
+        load_N = float(data.get('udlValue' if load_type == 'udl' else 'pointLoad')) * 1000
+        load_pos_a_m = length_m * float(data.get('pointLoadPositionRatio', 0.5)) if load_type == 'pointLoad' else None
+        eff_length_factor_Kx = data.get('effLengthFactorKx')
+        results = core.solve_beam_column(
+            beam, load_type, load_N, float(data.get('axialLoad')) * 1000, load_pos_a_m,
+            Kx=float(eff_length_factor_Kx) if eff_length_factor_Kx is not None else None,
+            Ky=float(data.get('effLengthFactorKy', 1.0)),
+            method=data.get('secondOrderMethod', 'iterative'),
+        )
+        max_plot_points = data.get('maxPlotPoints')
+        if max_plot_points:
+            results = dict(results)
+            for key, value_key in (("sfd_points", "v"), ("bmd_points", "m"), ("deflection_points", "d")):
+                results[key] = core.downsample_diagram_points(results[key], value_key, int(max_plot_points))
+        element_info = beam.get_element_info()
+
+    else:
+        raise AnalysisRequestError("Unknown element type")
 
+    return {
+        "success": True,
+        "element_info": make_results_json_safe(element_info),
+        "results": make_results_json_safe(results)
+    }
+
+
+# Concurrent identical /calculate requests (across threads and, via a local
+# lock directory, across worker processes) share one computation.
+single_flight = SingleFlight(default_store_dir())
+
+@bp.route('/calculate', methods=['POST'])
+def calculate():
+    try:
+        data = request.get_json()
+        current_app.logger.info(f"Received data for calculation: {data}")
+        body = single_flight.do(canonical_key(data), lambda: json.dumps(run_analysis(data)))
+        return Response(body, mimetype='application/json')
+
+    except AnalysisRequestError as are:
+        return jsonify({"error": str(are)}), 400
     except ValueError as ve:
-        app.logger.error(f"ValueError in calculation: {ve}\n{traceback.format_exc()}")
+        current_app.logger.error(f"ValueError in calculation: {ve}\n{traceback.format_exc()}")
         return jsonify({"error": f"Invalid input: {str(ve)}"}), 400
     except KeyError as ke:
-        app.logger.error(f"Missing key in input data: {ke}\n{traceback.format_exc()}")
+        current_app.logger.error(f"Missing key in input data: {ke}\n{traceback.format_exc()}")
         return jsonify({"error": f"Missing expected input data: {str(ke)}"}), 400
     except Exception as e:
-        app.logger.error(f"Error during calculation: {e}\n{traceback.format_exc()}")
+        current_app.logger.error(f"Error during calculation: {e}\n{traceback.format_exc()}")
         return jsonify({"error": "An unexpected error occurred on the server. Please check logs."}), 500
 
+@bp.route('/metrics/single-flight')
+def single_flight_metrics():
+    return jsonify(single_flight.get_stats())
+
+@bp.route('/metrics/unit-load-cache')
+def unit_load_cache_metrics():
+    return jsonify(core.unit_load_cache.get_stats())
+
+
+# --- Probabilistic (Monte Carlo) analysis ---
+RELIABILITY_MAX_SAMPLES = 2_000_000
+
+@bp.route('/reliability', methods=['POST'])
+def reliability():
+    """
+    Probability of failure per check. Body: a /calculate payload plus
+    "variables" (name -> distribution, see core/reliability.py), "samples",
+    "seed" and optional "importanceShift" ("auto" or name -> shift).
+    """
+    try:
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            raise ValueError("expected a JSON object")
+        n_samples = min(RELIABILITY_MAX_SAMPLES, max(1, int(data.get("samples", 100_000))))
+        result = core.run_monte_carlo(
+            data, data.get("variables", {}), n_samples=n_samples, seed=data.get("seed"),
+            importance_shift=data.get("importanceShift"))
+        return jsonify(make_results_json_safe({"success": True, **result}))
+    except (ValueError, KeyError, TypeError) as e:
+        return jsonify({"error": f"Invalid input: {e}"}), 400
+
+
+# --- Paged access to columnar result stores (written by cli.py -o <name>.store) ---
+RESULT_STORE_DIR = os.environ.get("RESULT_STORE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "result_stores"))
+RESULTS_PAGE_SIZE_MAX = 1000
+
+@bp.route('/results')
+def list_result_stores():
+    names = []
+    if os.path.isdir(RESULT_STORE_DIR):
+        names = sorted(n for n in os.listdir(RESULT_STORE_DIR) if os.path.exists(os.path.join(RESULT_STORE_DIR, n, "meta.json")))
+    return jsonify({"stores": names})
+
+@bp.route('/results/<name>')
+def query_result_store(name):
+    """
+    One page of a result store, optionally filtered:
+    /results/<name>?where=bending_yield.ratio > 0.9&columns=id,bending_yield.ratio&page=1&page_size=100
+    """
+    from result_store import ResultStore
+    path = os.path.join(RESULT_STORE_DIR, name)
+    if not re.fullmatch(r"[\w.-]+", name) or not os.path.exists(os.path.join(path, "meta.json")):
+        return jsonify({"error": f"Unknown result store '{name}'"}), 404
+    try:
+        page = max(1, int(request.args.get('page', 1)))
+        page_size = min(RESULTS_PAGE_SIZE_MAX, max(1, int(request.args.get('page_size', 100))))
+        columns = [c for c in request.args.get('columns', '').split(',') if c] or None
+        store = ResultStore(path)
+        found = store.query(request.args.get('where'), columns=columns, offset=(page - 1) * page_size, limit=page_size)
+    except (ValueError, KeyError) as e:
+        return jsonify({"error": f"Invalid query: {e}"}), 400
+
+    names = list(found["rows"])
+    columns_data = [found["rows"][n].tolist() for n in names]
+    rows = [dict(zip(names, values), row_index=int(i)) for i, values in zip(found["row_index"], zip(*columns_data))]
+    return jsonify(make_results_json_safe({
+        "total_rows": len(store), "matched": found["matched"],
+        "page": page, "page_size": page_size, "rows": rows,
+    }))
+
+
+# --- Live (slider-driven) analysis: SSE stream + POST updates ---
+LIVE_HEARTBEAT_S = 15
+
+LIVE_CLIENT_COOKIE = 'live_client'
+
+def live_analysis(payload):
+    """run_analysis for the live stream, with input errors mapped like /calculate."""
+    try:
+        return run_analysis(payload)
+    except AnalysisRequestError as are:
+        return {"error": str(are)}
+    except ValueError as ve:
+        current_app.logger.error(f"ValueError in live analysis: {ve}")
+        return {"error": f"Invalid input: {str(ve)}"}
+    except KeyError as ke:
+        current_app.logger.error(f"Missing key in live input data: {ke}")
+        return {"error": f"Missing expected input data: {str(ke)}"}
+
+live_channels = LiveChannelRegistry(live_analysis)
+
+@bp.route('/live/stream')
+def live_stream():
+    """
+    Server-Sent Events stream for one dashboard session. Updates are posted to
+    /live/update; only the newest result is pushed ("delta=1" sends unchanged
+    diagram x coordinates only once).
+
+    Session ids are issued by the server. "?session=" reattaches only to a
+    session opened by the same client (the live_client cookie); otherwise a
+    new session is started.
+    """
+    client_id = request.cookies.get(LIVE_CLIENT_COOKIE) or secrets.token_urlsafe(32)
+    session_id = request.args.get('session')
+    delta = request.args.get('delta') == '1'
+
+    def event_stream():
+        channel = live_channels.attach(session_id, client_id) # Here, so an unstarted stream holds nothing
+        try:
+            yield f"event: session\ndata: {json.dumps({'session': channel.session_id})}\n\n"
+            while True:
+                message = channel.next_message(LIVE_HEARTBEAT_S, delta=delta)
+                if message is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: result\ndata: {json.dumps(message)}\n\n"
+        finally: # Client disconnected
+            live_channels.detach(channel)
+
+    response = Response(stream_with_context(event_stream()), mimetype='text/event-stream',
+                        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+    if request.cookies.get(LIVE_CLIENT_COOKIE) != client_id:
+        response.set_cookie(LIVE_CLIENT_COOKIE, client_id, httponly=True, samesite='Strict', secure=request.is_secure)
+    return response
+
+@bp.route('/live/update', methods=['POST'])
+def live_update():
+    data = request.get_json(silent=True) or {}
+    if not isinstance(data, dict) or not isinstance(data.get('session'), str) or not data['session']:
+        return jsonify({"error": "Invalid input: expected a JSON object with 'session', 'seq' and 'payload'"}), 400
+    try:
+        seq = int(data.get('seq', 0))
+    except (TypeError, ValueError):
+        return jsonify({"error": "Invalid input: 'seq' must be an integer"}), 400
+    channel = live_channels.get(data['session'], request.cookies.get(LIVE_CLIENT_COOKIE))
+    if channel is None: # Also for another client's session, so ids cannot be probed
+        return jsonify({"error": "Unknown or expired live session"}), 404
+    accepted = channel.submit(seq, data.get('payload', {}))
+    return jsonify({"accepted": accepted}), 202
+
+
+# --- App factory ---
+PREWARM_PAYLOADS = (
+    {"elementType": "beam", "length": 5, "material": "steel_generic_s275", "sectionType": "rectangular",
+     "sectionParams": [100, 200], "beamSupportType": "simplySupported", "beamLoadType": "pointLoad",
+     "pointLoad": 10, "pointLoadPositionRatio": 0.5, "maxPlotPoints": 100, "includeStressField": True},
+    {"elementType": "column", "length": 3, "material": "steel_generic_s275", "sectionType": "circular",
+     "sectionParams": [100], "axialLoad": 100},
+)
+
+def prewarm():
+    """Imports all solver modules and runs one small analysis of each kind."""
+    core.preload()
+    for payload in PREWARM_PAYLOADS:
+        run_analysis(payload)
+
+def create_app(prewarm_core=False):
+    """
+    Builds the Flask app. With prewarm_core=True the solvers are imported and
+    exercised immediately, so a pre-forking server (gunicorn --preload) pays the
+    start-up cost once in the master and workers fork warm.
+    """
+    flask_app = Flask(__name__)
+    flask_app.register_blueprint(bp)
+    if prewarm_core:
+        prewarm()
+    return flask_app
+
+app = create_app()
+
 
 if __name__ == '__main__':
     app.run(debug=True)
\ No newline at end of file
@@ -0,0 +1,131 @@
+# benchmarks/nonprismatic_accuracy.py
+"""
+Accuracy and speed of the non-prismatic (M / EI integration) beam solver.
+
+Prismatic members are solved both ways: the numerical deflection is compared
+node by node with the closed-form solver (same stations), and the governing
+moment, stress and deflection with the closed-form extremes. Convergence with
+the number of stations is shown for a tapered cantilever against a very fine
+reference, and solve times are reported (section cache cold / warm, closed
+form, and the batched curvature integration per case). Exits non-zero if a
+prismatic error exceeds the tolerance, so it can gate CI.
+
+    python benchmarks/nonprismatic_accuracy.py
+    python benchmarks/nonprismatic_accuracy.py --points 401 --tol 1e-4 --repeat 200
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import core  # noqa: E402
+from core.nonprismatic import clear_section_profile_cache, member_grid, shear_moment_along  # noqa: E402
+
+LENGTH_M = 5.0
+MATERIAL = "steel_generic_s275"
+PRISMATIC_CASES = [
+    # (support_type, load_type, section_type, section_params_mm, load, load_pos_a_m)
+    ("simplySupported", "pointLoad", "rectangular", [100, 250], 25e3, 1.5),
+    ("simplySupported", "udl", "rectangular", [100, 250], 8e3, None),
+    ("cantilever", "pointLoadEnd", "circular", [180], 5e3, None),
+    ("cantilever", "udl", "rectangular", [120, 300], 3e3, None),
+]
+
+
+def rel(a, b):
+    return abs(a - b) / abs(b) if b else abs(a)
+
+
+def prismatic_accuracy(n_points, tol):
+    print(f"Prismatic cases vs closed form ({n_points} stations)")
+    print(f"{'case':<30} {'nodal w':>10} {'max w':>10} {'max M':>10} {'sigma':>10}")
+    failed = False
+    for support_type, load_type, section_type, params, load, a in PRISMATIC_CASES:
+        beam = core.Beam(LENGTH_M, MATERIAL, section_type, params, support_type)
+        closed = core.compute_beam_results(beam, load_type, load, a)
+        stations = core.tapered_stations(LENGTH_M, params, params)
+        numeric = core.solve_nonprismatic_beam(support_type, load_type, LENGTH_M, MATERIAL, section_type,
+                                               stations, load, a, n_points=n_points)
+
+        closed_w = {round(p["x"], 12): p["d"] for p in closed["deflection_points"]}
+        w_scale = max(abs(closed["max_deflection_m"]), abs(closed["min_deflection_m"]))
+        nodal = max(abs(p["d"] - closed_w[round(p["x"], 12)]) for p in numeric["deflection_points"]
+                    if round(p["x"], 12) in closed_w) / w_scale
+        errors = [
+            nodal,
+            rel(numeric["failure_checks"]["deflection_limit"]["demand_m"], closed["failure_checks"]["deflection_limit"]["demand_m"]),
+            rel(max(abs(numeric["max_moment_Nm"]), abs(numeric["min_moment_Nm"])),
+                max(abs(closed["max_moment_Nm"]), abs(closed["min_moment_Nm"]))),
+            rel(numeric["failure_checks"]["bending_yield"]["demand_Pa"], closed["failure_checks"]["bending_yield"]["demand_Pa"]),
+        ]
+        failed |= max(errors) > tol
+        print(f"{support_type + '/' + load_type:<30} " + " ".join(f"{e:>10.2e}" for e in errors))
+    return failed
+
+
+def tapered_convergence(point_counts):
+    stations = core.tapered_stations(LENGTH_M, [100, 400], [100, 150])
+    solve = lambda n: core.solve_nonprismatic_beam("cantilever", "udl", LENGTH_M, MATERIAL, "rectangular",
+                                                   stations, 5e3, n_points=n)["max_deflection_m"]
+    reference = solve(20001)
+    print(f"\nTapered cantilever (h 400 -> 150 mm, UDL): tip deflection {reference * 1000:.4f} mm")
+    print(f"{'stations':>8} {'rel. error':>11}")
+    for n in point_counts:
+        print(f"{n:>8} {rel(solve(n), reference):>11.2e}")
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def timings(n_points, repeat, n_cases):
+    support_type, load_type, section_type, params, load, a = PRISMATIC_CASES[0]
+    stations = core.haunched_stations(LENGTH_M, 1.0, [100, 400], [100, 250])
+    beam = core.Beam(LENGTH_M, MATERIAL, section_type, params, support_type)
+    solve = lambda: core.solve_nonprismatic_beam(support_type, load_type, LENGTH_M, MATERIAL, section_type,
+                                                 stations, load, a, n_points=n_points)
+
+    def cold():
+        clear_section_profile_cache()
+        solve()
+
+    print(f"\nTimings ({n_points} stations, simply supported point load)")
+    print(f"  non-prismatic, cold section cache  {timed(cold, repeat):>9.1f} us/solve")
+    print(f"  non-prismatic, warm section cache  {timed(solve, repeat):>9.1f} us/solve")
+    print(f"  closed form (compute_beam_results) {timed(lambda: core.compute_beam_results(beam, load_type, load, a), repeat):>9.1f} us/solve")
+
+    # Batched integration: many load magnitudes on one haunched member
+    x, right = member_grid(LENGTH_M, n_points, [sx for sx, _ in stations[1:-1]] + [a])
+    EI = core.get_material(MATERIAL).E_Pa * core.section_properties_along(section_type, stations, x, right)["Ix_m4"]
+    _, M = shear_moment_along(support_type, load_type, LENGTH_M, 1.0, x, right, a)
+    kappa = -np.linspace(1e3, 5e4, n_cases)[:, None] * M / EI
+    cantilever = np.zeros(n_cases, dtype=bool)
+    us = timed(lambda: core.deflection_from_curvature(x, kappa, cantilever), max(1, repeat // 10))
+    print(f"  batched curvature integration      {us / n_cases:>9.2f} us/case ({n_cases} cases)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--points", type=int, default=201, help="Evenly spaced stations per member")
+    parser.add_argument("--tol", type=float, default=1e-3, help="Max relative error for prismatic cases")
+    parser.add_argument("--repeat", type=int, default=100)
+    parser.add_argument("--cases", type=int, default=10000, help="Cases for the batched integration timing")
+    args = parser.parse_args(argv)
+
+    failed = prismatic_accuracy(args.points, args.tol)
+    tapered_convergence([51, 101, 201, 401, 801])
+    timings(args.points, args.repeat, args.cases)
+    print("\nFAILED: prismatic error above tolerance" if failed else "\nOK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+# benchmarks/startup_time.py
+"""
+Cold-start budget check using `python -X importtime`.
+
+Runs a fresh interpreter several times per target module, takes the median
+cumulative import time reported for the module, and compares it against a
+budget. Exits non-zero if any budget is exceeded, so it can gate CI.
+
+    python benchmarks/startup_time.py
+    python benchmarks/startup_time.py --runs 9 --budget core=25 --budget app=400
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative import time budgets in milliseconds.
+DEFAULT_BUDGETS_MS = {
+    "core": 25,                 # Lazy package: no solver or NumPy import
+    "core.elements": 40,        # Building an element needs no NumPy either
+    "app": 400,                 # Dominated by Flask itself
+}
+
+
+def measure_import_ms(module, runs):
+    samples = []
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        )
+        for line in proc.stderr.splitlines():
+            # "import time:  self [us] | cumulative | imported package";
+            # nested imports are indented, the top-level one is not
+            parts = line.split("|")
+            if len(parts) == 3 and parts[2].strip() == module and not parts[2][1:].startswith(" "):
+                samples.append(int(parts[1]) / 1000.0)
+    return statistics.median(samples) if samples else float("nan")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", action="append", default=[], metavar="MODULE=MS",
+                        help="Override or add a budget, e.g. core=25")
+    args = parser.parse_args(argv)
+
+    budgets = dict(DEFAULT_BUDGETS_MS)
+    for item in args.budget:
+        module, ms = item.split("=", 1)
+        budgets[module] = float(ms)
+
+    failed = False
+    for module, budget_ms in budgets.items():
+        measured_ms = measure_import_ms(module, args.runs)
+        ok = measured_ms <= budget_ms
+        failed |= not ok
+        print(f"{module:<16} {measured_ms:8.1f} ms  (budget {budget_ms:.0f} ms)  {'OK' if ok else 'OVER BUDGET'}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,179 @@
+# benchmarks/threaded_solvers.py
+"""
+Threaded load test for the reentrant solver API.
+
+Worker threads solve the same shared, frozen specs (and the same shared Beam /
+Column objects through the classic solve_* functions) concurrently; every
+result is compared with a single-threaded reference, and throughput is
+reported per thread count. With --wsgi the Flask app is also served by a
+threaded WSGI server and hammered with concurrent /calculate requests.
+Exits non-zero on any mismatch, so it can gate CI.
+
+On a GIL build the solve throughput stays roughly flat with threads (the
+check is correctness); on free-threaded CPython (python3.13t) it should scale.
+
+    python benchmarks/threaded_solvers.py
+    python benchmarks/threaded_solvers.py --threads 1 2 4 8 16 --rounds 50 --wsgi
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import urllib.request
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import core  # noqa: E402
+
+BEAM_CASES = [
+    # (support_type, load_type, load_N, load_pos_ratio)
+    ("simplySupported", "pointLoad", 25e3, 0.3),
+    ("simplySupported", "pointLoad", -10e3, 0.7),
+    ("simplySupported", "udl", 8e3, None),
+    ("cantilever", "pointLoadEnd", 5e3, None),
+    ("cantilever", "udl", 3e3, None),
+]
+COLUMN_LOADS_N = (50e3, 250e3, 900e3)
+
+WSGI_PAYLOADS = [
+    {"elementType": "beam", "length": 6, "material": "steel_generic_s355", "sectionType": "rectangular",
+     "sectionParams": [120, 300], "beamSupportType": "simplySupported", "beamLoadType": "pointLoad",
+     "pointLoad": 40, "pointLoadPositionRatio": 0.4},
+    {"elementType": "beam", "length": 3, "material": "aluminum_6061_t6", "sectionType": "circular",
+     "sectionParams": [150], "beamSupportType": "cantilever", "beamLoadType": "udl", "udlValue": 4},
+    {"elementType": "column", "length": 4, "material": "steel_generic_s275", "sectionType": "rectangular",
+     "sectionParams": [200, 200], "axialLoad": 500, "effLengthFactorKx": 1.0, "effLengthFactorKy": 0.7},
+]
+
+
+def build_jobs():
+    """Shared inputs: (label, solve) pairs where solve() returns plain results."""
+    jobs = []
+    beams = {} # One Beam object per support type, solved for several loads at once
+    for support_type, load_type, load_N, ratio in BEAM_CASES:
+        spec = core.BeamSpec.from_inputs(5.0, "steel_generic_s275", "rectangular", [100, 250], support_type)
+        beam = beams.setdefault(support_type, core.Beam(5.0, "steel_generic_s275", "rectangular", [100, 250], support_type))
+        a = None if ratio is None else ratio * spec.length_m
+        jobs.append((f"spec {support_type}/{load_type}",
+                     lambda s=spec, lt=load_type, w=load_N, a=a: core.thaw_results(core.solve_beam_spec(s, lt, w, a))))
+        jobs.append((f"element {support_type}/{load_type}",
+                     lambda b=beam, lt=load_type, w=load_N, a=a: core.solve_beam(b, lt, w, a)))
+    spec = core.ColumnSpec.from_inputs(3.5, "steel_generic_s355", "circular", [180], 1.0, 0.8)
+    column = core.Column(3.5, "steel_generic_s355", "circular", [180], 1.0, 0.8)
+    for P in COLUMN_LOADS_N:
+        jobs.append((f"spec column/{P:.0f}", lambda s=spec, P=P: core.thaw_results(core.solve_column_spec(s, P))))
+        jobs.append((f"element column/{P:.0f}", lambda c=column, P=P: core.solve_column_axial_buckling(c, P)))
+    return jobs
+
+
+def normalize(results):
+    """JSON round trip: NumPy scalars -> floats, tuples -> lists."""
+    return json.loads(json.dumps(results, default=float))
+
+
+def run_threads(n_threads, work):
+    """Runs work(thread_index) on n_threads threads started together; returns (wall seconds, outputs)."""
+    barrier = threading.Barrier(n_threads + 1)
+    outputs = [None] * n_threads
+
+    def target(i):
+        barrier.wait()
+        outputs[i] = work(i)
+
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(n_threads)]
+    for t in threads:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - start, outputs
+
+
+def solver_load_test(thread_counts, rounds):
+    jobs = build_jobs()
+    reference = [normalize(solve()) for _, solve in jobs]
+
+    def work(_):
+        mismatches = []
+        for _ in range(rounds):
+            for (label, solve), expected in zip(jobs, reference):
+                if normalize(solve()) != expected:
+                    mismatches.append(label)
+        return mismatches
+
+    failed = False
+    base_rate = None
+    print(f"{'threads':>7} {'solves/s':>12} {'speedup':>8}  mismatches")
+    for n in thread_counts:
+        seconds, outputs = run_threads(n, work)
+        mismatches = [label for out in outputs for label in out]
+        rate = n * rounds * len(jobs) / seconds
+        base_rate = base_rate or rate
+        failed |= bool(mismatches)
+        print(f"{n:>7} {rate:>12.0f} {rate / base_rate:>7.2f}x  {len(mismatches)}"
+              + (f" ({', '.join(sorted(set(mismatches)))})" if mismatches else ""))
+    return failed
+
+
+def wsgi_load_test(thread_counts, rounds):
+    from werkzeug.serving import make_server
+    from app import create_app
+
+    logging.getLogger("werkzeug").setLevel(logging.ERROR) # No per-request access log
+    app = create_app()
+    app.logger.setLevel(logging.WARNING)
+    client = app.test_client()
+    reference = [normalize(client.post("/calculate", json=p).get_json()) for p in WSGI_PAYLOADS]
+
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/calculate"
+
+    def post(payload):
+        request = urllib.request.Request(url, data=json.dumps(payload).encode(),
+                                         headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request) as response:
+            return normalize(json.loads(response.read()))
+
+    def work(i):
+        mismatches = 0
+        for r in range(rounds):
+            k = (i + r) % len(WSGI_PAYLOADS) # Interleave payloads across threads
+            mismatches += post(WSGI_PAYLOADS[k]) != reference[k]
+        return mismatches
+
+    failed = False
+    print(f"\nWSGI (werkzeug, threaded)\n{'threads':>7} {'requests/s':>12}  mismatches")
+    try:
+        for n in thread_counts:
+            seconds, outputs = run_threads(n, work)
+            failed |= sum(outputs) > 0
+            print(f"{n:>7} {n * rounds / seconds:>12.0f}  {sum(outputs)}")
+    finally:
+        server.shutdown()
+    return failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--rounds", type=int, default=20, help="Passes over all cases per thread")
+    parser.add_argument("--wsgi", action="store_true", help="Also load-test /calculate behind a threaded WSGI server")
+    args = parser.parse_args(argv)
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled (free-threaded)'}\n")
+    failed = solver_load_test(args.threads, args.rounds)
+    if args.wsgi:
+        failed |= wsgi_load_test(args.threads, args.rounds)
+    print("\nFAILED: results differ from the single-threaded reference" if failed else "\nOK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,440 @@
+# cli.py
+"""
+Headless bulk analysis of beam/column case files.
+
+Reads cases from CSV or Parquet in chunks, solves each chunk with the vectorized
+kernels in core.batch_solvers, and streams the results (governing values and
+flattened failure checks) to CSV, NDJSON, a Parquet dataset ("<name>.parquet"
+directory, one part file per chunk) or a columnar result store
+(result_store.py, "<name>.store" directory). Memory use is bounded by
+the chunk size, whatever the file size.
+
+Case columns use the same names and units as the /calculate payload:
+    elementType (beam|column), length [m], material, sectionType,
+    sectionParams [mm, ';'-separated], beamSupportType, beamLoadType,
+    pointLoad [kN], pointLoadPositionRatio, udlValue [kN/m],
+    axialLoad [kN], effLengthFactorKx, effLengthFactorKy
+An optional "id" column is copied to the output.
+
+    python cli.py cases.csv -o results.parquet --chunk-size 50000
+    python cli.py cases.parquet -o results.ndjson --resume
+"""
+import argparse
+import csv
+import itertools
+import json
+import math
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+BEAM_RESULT_FIELDS = (
+    "max_abs_shear_N", "max_abs_moment_Nm", "max_abs_deflection_m",
+    "max_abs_bending_stress_Pa", "max_shear_stress_Pa",
+    "bending_yield.ratio", "bending_yield.status",
+    "shear_yield.ratio", "shear_yield.status",
+    "deflection_limit.ratio", "deflection_limit.status",
+)
+COLUMN_RESULT_FIELDS = (
+    "axial_stress_Pa", "min_critical_buckling_load_N",
+    "yielding_crushing.ratio", "yielding_crushing.status",
+    "euler_buckling.ratio", "euler_buckling.status",
+)
+OUTPUT_FIELDS = ("case_index", "id", "elementType") + BEAM_RESULT_FIELDS + COLUMN_RESULT_FIELDS + ("error",)
+
+
+# --- Case parsing ---
+def _float(row, key, default=None):
+    value = row.get(key)
+    if value is None or value == "":
+        if default is None:
+            raise ValueError(f"Missing value for '{key}'")
+        return float(default)
+    return float(value)
+
+
+def _section_params(value):
+    if isinstance(value, (list, tuple)):
+        return [float(v) for v in value]
+    return [float(v) for v in str(value).replace(",", ";").replace(" ", ";").split(";") if v != ""]
+
+
+def _section_arrays(section_types, section_params):
+    """Section property arrays for a group of rows (vectorized for standard shapes)."""
+    import numpy as np
+    from core.batch_solvers import rectangular_section_arrays, circular_section_arrays, section_arrays_from_objects
+    from core.cross_sections import create_cross_section
+
+    n = len(section_types)
+    keys = ("area_m2", "Ix_m4", "Iy_m4", "Zx_top_m3", "Zx_bottom_m3", "tau_per_V")
+    out = {k: np.zeros(n) for k in keys}
+    types = np.asarray(section_types)
+    for section_type in set(section_types):
+        idx = np.flatnonzero(types == section_type)
+        params = [section_params[i] for i in idx]
+        if section_type == "rectangular":
+            props = rectangular_section_arrays([p[0] for p in params], [p[1] for p in params])
+        elif section_type == "circular":
+            props = circular_section_arrays([p[0] for p in params])
+        else:
+            props = section_arrays_from_objects([create_cross_section(section_type, p) for p in params])
+        for k in keys:
+            out[k][idx] = props[k]
+    return out
+
+
+# Parameter count of the vectorized section types (others are checked by building them)
+SECTION_PARAM_COUNTS = {"rectangular": 2, "circular": 1}
+
+
+def _check_section(section_type, params):
+    """Raises ValueError for a section row that cannot be built."""
+    from core.cross_sections import create_cross_section
+
+    expected = SECTION_PARAM_COUNTS.get(section_type)
+    if expected is None:
+        create_cross_section(section_type, params) # Unknown type / bad polygon raise here
+    elif len(params) < expected:
+        raise ValueError(f"Section type '{section_type}' needs {expected} parameter(s), got {len(params)}")
+
+
+def solve_chunk(rows, start_index):
+    """Solves one chunk of case rows and returns a list of output dicts (same order)."""
+    import numpy as np
+    from core.materials import get_material
+    from core.batch_solvers import solve_beam_cases, solve_column_cases
+
+    outputs = [{"case_index": start_index + i, "id": row.get("id"), "elementType": row.get("elementType") or "beam"}
+               for i, row in enumerate(rows)]
+    parsed = {"beam": [], "column": []}
+    for i, row in enumerate(rows):
+        try:
+            element_type = outputs[i]["elementType"]
+            if element_type not in parsed:
+                raise ValueError(f"Unknown element type '{element_type}'")
+            material = get_material(row.get("material") or "steel_generic_s275")
+            case = {
+                "i": i, "L": _float(row, "length"), "E": material.E_Pa, "Fy": material.Fy_Pa, "Fsy": material.Fsy_Pa,
+                "section_type": row.get("sectionType"), "section_params": _section_params(row.get("sectionParams", "")),
+            }
+            _check_section(case["section_type"], case["section_params"])
+            if element_type == "beam":
+                case["support"] = row.get("beamSupportType")
+                case["load_type"] = row.get("beamLoadType")
+                if case["load_type"] == "udl":
+                    case["load"] = _float(row, "udlValue") * 1000
+                else:
+                    case["load"] = _float(row, "pointLoad") * 1000
+                ratio = _float(row, "pointLoadPositionRatio", 0.5)
+                if case["support"] == "simplySupported" and case["load_type"] == "pointLoad" and not 0 < ratio < 1:
+                    raise ValueError("Load position 'a' must be between 0 and L (exclusive).")
+                case["a"] = case["L"] * ratio
+            else:
+                case["P"] = _float(row, "axialLoad") * 1000
+                case["Kx"] = _float(row, "effLengthFactorKx", 1.0)
+                case["Ky"] = _float(row, "effLengthFactorKy", 1.0)
+            parsed[element_type].append(case)
+        except (ValueError, TypeError, IndexError) as e:
+            outputs[i]["error"] = str(e)
+
+    def collect(cases, key):
+        return np.array([c[key] for c in cases])
+
+    for element_type, cases in parsed.items():
+        if not cases:
+            continue
+        try:
+            section = _section_arrays([c["section_type"] for c in cases], [c["section_params"] for c in cases])
+        except (ValueError, IndexError, ZeroDivisionError):
+            # Rebuild row by row so only the bad rows get an error, then solve the rest
+            good = []
+            for c in cases:
+                try:
+                    _section_arrays([c["section_type"]], [c["section_params"]])
+                    good.append(c)
+                except (ValueError, IndexError, ZeroDivisionError) as e:
+                    outputs[c["i"]]["error"] = str(e)
+            cases = good
+            if not cases:
+                continue
+            section = _section_arrays([c["section_type"] for c in cases], [c["section_params"] for c in cases])
+        if element_type == "beam":
+            res = solve_beam_cases(collect(cases, "support"), collect(cases, "load_type"), collect(cases, "L"),
+                                   collect(cases, "E"), collect(cases, "Fy"), collect(cases, "Fsy"),
+                                   section, collect(cases, "load"), collect(cases, "a"))
+            fields = BEAM_RESULT_FIELDS
+        else:
+            res = solve_column_cases(collect(cases, "L"), collect(cases, "E"), collect(cases, "Fy"),
+                                     section["area_m2"], section["Ix_m4"], section["Iy_m4"],
+                                     collect(cases, "Kx"), collect(cases, "Ky"), collect(cases, "P"))
+            fields = COLUMN_RESULT_FIELDS
+        for j, c in enumerate(cases):
+            out = outputs[c["i"]]
+            for field in fields:
+                value = res[field][j]
+                out[field] = value.item() if hasattr(value, "item") else value
+            if element_type == "beam" and math.isnan(out["max_abs_moment_Nm"]):
+                out["error"] = f"Unsupported beam case '{c['support']}' / '{c['load_type']}'"
+    return outputs
+
+
+# --- Readers ---
+def iter_csv_chunks(path, chunk_size, skip_rows):
+    with open(path, newline="") as f:
+        reader = csv.DictReader(f)
+        rows = itertools.islice(reader, skip_rows, None)
+        while True:
+            chunk = list(itertools.islice(rows, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+
+def iter_parquet_chunks(path, chunk_size, skip_rows):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise SystemExit("Parquet input requires pyarrow (pip install pyarrow).")
+    pending = []
+    seen = 0
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+        if seen + batch.num_rows <= skip_rows:
+            seen += batch.num_rows
+            continue
+        rows = batch.to_pylist()
+        if seen < skip_rows:
+            rows = rows[skip_rows - seen:]
+        seen += batch.num_rows
+        pending.extend(rows)
+        while len(pending) >= chunk_size:
+            yield pending[:chunk_size]
+            pending = pending[chunk_size:]
+    if pending:
+        yield pending
+
+
+# --- Writers ---
+class CSVResultWriter:
+    def __init__(self, path, append):
+        self._file = open(path, "a" if append else "w", newline="")
+        self._writer = csv.DictWriter(self._file, fieldnames=OUTPUT_FIELDS, extrasaction="ignore")
+        if not append or self._file.tell() == 0:
+            self._writer.writeheader()
+
+    def write(self, rows):
+        self._writer.writerows(rows)
+
+    def flush(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return self._file.tell()
+
+    def close(self):
+        self._file.close()
+
+
+class NDJSONResultWriter:
+    def __init__(self, path, append):
+        self._file = open(path, "a" if append else "w")
+
+    def write(self, rows):
+        for row in rows:
+            clean = {k: (None if isinstance(v, float) and not math.isfinite(v) else v) for k, v in row.items()}
+            self._file.write(json.dumps(clean) + "\n")
+
+    def flush(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return self._file.tell()
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetResultWriter:
+    """
+    Writes a Parquet dataset: a directory with one closed part file per chunk
+    (pyarrow / pandas read the directory as one table). A part is complete the
+    moment the chunk is written, so every checkpoint covers only readable files.
+    """
+
+    def __init__(self, path, append):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SystemExit("Parquet output requires pyarrow (pip install pyarrow).")
+        self._pa, self._pq = pa, pq
+        string_fields = {"id", "elementType", "error"} | {f for f in OUTPUT_FIELDS if f.endswith(".status")}
+        self._schema = pa.schema([
+            (f, pa.int64() if f == "case_index" else pa.string() if f in string_fields else pa.float64())
+            for f in OUTPUT_FIELDS
+        ])
+        self.path = path
+        if not append:
+            self.discard_parts(path, 0)
+        os.makedirs(path, exist_ok=True)
+        self._parts = len(self._part_files(path))
+
+    @staticmethod
+    def _part_files(path):
+        if not os.path.isdir(path):
+            return []
+        return sorted(n for n in os.listdir(path) if n.startswith("part-") and n.endswith(".parquet"))
+
+    @classmethod
+    def discard_parts(cls, path, keep):
+        """Removes part files beyond the first `keep` (written after the last checkpoint)."""
+        if os.path.isfile(path): # Single-file output from an older run
+            os.remove(path)
+            return
+        for name in cls._part_files(path)[keep:]:
+            os.remove(os.path.join(path, name))
+        for name in os.listdir(path) if os.path.isdir(path) else []:
+            if name.startswith(".part-") and name.endswith(".tmp"): # Interrupted writes
+                os.remove(os.path.join(path, name))
+
+    def write(self, rows):
+        columns = {f: [row.get(f) for row in rows] for f in OUTPUT_FIELDS}
+        columns["id"] = [None if v is None else str(v) for v in columns["id"]]
+        name = f"part-{self._parts:06d}.parquet"
+        tmp = os.path.join(self.path, "." + name + ".tmp") # Hidden: dataset readers skip dot files
+        self._pq.write_table(self._pa.table(columns, schema=self._schema), tmp)
+        os.replace(tmp, os.path.join(self.path, name)) # Never leave a footer-less part under the final name
+        self._parts += 1
+
+    def flush(self):
+        return self._parts # Complete part files
+
+    def close(self):
+        pass
+
+
+class ResultStoreWriter:
+    """Appends each chunk to a columnar result store directory (see result_store.py)."""
+
+    def __init__(self, path, append):
+        from result_store import ResultStore
+        self._store = ResultStore.open_or_create(path) if append else ResultStore.create(path, overwrite=True)
+
+    def write(self, rows):
+        self._store.append(rows)
+
+    def flush(self):
+        return len(self._store)
+
+    def close(self):
+        pass
+
+
+WRITERS = {".csv": CSVResultWriter, ".ndjson": NDJSONResultWriter, ".jsonl": NDJSONResultWriter, ".parquet": ParquetResultWriter, ".store": ResultStoreWriter}
+READERS = {".csv": iter_csv_chunks, ".parquet": iter_parquet_chunks}
+
+
+# --- Checkpointing ---
+def _checkpoint_path(output_path):
+    return output_path + ".checkpoint.json"
+
+
+def load_checkpoint(output_path, input_path):
+    try:
+        with open(_checkpoint_path(output_path)) as f:
+            checkpoint = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if checkpoint.get("input") != os.path.abspath(input_path):
+        raise SystemExit(f"Checkpoint {_checkpoint_path(output_path)} belongs to another input file.")
+    return checkpoint
+
+
+def save_checkpoint(output_path, input_path, offset, output_bytes):
+    tmp = _checkpoint_path(output_path) + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump({"input": os.path.abspath(input_path), "offset": offset, "output_bytes": output_bytes}, f)
+    os.replace(tmp, _checkpoint_path(output_path))
+
+
+# --- Driver ---
+def _solve_chunks(chunks, offset, workers):
+    """Yields (chunk_rows_count, outputs) in input order; parallel with a bounded window."""
+    if workers <= 1:
+        for chunk in chunks:
+            yield len(chunk), solve_chunk(chunk, offset)
+            offset += len(chunk)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        window = deque()
+        for chunk in chunks:
+            window.append((len(chunk), pool.submit(solve_chunk, chunk, offset)))
+            offset += len(chunk)
+            if len(window) >= 2 * workers:
+                n, future = window.popleft()
+                yield n, future.result()
+        while window:
+            n, future = window.popleft()
+            yield n, future.result()
+
+
+def run(input_path, output_path, chunk_size=10000, workers=1, resume=False, progress=True):
+    in_ext = os.path.splitext(input_path)[1].lower()
+    out_ext = os.path.splitext(output_path)[1].lower()
+    if in_ext not in READERS:
+        raise SystemExit(f"Unsupported input format '{in_ext}' (use .csv or .parquet).")
+    if out_ext not in WRITERS:
+        raise SystemExit(f"Unsupported output format '{out_ext}' (use .csv, .ndjson, .parquet or .store).")
+
+    offset = 0
+    checkpoint = load_checkpoint(output_path, input_path) if resume else None
+    if checkpoint:
+        offset = checkpoint["offset"]
+        # Drop rows written after the last checkpoint
+        if out_ext == ".store" and os.path.isdir(output_path):
+            from result_store import ResultStore
+            ResultStore(output_path).truncate(checkpoint["offset"])
+        elif out_ext == ".parquet":
+            if os.path.isfile(output_path):
+                raise SystemExit(f"{output_path} is a single Parquet file from an older run and cannot be resumed; rerun without --resume.")
+            ParquetResultWriter.discard_parts(output_path, checkpoint.get("output_bytes") or 0)
+        elif checkpoint.get("output_bytes") is not None and os.path.exists(output_path):
+            with open(output_path, "r+b") as f:
+                f.truncate(checkpoint["output_bytes"])
+
+    writer = WRITERS[out_ext](output_path, append=checkpoint is not None)
+    chunks = READERS[in_ext](input_path, chunk_size, offset)
+    started = time.perf_counter()
+    done = 0
+    try:
+        for n_rows, outputs in _solve_chunks(chunks, offset, workers):
+            writer.write(outputs)
+            output_bytes = writer.flush()
+            offset += n_rows
+            done += n_rows
+            save_checkpoint(output_path, input_path, offset, output_bytes)
+            if progress:
+                rate = done / max(time.perf_counter() - started, 1e-9)
+                print(f"\r{offset} cases  ({rate:,.0f} cases/s)", end="", file=sys.stderr, flush=True)
+    finally:
+        writer.close()
+    elapsed = time.perf_counter() - started
+    if progress:
+        print(f"\rDone: {done} cases in {elapsed:.2f} s ({done / max(elapsed, 1e-9):,.0f} cases/s), total {offset}.", file=sys.stderr)
+    return {"cases": done, "total": offset, "seconds": elapsed}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk beam/column analysis of CSV/Parquet case files.")
+    parser.add_argument("input", help="Case file (.csv or .parquet)")
+    parser.add_argument("-o", "--output", required=True, help="Result file (.csv, .ndjson, .parquet) or result store directory (.store)")
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=1, help="Processes solving chunks in parallel")
+    parser.add_argument("--resume", action="store_true", help="Continue from the output's checkpoint")
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args(argv)
+    run(args.input, args.output, args.chunk_size, args.workers, args.resume, progress=not args.quiet)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,66 @@
-# This makes it easier to import from the 'core' package
-from .materials import Material, MATERIALS_LIB, get_material
-from .cross_sections import CrossSection, RectangularSection, CircularSection, create_cross_section # Add IBeamSection when created
-from .elements import StructuralElement, Beam, Column
-from .beam_solvers import (
-    solve_simply_supported_beam_point_load,
-    solve_cantilever_beam_point_load_end,
-    solve_simply_supported_beam_udl,  # Added
-    solve_cantilever_beam_udl         # Added
-)
-from .column_solvers import solve_column_axial_buckling
-from .utils import generate_beam_points, get_color_for_value
\ No newline at end of file
+# This makes it easier to import from the 'core' package.
+# Names are resolved lazily (PEP 562): "import core" is nearly free, and a
+# solver module (and NumPy) is only imported the first time it is used.
+import importlib
+
+_LAZY_EXPORTS = {
+    ".materials": ("Material", "MATERIALS_LIB", "get_material"),
+    ".cross_sections": ("CrossSection", "RectangularSection", "CircularSection", "create_cross_section"), # Add IBeamSection when created
+    ".section_geometry": ("PolygonSection", "section_properties_from_polygons", "clear_section_cache"),
+    ".elements": ("StructuralElement", "Beam", "Column"),
+    ".beam_solvers": (
+        "solve_simply_supported_beam_point_load",
+        "solve_cantilever_beam_point_load_end",
+        "solve_simply_supported_beam_udl",
+        "solve_cantilever_beam_udl",
+        "solve_beam",
+        "compute_beam_results",
+        "is_beam_case_supported",
+    ),
+    ".response_cache": ("UnitLoadResponseCache", "unit_load_cache"),
+    ".column_solvers": ("solve_column_axial_buckling", "compute_column_results"),
+    ".pure_solvers": ("BeamSpec", "ColumnSpec", "solve_beam_spec", "solve_column_spec", "freeze_results", "thaw_results"),
+    ".stress_field": ("compute_beam_stress_field",),
+    ".batch_solvers": ("solve_beam_cases", "solve_column_cases"),
+    ".beam_column": ("solve_beam_column", "solve_beam_column_cases"),
+    ".nonprismatic": (
+        "solve_nonprismatic_beam",
+        "deflection_from_curvature",
+        "section_properties_along",
+        "tapered_stations",
+        "haunched_stations",
+        "stepped_stations",
+    ),
+    ".modal": ("natural_frequencies", "fundamental_frequencies", "fe_modal_analysis", "beam_modal_analysis"),
+    ".reliability": ("run_monte_carlo",),
+    ".sensitivities": (
+        "solve_beam_cases_with_gradients",
+        "solve_column_cases_with_gradients",
+        "beam_element_sensitivities",
+        "column_element_sensitivities",
+    ),
+    ".utils": ("generate_beam_points", "get_color_for_value", "downsample_diagram_points"),
+}
+
+_NAME_TO_MODULE = {name: module for module, names in _LAZY_EXPORTS.items() for name in names}
+
+__all__ = list(_NAME_TO_MODULE)
+
+
+def __getattr__(name):
+    module_name = _NAME_TO_MODULE.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value # Later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+def preload():
+    """Imports every solver module now (e.g. in a pre-fork server master)."""
+    for module_name in _LAZY_EXPORTS:
+        importlib.import_module(module_name, __name__)
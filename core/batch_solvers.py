@@ -0,0 +1,201 @@
+# core/batch_solvers.py
+import numpy as np
+
+# Vectorized closed-form solvers for many cases at once. These compute the same
+# governing values and failure checks as the per-element solvers in
+# beam_solvers.py / column_solvers.py, but without the diagram point lists, so
+# large case sets (CLI batches, sweeps, Monte Carlo) cost a handful of array
+# operations per chunk instead of a Python solve per case.
+#
+# Beam cases: support_type in {"simplySupported", "cantilever"},
+#             load_type in {"pointLoad", "pointLoadEnd", "udl"}.
+
+DEFLECTION_LIMIT_SPAN_RATIO_BEAM = 300
+DEFLECTION_LIMIT_SPAN_RATIO_CANTILEVER = 180
+
+SHEAR_COEFF_RECTANGULAR = 1.5  # tau_max = 1.5 V / A
+SHEAR_COEFF_CIRCULAR = 4 / 3   # tau_max = 4/3 V / A
+
+
+def _ratio(demand, capacity):
+    """demand / capacity, inf where capacity <= 0 (as in the scalar solvers)."""
+    demand, capacity = np.broadcast_arrays(np.asarray(demand, dtype=float), np.asarray(capacity, dtype=float))
+    return np.divide(demand, capacity, out=np.full(demand.shape, np.inf), where=capacity > 0)
+
+
+def _status(ratio):
+    return np.where(ratio >= 1.0, "FAIL", "PASS")
+
+
+def rectangular_section_arrays(width_mm, height_mm):
+    """Vectorized RectangularSection properties (strong axis x-x)."""
+    b = np.asarray(width_mm, dtype=float) / 1000.0
+    h = np.asarray(height_mm, dtype=float) / 1000.0
+    A = b * h
+    Ix = b * h**3 / 12
+    Iy = h * b**3 / 12
+    Z = np.divide(Ix, h / 2.0, out=np.zeros_like(Ix), where=h > 0)
+    return {
+        "area_m2": A, "Ix_m4": Ix, "Iy_m4": Iy, "Zx_top_m3": Z, "Zx_bottom_m3": Z,
+        "tau_per_V": np.divide(SHEAR_COEFF_RECTANGULAR, A, out=np.zeros_like(A), where=A > 0),
+    }
+
+
+def circular_section_arrays(diameter_mm):
+    """Vectorized CircularSection properties."""
+    r = np.asarray(diameter_mm, dtype=float) / 2000.0
+    A = np.pi * r**2
+    I = np.pi * r**4 / 4
+    Z = np.divide(I, r, out=np.zeros_like(I), where=r > 0)
+    return {
+        "area_m2": A, "Ix_m4": I, "Iy_m4": I, "Zx_top_m3": Z, "Zx_bottom_m3": Z,
+        "tau_per_V": np.divide(SHEAR_COEFF_CIRCULAR, A, out=np.zeros_like(A), where=A > 0),
+    }
+
+
+def section_arrays_from_objects(sections):
+    """Stacks the properties of CrossSection objects (any type) into arrays."""
+    def tau_per_V(cs):
+        if cs.type_name == "Rectangular" and cs.area_m2 > 0:
+            return SHEAR_COEFF_RECTANGULAR / cs.area_m2
+        if cs.type_name == "Circular" and cs.area_m2 > 0:
+            return SHEAR_COEFF_CIRCULAR / cs.area_m2
+        if cs.Ix_m4 > 0 and cs.bx_at_Qx_max_m > 0:
+            return cs.Qx_max_m3 / (cs.Ix_m4 * cs.bx_at_Qx_max_m)
+        return 0.0
+    return {
+        "area_m2": np.array([cs.area_m2 for cs in sections], dtype=float),
+        "Ix_m4": np.array([cs.Ix_m4 for cs in sections], dtype=float),
+        "Iy_m4": np.array([cs.Iy_m4 for cs in sections], dtype=float),
+        "Zx_top_m3": np.array([cs.Zx_top_m3 for cs in sections], dtype=float),
+        "Zx_bottom_m3": np.array([cs.Zx_bottom_m3 for cs in sections], dtype=float),
+        "tau_per_V": np.array([tau_per_V(cs) for cs in sections], dtype=float),
+    }
+
+
+def beam_response_coefficients(support_type, load_type, L, load_pos_a_m=None):
+    """
+    Per-unit-load governing responses: |V|max, |M|max and EI * |deflection|max
+    for a unit load (1 N point load or 1 N/m UDL), plus the deflection span ratio.
+    All responses of these cases are linear in the load magnitude. Unsupported
+    cases and point loads outside 0 < a < L give NaN.
+    """
+    support_type = np.asarray(support_type)
+    load_type = np.asarray(load_type)
+    L = np.asarray(L, dtype=float)
+    a = np.asarray(load_pos_a_m if load_pos_a_m is not None else L / 2.0, dtype=float)
+    a, L, support_type, load_type = np.broadcast_arrays(a, L, support_type, load_type)
+
+    ss = support_type == "simplySupported"
+    cant = support_type == "cantilever"
+    point = (load_type == "pointLoad") | (load_type == "pointLoadEnd")
+    udl = load_type == "udl"
+    # As the scalar solver, a simply supported point load must lie strictly within the span
+    ss_point = ss & point & (0 < a) & (a < L)
+
+    # Simply supported, point load at a (b = L - a)
+    b = L - a
+    short = np.minimum(a, b)
+    ss_p_V = np.maximum(a, b) / L
+    ss_p_M = a * b / L
+    # Max deflection at x = sqrt((L^2 - short^2)/3) measured from the far support
+    ss_p_D = short * (L**2 - short**2) ** 1.5 / (9 * np.sqrt(3) * L)
+
+    V = np.select([ss_point, ss & udl, cant & point, cant & udl],
+                  [ss_p_V, L / 2, np.ones_like(L), L], np.nan)
+    M = np.select([ss_point, ss & udl, cant & point, cant & udl],
+                  [ss_p_M, L**2 / 8, L, L**2 / 2], np.nan)
+    D_EI = np.select([ss_point, ss & udl, cant & point, cant & udl],
+                     [ss_p_D, 5 * L**4 / 384, L**3 / 3, L**4 / 8], np.nan)
+    span_ratio = np.where(cant, DEFLECTION_LIMIT_SPAN_RATIO_CANTILEVER, DEFLECTION_LIMIT_SPAN_RATIO_BEAM)
+    return V, M, D_EI, span_ratio
+
+
+def solve_beam_cases(support_type, load_type, L, E, Fy, Fsy, section, load, load_pos_a_m=None):
+    """
+    Solves many beams at once.
+    Args:
+        support_type, load_type (array-like of str): Case types (see module header).
+        L, E, Fy, Fsy (array-like): Span (m), modulus, yield and shear yield strength (Pa).
+        section (dict): Arrays "Ix_m4", "Zx_top_m3", "Zx_bottom_m3", "tau_per_V"
+            (see rectangular_section_arrays / section_arrays_from_objects).
+        load (array-like): Point load (N) or UDL (N/m), positive downwards.
+        load_pos_a_m (array-like): Point-load position for simply supported point loads.
+    Returns:
+        dict: Arrays of governing responses and flattened failure checks
+            ("bending_yield.ratio", "bending_yield.status", ...).
+    """
+    V1, M1, D1, span_ratio = beam_response_coefficients(support_type, load_type, L, load_pos_a_m)
+    L = np.asarray(L, dtype=float)
+    E = np.asarray(E, dtype=float)
+    I = np.asarray(section["Ix_m4"], dtype=float)
+    load_abs = np.abs(np.asarray(load, dtype=float))
+
+    V = V1 * load_abs
+    M = M1 * load_abs
+    EI = E * I
+    deflection = np.divide(D1 * load_abs, EI, out=np.zeros(np.broadcast(D1, EI).shape), where=EI > 0)
+
+    Z_min = np.minimum(section["Zx_top_m3"], section["Zx_bottom_m3"])
+    bending_stress = np.divide(M, Z_min, out=np.zeros(np.broadcast(M, Z_min).shape), where=Z_min > 0)
+    shear_stress = V * section["tau_per_V"]
+    deflection_limit = L / span_ratio
+
+    bending_ratio = _ratio(bending_stress, Fy)
+    shear_ratio = _ratio(shear_stress, Fsy)
+    deflection_ratio = np.divide(deflection, deflection_limit, out=np.zeros_like(deflection), where=deflection_limit > 0)
+
+    return {
+        "max_abs_shear_N": V,
+        "max_abs_moment_Nm": M,
+        "max_abs_deflection_m": deflection,
+        "max_abs_bending_stress_Pa": bending_stress,
+        "max_shear_stress_Pa": shear_stress,
+        "bending_yield.demand_Pa": bending_stress,
+        "bending_yield.capacity_Pa": np.broadcast_to(np.asarray(Fy, dtype=float), bending_ratio.shape),
+        "bending_yield.ratio": bending_ratio,
+        "bending_yield.status": _status(bending_ratio),
+        "shear_yield.demand_Pa": shear_stress,
+        "shear_yield.capacity_Pa": np.broadcast_to(np.asarray(Fsy, dtype=float), shear_ratio.shape),
+        "shear_yield.ratio": shear_ratio,
+        "shear_yield.status": _status(shear_ratio),
+        "deflection_limit.demand_m": deflection,
+        "deflection_limit.limit_m": deflection_limit,
+        "deflection_limit.ratio": deflection_ratio,
+        "deflection_limit.status": _status(deflection_ratio),
+    }
+
+
+def solve_column_cases(L, E, Fy, A, Ix, Iy, Kx, Ky, axial_load_P_N):
+    """Vectorized counterpart of solve_column_axial_buckling (Euler buckling + yielding)."""
+    L, E, Fy, A, Ix, Iy, Kx, Ky, P = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (L, E, Fy, A, Ix, Iy, Kx, Ky, axial_load_P_N)))
+
+    axial_stress = _ratio(P, A)
+    Pcr_x = _ratio(np.pi**2 * E * Ix, (Kx * L) ** 2)
+    Pcr_y = _ratio(np.pi**2 * E * Iy, (Ky * L) ** 2)
+    Pcr_x = np.where(E * Ix > 0, Pcr_x, np.inf)
+    Pcr_y = np.where(E * Iy > 0, Pcr_y, np.inf)
+    Pcr = np.minimum(Pcr_x, Pcr_y)
+
+    yielding_ratio = _ratio(axial_stress, Fy)
+    buckling_ratio = _ratio(P, Pcr)
+    governed_by_yield = (_ratio(Pcr, A) > Fy) & (yielding_ratio >= 1.0)
+    buckling_status = np.select(
+        [buckling_ratio >= 1.0, governed_by_yield],
+        ["FAIL (Buckling)", "PASS (Buckling check governed by yielding)"], "PASS")
+
+    return {
+        "axial_stress_Pa": axial_stress,
+        "critical_buckling_load_Pcr_x_N": Pcr_x,
+        "critical_buckling_load_Pcr_y_N": Pcr_y,
+        "min_critical_buckling_load_N": Pcr,
+        "yielding_crushing.demand_Pa": axial_stress,
+        "yielding_crushing.capacity_Pa": Fy,
+        "yielding_crushing.ratio": yielding_ratio,
+        "yielding_crushing.status": _status(yielding_ratio),
+        "euler_buckling.demand_N": P,
+        "euler_buckling.capacity_N": Pcr,
+        "euler_buckling.ratio": buckling_ratio,
+        "euler_buckling.status": buckling_status,
+    }
@@ -0,0 +1,375 @@
+# core/beam_column.py
+import numpy as np
+
+from .beam_solvers import compute_beam_results
+from .nonprismatic import deflection_from_curvature
+from .batch_solvers import (
+    solve_beam_cases, solve_column_cases, section_arrays_from_objects, _ratio, _status,
+)
+
+# Beam-columns: the transverse cases of beam_solvers.py combined with an axial
+# load P (compression positive), with second-order (P-delta) effects.
+#
+# Sign conventions follow the scalar solvers: M sagging positive, deflection w
+# positive downwards, so EI w'' = -M. The axial load adds
+#   simply supported:  M(x) = M1(x) + P w(x)
+#   cantilever (fixed at x = 0, P at the free end):  M(x) = M1(x) - P (w(L) - w(x))
+#
+# method="iterative": P-delta iteration on the deflected shape. Each pass
+#   integrates the curvature twice (nonprismatic.deflection_from_curvature, exact
+#   for piecewise-linear curvature, on a grid that includes the load point) for
+#   all active cases at once; cases leave the active set when they converge.
+#   P at or above the in-plane critical load (pi^2 EI / L^2 simply supported,
+#   pi^2 EI / (2L)^2 cantilever) is unstable up front. The iteration contracts
+#   like (P / Pe)^k, so near-critical cases (|P| / Pe >= NEAR_CRITICAL_ALPHA),
+#   cases whose successive changes stop shrinking and cases still unconverged
+#   after max_iter are solved directly as one linear system per case.
+# method="amplification": closed-form B = 1 / (1 - P / Pe), with Pe about the
+#   bending axis using the effective length Kx L. With M2 = M1 + P delta2 this
+#   is the Cm = 1 + psi P / Pe form, psi = Pe delta1 / M1 - 1.
+#
+# Interaction checks (elastic capacities, no resistance factors):
+#   combined_stress:  (P / A + M2 / Z) / Fy
+#   interaction:      P/Pc + 8/9 M2/Mc  (P/Pc >= 0.2),  P/(2 Pc) + M2/Mc  otherwise,
+#                     Pc = min(A Fy, Pcr) in compression (A Fy in tension), Mc = Z Fy
+
+SECOND_ORDER_POINTS = 101
+SECOND_ORDER_TOL = 1e-8
+SECOND_ORDER_MAX_ITER = 200
+NEAR_CRITICAL_ALPHA = 0.5 # |P| / Pe from which the P-delta system is solved directly
+DIRECT_SOLVE_CHUNK = 256  # Cases per batched linear solve (memory ~ chunk * n_points^2)
+
+# In-plane effective length factor used by the amplification method when Kx is not given
+DEFAULT_KX = {"simplySupported": 1.0, "cantilever": 2.0}
+
+
+def _deflection_from_moment(x, M, EI, cantilever):
+    """w(x) from EI w'' = -M with the support boundary conditions (one case per row)."""
+    kappa = -np.divide(M, EI[:, None], out=np.zeros_like(M), where=EI[:, None] > 0)
+    return deflection_from_curvature(x, kappa, cantilever)[1]
+
+
+def _p_delta_moment(w, P, cantilever):
+    relative = np.where(cantilever[:, None], -(w[:, -1:] - w), w)
+    return P[:, None] * relative
+
+
+def _in_plane_critical_load(x, EI, cantilever):
+    """Critical load of the P-delta model itself (pinned-pinned or fixed-free)."""
+    L = x[:, -1] - x[:, 0]
+    return _ratio(np.pi**2 * EI, (np.where(cantilever, 2.0, 1.0) * L) ** 2)
+
+
+def _solve_p_delta_directly(x, M1, EI, P, cantilever):
+    """
+    Solves the discretized P-delta equations w = w1 - (P / EI) G R w in one step.
+    G maps nodal curvature to deflection (the same quadrature as the iteration),
+    R w is the P-delta lever arm. Returns (w, solved) for each case.
+    """
+    n_cases, n_pts = M1.shape
+    w1 = _deflection_from_moment(x, M1, EI, cantilever)
+    w = np.full_like(w1, np.nan)
+    solved = np.zeros(n_cases, dtype=bool)
+    eye = np.eye(n_pts)
+    for start in range(0, n_cases, DIRECT_SOLVE_CHUNK):
+        rows = slice(start, start + DIRECT_SOLVE_CHUNK)
+        xc, cc = x[rows], cantilever[rows]
+        m = len(xc)
+        # G[c, j, :] is the deflected shape for unit curvature at node j
+        _, G = deflection_from_curvature(xc[:, None, :], np.broadcast_to(eye, (m, n_pts, n_pts)),
+                                         np.broadcast_to(cc[:, None], (m, n_pts)))
+        RG = G.copy() # (R w) @ G as w @ RG
+        RG[cc, -1, :] -= G[cc].sum(axis=1) # Cantilever lever arm w - w(L)
+        coeff = np.divide(P[rows], EI[rows], out=np.zeros(m), where=EI[rows] > 0)
+        system = eye + coeff[:, None, None] * np.swapaxes(RG, 1, 2)
+        try:
+            w[rows] = np.linalg.solve(system, w1[rows][..., None])[..., 0]
+        except np.linalg.LinAlgError: # Singular case(s) in the chunk: solve one by one
+            for k in range(m):
+                try:
+                    w[start + k] = np.linalg.solve(system[k], w1[start + k])
+                except np.linalg.LinAlgError:
+                    pass
+        solved[rows] = np.all(np.isfinite(w[rows]), axis=1)
+    return w, solved
+
+
+def second_order_profiles(x, M1, EI, P, cantilever, tol=SECOND_ORDER_TOL, max_iter=SECOND_ORDER_MAX_ITER):
+    """
+    Vectorized P-delta analysis (iteration, with a direct solve for near-critical cases).
+    Args:
+        x, M1 (np.ndarray): (n_cases, n_points) positions and first-order moments.
+        EI, P (np.ndarray): (n_cases,) flexural stiffness and axial load (compression positive).
+        cantilever (np.ndarray of bool): (n_cases,) fixed at x = 0 and free at x = L.
+    Returns:
+        dict: "w1", "w", "M" (n_cases, n_points; w and M are inf unless stable and
+              converged) and per-case "iterations", "direct", "converged", "stable".
+    """
+    n = len(EI)
+    w1 = _deflection_from_moment(x, M1, EI, cantilever)
+    w = w1.copy()
+    iterations = np.zeros(n, dtype=int)
+    converged = P == 0
+    alpha = np.abs(_ratio(P, _in_plane_critical_load(x, EI, cantilever)))
+    stable = ~((P > 0) & (alpha >= 1.0))
+    direct = ~converged & stable & (alpha >= NEAR_CRITICAL_ALPHA)
+    active = np.flatnonzero(~converged & stable & ~direct)
+    last_change = np.full(n, np.inf)
+
+    for _ in range(max_iter):
+        if len(active) == 0:
+            break
+        M = M1[active] + _p_delta_moment(w[active], P[active], cantilever[active])
+        w_new = _deflection_from_moment(x[active], M, EI[active], cantilever[active])
+        change = np.max(np.abs(w_new - w[active]), axis=1)
+        peak = np.max(np.abs(w_new), axis=1)
+        w[active] = w_new
+        iterations[active] += 1
+
+        done = change <= tol * np.maximum(peak, np.finfo(float).tiny)
+        stalled = ~done & (~np.isfinite(peak) | (change >= last_change[active])) # Not contracting
+        last_change[active] = change
+        converged[active[done]] = True
+        direct[active[stalled]] = True
+        active = active[~(done | stalled)]
+    direct[active] = True # Still unconverged after max_iter
+
+    if np.any(direct):
+        idx = np.flatnonzero(direct)
+        w_direct, solved = _solve_p_delta_directly(x[idx], M1[idx], EI[idx], P[idx], cantilever[idx])
+        # Past the discrete critical load the solution flips against the load
+        flipped = (P[idx] > 0) & (np.sum(w_direct * w1[idx], axis=1) < 0)
+        w[idx] = w_direct
+        converged[idx] = solved & ~flipped
+        stable[idx[flipped]] = False
+
+    valid = stable & converged
+    w = np.where(valid[:, None], w, np.inf)
+    M = np.where(valid[:, None], M1 + _p_delta_moment(np.where(valid[:, None], w, 0.0), P, cantilever), np.inf)
+    return {"w1": w1, "w": w, "M": M, "iterations": iterations, "direct": direct,
+            "converged": converged, "stable": stable}
+
+
+def first_order_moment_profiles(support_type, load_type, L, load, load_pos_a_m=None, n_points=SECOND_ORDER_POINTS):
+    """
+    M1(x) for the closed-form beam cases on a grid that includes the point-load position.
+    Returns:
+        tuple: x, M1, each (n_cases, n_points + 1)
+    """
+    support_type, load_type, L, load = (np.atleast_1d(np.asarray(v)) for v in (support_type, load_type, L, load))
+    L = L.astype(float)
+    load = load.astype(float)
+    a = np.atleast_1d(np.asarray(load_pos_a_m if load_pos_a_m is not None else L / 2.0, dtype=float))
+    a, L, load, support_type, load_type = np.broadcast_arrays(a, L, load, support_type, load_type)
+
+    x = np.sort(np.concatenate([np.linspace(0.0, 1.0, n_points)[None, :] * L[:, None], a[:, None]], axis=1), axis=1)
+    L_, a_, F = L[:, None], a[:, None], load[:, None]
+    ss = (support_type == "simplySupported")[:, None]
+    cant = (support_type == "cantilever")[:, None]
+    point = ((load_type == "pointLoad") | (load_type == "pointLoadEnd"))[:, None]
+    udl = (load_type == "udl")[:, None]
+    M1 = np.select(
+        [ss & point, ss & udl, cant & point, cant & udl],
+        [F * (L_ - a_) / L_ * x - F * np.maximum(x - a_, 0.0), F * x * (L_ - x) / 2,
+         -F * (L_ - x), -F * (L_ - x) ** 2 / 2],
+        np.nan)
+    return x, M1
+
+
+def solve_beam_column_cases(support_type, load_type, L, E, Fy, section, load, axial_load_P_N,
+                            load_pos_a_m=None, Kx=None, Ky=1.0, method="iterative",
+                            tol=SECOND_ORDER_TOL, max_iter=SECOND_ORDER_MAX_ITER, n_points=SECOND_ORDER_POINTS):
+    """
+    Solves many beam-columns at once.
+    Args:
+        support_type, load_type, L, E, Fy, section, load, load_pos_a_m: As solve_beam_cases
+            (section also needs "area_m2" and "Iy_m4"; shear yield is Fy / sqrt(3)).
+        axial_load_P_N (array-like): Axial load, compression positive.
+        Kx, Ky (array-like): Effective length factors for the buckling checks (Kx also
+            sets Pe for the amplification method; default 1 simply supported, 2 cantilever).
+        method (str): "iterative" or "amplification".
+    Returns:
+        dict: Arrays of first- and second-order governing values, amplification factors,
+            iteration diagnostics and flattened checks (as solve_beam_cases).
+    """
+    support_type = np.atleast_1d(np.asarray(support_type))
+    L = np.atleast_1d(np.asarray(L, dtype=float))
+    n = np.broadcast(support_type, L, np.asarray(load_type), np.asarray(load), np.asarray(axial_load_P_N)).shape
+    support_type = np.broadcast_to(support_type, n)
+    E, Fy, load, P, L = (np.broadcast_to(np.asarray(v, dtype=float), n) for v in (E, Fy, load, axial_load_P_N, L))
+    cantilever = support_type == "cantilever"
+    if Kx is None:
+        Kx = np.where(cantilever, DEFAULT_KX["cantilever"], DEFAULT_KX["simplySupported"])
+    sec = {k: np.broadcast_to(np.asarray(v, dtype=float), n) for k, v in section.items()}
+    A, I = sec["area_m2"], sec["Ix_m4"]
+    Z = np.minimum(sec["Zx_top_m3"], sec["Zx_bottom_m3"])
+    EI = E * I
+
+    first = solve_beam_cases(support_type, load_type, L, E, Fy, Fy / np.sqrt(3), sec, load, load_pos_a_m)
+    column = solve_column_cases(L, E, Fy, A, I, sec["Iy_m4"], Kx, Ky, np.maximum(P, 0.0))
+    M1_max = first["max_abs_moment_Nm"]
+    delta1 = first["max_abs_deflection_m"]
+
+    if method == "iterative":
+        x, M1 = first_order_moment_profiles(support_type, load_type, L, load, load_pos_a_m, n_points)
+        prof = second_order_profiles(x, M1, EI, P, cantilever, tol, max_iter)
+        w, M2_profile = prof["w"], prof["M"]
+        stable, converged = prof["stable"], prof["converged"]
+        delta2 = np.max(np.abs(w), axis=1)
+        M2_max = np.max(np.abs(M2_profile), axis=1)
+        iterations, direct = prof["iterations"], prof["direct"]
+        # Ratio of like-for-like numerical peaks (same grid and quadrature)
+        w1_peak = np.max(np.abs(prof["w1"]), axis=1)
+        with np.errstate(invalid="ignore"):
+            deflection_amp = np.divide(delta2, w1_peak, out=np.ones_like(delta2), where=w1_peak > 0)
+    elif method == "amplification":
+        Pe = _ratio(np.pi**2 * EI, (Kx * L) ** 2)
+        alpha = _ratio(P, Pe)
+        stable = alpha < 1.0
+        B = np.divide(1.0, 1.0 - alpha, out=np.full(alpha.shape, np.inf), where=stable)
+        delta2 = delta1 * B
+        M2_max = np.where(stable, np.abs(M1_max + P * delta2), np.inf)
+        iterations = np.zeros(n, dtype=int)
+        direct = np.zeros(n, dtype=bool)
+        converged = stable
+        deflection_amp = B
+    else:
+        raise ValueError(f"Unknown second-order method '{method}'")
+
+    with np.errstate(invalid="ignore"):
+        moment_amp = np.divide(M2_max, M1_max, out=np.ones_like(M2_max), where=M1_max > 0)
+
+    bending_stress = np.divide(M2_max, Z, out=np.zeros_like(M2_max), where=Z > 0)
+    axial_stress = _ratio(np.abs(P), A)
+    deflection_limit = first["deflection_limit.limit_m"]
+    bending_ratio = _ratio(bending_stress, Fy)
+    deflection_ratio = np.divide(delta2, deflection_limit, out=np.zeros_like(delta2), where=deflection_limit > 0)
+    combined_ratio = _ratio(axial_stress + bending_stress, Fy)
+
+    Pc = np.where(P > 0, np.minimum(A * Fy, column["min_critical_buckling_load_N"]), A * Fy)
+    Mc = Z * Fy
+    p_ratio = _ratio(np.abs(P), Pc)
+    m_ratio = _ratio(M2_max, Mc)
+    interaction_ratio = np.where(p_ratio >= 0.2, p_ratio + 8.0 / 9.0 * m_ratio, p_ratio / 2.0 + m_ratio)
+
+    def second_order_status(ratio):
+        # Checks on second-order demands only pass or fail with a valid solution
+        return np.select([~stable, ~converged], ["FAIL (Unstable)", "FAIL (Not converged)"], _status(ratio))
+
+    results = {
+        "max_abs_shear_N": first["max_abs_shear_N"],
+        "first_order_max_abs_moment_Nm": M1_max,
+        "first_order_max_abs_deflection_m": delta1,
+        "max_abs_moment_Nm": M2_max,
+        "max_abs_deflection_m": delta2,
+        "moment_amplification": moment_amp,
+        "deflection_amplification": deflection_amp,
+        "axial_stress_Pa": axial_stress,
+        "max_abs_bending_stress_Pa": bending_stress,
+        "max_shear_stress_Pa": first["max_shear_stress_Pa"],
+        "second_order.iterations": iterations,
+        "second_order.direct": direct,
+        "second_order.converged": converged,
+        "second_order.stable": stable,
+        "bending_yield.demand_Pa": bending_stress,
+        "bending_yield.capacity_Pa": Fy,
+        "bending_yield.ratio": bending_ratio,
+        "bending_yield.status": second_order_status(bending_ratio),
+        "deflection_limit.demand_m": delta2,
+        "deflection_limit.limit_m": deflection_limit,
+        "deflection_limit.ratio": deflection_ratio,
+        "deflection_limit.status": second_order_status(deflection_ratio),
+        "combined_stress.demand_Pa": axial_stress + bending_stress,
+        "combined_stress.capacity_Pa": Fy,
+        "combined_stress.ratio": combined_ratio,
+        "combined_stress.status": second_order_status(combined_ratio),
+        "interaction.axial_ratio": p_ratio,
+        "interaction.moment_ratio": m_ratio,
+        "interaction.ratio": interaction_ratio,
+        "interaction.status": second_order_status(interaction_ratio),
+    }
+    for key in ("shear_yield.demand_Pa", "shear_yield.capacity_Pa", "shear_yield.ratio", "shear_yield.status"):
+        results[key] = first[key]
+    for key, value in column.items():
+        if key.startswith(("yielding_crushing.", "euler_buckling.")) or key.startswith("critical_buckling") or key == "min_critical_buckling_load_N":
+            results[key] = value
+    if method == "iterative":
+        results["_profiles"] = {"x": x, "w": w, "M": M2_profile}
+    return results
+
+
+def solve_beam_column(beam_element, load_type, load_N, axial_load_P_N, load_pos_a_m=None,
+                      Kx=None, Ky=1.0, method="iterative"):
+    """
+    Second-order analysis of a single Beam element carrying an axial load.
+    Args:
+        beam_element (Beam): The beam (its support_type selects the case).
+        load_type (str): "pointLoad", "pointLoadEnd" or "udl".
+        load_N (float): Point load (N) or UDL (N/m), positive downwards.
+        axial_load_P_N (float): Axial load, compression positive.
+    Returns:
+        dict: Updated beam_element.results, in the same layout as the beam solvers
+              (diagrams, governing values and bending stresses are second order; shear
+              is first order; with method="amplification" the diagrams are the first-order
+              shape scaled by B and max_abs_moment_Nm is the M1 + P delta2 envelope).
+              Without a stable, converged solution the diagrams are
+              empty, the governing values infinite and the second-order checks FAIL.
+    """
+    results = compute_beam_results(beam_element, load_type, load_N, load_pos_a_m) # First-order diagrams (shear) and reactions
+    mat = beam_element.material
+    section = section_arrays_from_objects([beam_element.cross_section])
+    res = solve_beam_column_cases(
+        [beam_element.support_type], [load_type], [beam_element.length_m], mat.E_Pa, mat.Fy_Pa, section,
+        [load_N], [axial_load_P_N], None if load_pos_a_m is None else [load_pos_a_m], Kx, Ky, method)
+
+    scalar = {k: v[0].item() if hasattr(v[0], "item") else v[0] for k, v in res.items() if k != "_profiles"}
+    if not (scalar["second_order.stable"] and scalar["second_order.converged"]):
+        # No valid second-order solution: no diagrams, and unbounded governing values
+        results["bmd_points"], results["deflection_points"] = [], []
+        for key in ("moment_Nm", "deflection_m", "bending_stress_Pa"):
+            results["max_" + key], results["min_" + key] = float("inf"), float("-inf")
+    else:
+        if "_profiles" in res:
+            x, w, M = (res["_profiles"][k][0] for k in ("x", "w", "M"))
+        else:
+            # Amplification: the first-order deflected shape scaled by B, and the
+            # moment it produces (the first-order diagrams share their stations)
+            x = np.array([p["x"] for p in results["deflection_points"]])
+            w = scalar["deflection_amplification"] * np.array([p["d"] for p in results["deflection_points"]])
+            M1 = np.array([p["m"] for p in results["bmd_points"]])
+            M = M1 + _p_delta_moment(w[None, :], np.array([axial_load_P_N], dtype=float),
+                                     np.array([beam_element.support_type == "cantilever"]))[0]
+        results["bmd_points"] = [{"x": xi, "m": mi} for xi, mi in zip(x.tolist(), M.tolist())]
+        results["deflection_points"] = [{"x": xi, "d": di} for xi, di in zip(x.tolist(), w.tolist())]
+        results["max_moment_Nm"], results["min_moment_Nm"] = float(np.max(M)), float(np.min(M))
+        results["max_deflection_m"], results["min_deflection_m"] = float(np.max(w)), float(np.min(w))
+
+        # Fibre stresses from the governing second-order moment (sign from the diagram)
+        cs = beam_element.cross_section
+        M_gov = float(np.copysign(scalar["max_abs_moment_Nm"], M[np.argmax(np.abs(M))]))
+        tension_Z, compression_Z = (cs.Zx_bottom_m3, cs.Zx_top_m3) if M_gov > 0 else (cs.Zx_top_m3, cs.Zx_bottom_m3)
+        results["max_bending_stress_Pa"] = abs(M_gov) / tension_Z if tension_Z > 0 else 0
+        results["min_bending_stress_Pa"] = -abs(M_gov) / compression_Z if compression_Z > 0 else 0
+
+    results["axial_load_N"] = axial_load_P_N
+    results["max_abs_moment_Nm"] = scalar["max_abs_moment_Nm"]
+    results["max_abs_deflection_m"] = scalar["max_abs_deflection_m"]
+    results["axial_stress_Pa"] = scalar["axial_stress_Pa"]
+    results["second_order"] = {
+        "method": method,
+        "moment_amplification": scalar["moment_amplification"],
+        "deflection_amplification": scalar["deflection_amplification"],
+        "first_order_max_abs_moment_Nm": scalar["first_order_max_abs_moment_Nm"],
+        "first_order_max_abs_deflection_m": scalar["first_order_max_abs_deflection_m"],
+        "iterations": scalar["second_order.iterations"],
+        "direct_solve": scalar["second_order.direct"],
+        "converged": scalar["second_order.converged"],
+        "stable": scalar["second_order.stable"],
+    }
+    checks = results.setdefault("failure_checks", {})
+    for key, value in scalar.items():
+        check, _, field = key.partition(".")
+        if field and check != "second_order":
+            checks.setdefault(check, {})[field] = value
+    beam_element.results = results
+    return results
@@ -2,18 +2,10 @@
 # core/beam_solvers.py
 import numpy as np
 import math
+from .elements import new_beam_results
 from .utils import generate_beam_points
 
-def solve_simply_supported_beam_point_load(beam_element, load_P_N, load_pos_a_m):
-    """
-    Solves a simply supported beam with a single point load P.
-    Args:
-        beam_element (Beam): The beam object.
-        load_P_N (float): Magnitude of the point load (positive downwards).
-        load_pos_a_m (float): Distance of the load from the left support (0 < a < L).
-    Returns:
-        dict: Updated beam_element.results
-    """
+def _simply_supported_point_load_results(beam_element, load_P_N, load_pos_a_m):
     L = beam_element.length_m
     E = beam_element.material.E_Pa
     I = beam_element.cross_section.Ix_m4 # Assuming bending about strong x-axis
@@ -25,7 +17,7 @@ def solve_simply_supported_beam_point_load(beam_element, load_P_N, load_pos_a_m)
     if not (0 < load_pos_a_m < L):
         raise ValueError("Load position 'a' must be between 0 and L (exclusive).")
 
-    results = beam_element.results # Get a reference to update
+    results = new_beam_results()
 
     # 1. Reactions
     b = L - load_pos_a_m
@@ -182,11 +174,10 @@ def solve_simply_supported_beam_point_load(beam_element, load_P_N, load_pos_a_m)
         "status": "FAIL" if deflection_ratio >= 1.0 else "PASS"
     }
 
-    beam_element.results = results
     return results
 
 
-def solve_cantilever_beam_point_load_end(beam_element, load_P_N):
+def _cantilever_point_load_end_results(beam_element, load_P_N):
     L = beam_element.length_m
     E = beam_element.material.E_Pa
     I = beam_element.cross_section.Ix_m4
@@ -195,7 +186,7 @@ def solve_cantilever_beam_point_load_end(beam_element, load_P_N):
     Z_top = beam_element.cross_section.Zx_top_m3
     Z_bottom = beam_element.cross_section.Zx_bottom_m3
     
-    results = beam_element.results
+    results = new_beam_results()
 
     # 1. Reactions
     R_A_vertical = load_P_N
@@ -288,18 +279,9 @@ def solve_cantilever_beam_point_load_end(beam_element, load_P_N):
         "ratio": deflection_ratio, "status": "FAIL" if deflection_ratio >= 1.0 else "PASS"
     }
 
-    beam_element.results = results
     return results
 
-def solve_simply_supported_beam_udl(beam_element, udl_w_N_per_m):
-    """
-    Solves a simply supported beam with a uniformly distributed load w.
-    Args:
-        beam_element (Beam): The beam object.
-        udl_w_N_per_m (float): Magnitude of the UDL (positive downwards).
-    Returns:
-        dict: Updated beam_element.results
-    """
+def _simply_supported_udl_results(beam_element, udl_w_N_per_m):
     L = beam_element.length_m
     E = beam_element.material.E_Pa
     I = beam_element.cross_section.Ix_m4
@@ -308,7 +290,7 @@ def solve_simply_supported_beam_udl(beam_element, udl_w_N_per_m):
     Z_top = beam_element.cross_section.Zx_top_m3
     Z_bottom = beam_element.cross_section.Zx_bottom_m3
 
-    results = beam_element.results
+    results = new_beam_results()
 
     # 1. Reactions
     R_A = (udl_w_N_per_m * L) / 2
@@ -395,13 +377,9 @@ def solve_simply_supported_beam_udl(beam_element, udl_w_N_per_m):
         "ratio": deflection_ratio, "status": "FAIL" if deflection_ratio >= 1.0 else "PASS"
     }
 
-    beam_element.results = results
     return results
 
-def solve_cantilever_beam_udl(beam_element, udl_w_N_per_m):
-    """
-    Solves a cantilever beam (fixed at x=0, free at x=L) with a UDL w.
-    """
+def _cantilever_udl_results(beam_element, udl_w_N_per_m):
     L = beam_element.length_m
     E = beam_element.material.E_Pa
     I = beam_element.cross_section.Ix_m4
@@ -410,7 +388,7 @@ def solve_cantilever_beam_udl(beam_element, udl_w_N_per_m):
     Z_top = beam_element.cross_section.Zx_top_m3
     Z_bottom = beam_element.cross_section.Zx_bottom_m3
     
-    results = beam_element.results
+    results = new_beam_results()
 
     # 1. Reactions
     R_A_vertical = udl_w_N_per_m * L
@@ -494,5 +472,91 @@ def solve_cantilever_beam_udl(beam_element, udl_w_N_per_m):
         "ratio": deflection_ratio, "status": "FAIL" if deflection_ratio >= 1.0 else "PASS"
     }
 
+    return results
+
+
+# Public solvers: compute into a new dict, then store it on the element
+def solve_simply_supported_beam_point_load(beam_element, load_P_N, load_pos_a_m):
+    """
+    Solves a simply supported beam with a single point load P.
+    Args:
+        beam_element (Beam): The beam object.
+        load_P_N (float): Magnitude of the point load (positive downwards).
+        load_pos_a_m (float): Distance of the load from the left support (0 < a < L).
+    Returns:
+        dict: Updated beam_element.results
+    """
+    results = _simply_supported_point_load_results(beam_element, load_P_N, load_pos_a_m)
+    beam_element.results = results
+    return results
+
+
+def solve_cantilever_beam_point_load_end(beam_element, load_P_N):
+    results = _cantilever_point_load_end_results(beam_element, load_P_N)
+    beam_element.results = results
+    return results
+
+
+def solve_simply_supported_beam_udl(beam_element, udl_w_N_per_m):
+    """
+    Solves a simply supported beam with a uniformly distributed load w.
+    Args:
+        beam_element (Beam): The beam object.
+        udl_w_N_per_m (float): Magnitude of the UDL (positive downwards).
+    Returns:
+        dict: Updated beam_element.results
+    """
+    results = _simply_supported_udl_results(beam_element, udl_w_N_per_m)
+    beam_element.results = results
+    return results
+
+
+def solve_cantilever_beam_udl(beam_element, udl_w_N_per_m):
+    """
+    Solves a cantilever beam (fixed at x=0, free at x=L) with a UDL w.
+    """
+    results = _cantilever_udl_results(beam_element, udl_w_N_per_m)
+    beam_element.results = results
+    return results
+
+
+_BEAM_CASES = {
+    ("simplySupported", "pointLoad"): lambda beam, load_N, a: _simply_supported_point_load_results(beam, load_N, a),
+    ("simplySupported", "udl"): lambda beam, load_N, a: _simply_supported_udl_results(beam, load_N),
+    ("cantilever", "pointLoadEnd"): lambda beam, load_N, a: _cantilever_point_load_end_results(beam, load_N),
+    ("cantilever", "udl"): lambda beam, load_N, a: _cantilever_udl_results(beam, load_N),
+}
+
+
+def is_beam_case_supported(support_type, load_type):
+    """True if compute_beam_results has a solver for this support / load combination."""
+    return (support_type, load_type) in _BEAM_CASES
+
+
+def compute_beam_results(beam_element, load_type, load_N, load_pos_a_m=None):
+    """
+    Reentrant core of solve_beam: reads beam_element, never writes to it.
+    Accepts any object with length_m, material, cross_section and support_type
+    (e.g. a frozen BeamSpec).
+    Returns:
+        dict: A new results dict (nothing in it is shared with other calls)
+    """
+    case = _BEAM_CASES.get((beam_element.support_type, load_type))
+    if case is None:
+        raise ValueError(f"Load type '{load_type}' not implemented for support type '{beam_element.support_type}'")
+    return case(beam_element, load_N, load_pos_a_m)
+
+
+def solve_beam(beam_element, load_type, load_N, load_pos_a_m=None):
+    """
+    Dispatches to the solver for the beam's support type and the load type.
+    Args:
+        load_type (str): "pointLoad" (simply supported), "pointLoadEnd" (cantilever) or "udl".
+        load_N (float): Point load (N) or UDL (N/m), positive downwards.
+        load_pos_a_m (float): Point-load position for simply supported point loads.
+    Returns:
+        dict: Updated beam_element.results
+    """
+    results = compute_beam_results(beam_element, load_type, load_N, load_pos_a_m)
     beam_element.results = results
     return results
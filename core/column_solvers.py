@@ -1,15 +1,14 @@
 # core/column_solvers.py
 import math
 import numpy as np
+from .elements import new_column_results
 
-def solve_column_axial_buckling(column_element, axial_load_P_N):
+def compute_column_results(column_element, axial_load_P_N):
     """
-    Solves a column for axial stress and Euler buckling.
-    Args:
-        column_element (Column): The column object.
-        axial_load_P_N (float): Magnitude of the axial compressive load (positive).
+    Reentrant core of solve_column_axial_buckling: reads column_element (or a
+    frozen ColumnSpec), never writes to it.
     Returns:
-        dict: Updated column_element.results
+        dict: A new results dict
     """
     L = column_element.length_m
     E = column_element.material.E_Pa
@@ -20,7 +19,7 @@ def solve_column_axial_buckling(column_element, axial_load_P_N):
     Ky = column_element.Ky
     Fy = column_element.material.Fy_Pa
 
-    results = column_element.results
+    results = new_column_results()
 
     # 1. Axial Stress
     if A > 0:
@@ -83,5 +82,18 @@ def solve_column_axial_buckling(column_element, axial_load_P_N):
         "note": buckling_note
     }
     
+    return results
+
+
+def solve_column_axial_buckling(column_element, axial_load_P_N):
+    """
+    Solves a column for axial stress and Euler buckling.
+    Args:
+        column_element (Column): The column object.
+        axial_load_P_N (float): Magnitude of the axial compressive load (positive).
+    Returns:
+        dict: Updated column_element.results
+    """
+    results = compute_column_results(column_element, axial_load_P_N)
     column_element.results = results
-    return results
\ No newline at end of file
+    return results
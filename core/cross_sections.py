@@ -31,6 +31,13 @@ class CrossSection:
     def _calculate_properties(self):
         raise NotImplementedError("Subclasses must implement this method.")
 
+    def first_moment_profile(self, axis="x", num_levels=101):
+        """
+        Returns (y_from_na_m, Q_m3, b_m) arrays across the depth for shear about the
+        given axis: Q(y) is the first moment of the area beyond y, b(y) the chord width.
+        """
+        raise NotImplementedError("Subclasses must implement this method.")
+
     def get_properties_dict(self):
         return {
             "type": self.type_name,
@@ -78,6 +85,13 @@ class RectangularSection(CrossSection):
             self.rx_m = math.sqrt(self.Ix_m4 / self.area_m2)
             self.ry_m = math.sqrt(self.Iy_m4 / self.area_m2)
 
+    def first_moment_profile(self, axis="x", num_levels=101):
+        import numpy as np # Deferred: keeps section construction import-light
+        depth, width = (self.h_m, self.b_m) if axis == "x" else (self.b_m, self.h_m)
+        y = np.linspace(-depth / 2.0, depth / 2.0, num_levels)
+        Q = 0.5 * width * (depth**2 / 4.0 - y**2) # Q(y) = b/2 * (h^2/4 - y^2)
+        return y, Q, np.full_like(y, width)
+
 class CircularSection(CrossSection):
     def __init__(self, diameter_mm):
         super().__init__("Circular")
@@ -111,6 +125,13 @@ class CircularSection(CrossSection):
             self.rx_m = math.sqrt(self.Ix_m4 / self.area_m2) # r_g = r/2 for solid circle
             self.ry_m = self.rx_m
 
+    def first_moment_profile(self, axis="x", num_levels=101):
+        import numpy as np
+        y = np.linspace(-self.r_m, self.r_m, num_levels)
+        half_chord = np.sqrt(np.clip(self.r_m**2 - y**2, 0.0, None))
+        Q = (2/3) * half_chord**3 # Q(y) = 2/3 * (r^2 - y^2)^(3/2)
+        return y, Q, 2.0 * half_chord
+
 # Factory function
 def create_cross_section(type_name, params_mm):
     if type_name == "rectangular":
@@ -119,6 +140,12 @@ def create_cross_section(type_name, params_mm):
     elif type_name == "circular":
         # params_mm = [diameter]
         return CircularSection(params_mm[0])
+    elif type_name == "polygon":
+        # params_mm = [x1, y1, x2, y2, ...] outline vertices
+        from .section_geometry import PolygonSection
+        if len(params_mm) < 6 or len(params_mm) % 2:
+            raise ValueError("Polygon section needs at least 3 (x, y) vertex pairs.")
+        return PolygonSection(list(zip(params_mm[0::2], params_mm[1::2])))
     # Add I-beam, Hollow sections etc. later
     # elif type_name == "i_beam_metric":
     #     # params_mm = [height_d, width_bf, flange_thick_tf, web_thick_tw]
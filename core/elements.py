@@ -31,57 +31,50 @@ class StructuralElement:
         }
 
 
+def new_beam_results():
+    """Empty beam results structure (a new dict on every call, never shared)."""
+    return {
+        "reactions": {},
+        "sfd_points": [], "bmd_points": [], "deflection_points": [],
+        "max_shear_N": 0, "min_shear_N": 0,
+        "max_moment_Nm": 0, "min_moment_Nm": 0,
+        "max_deflection_m": 0, "min_deflection_m": 0,
+        "max_bending_stress_Pa": 0, "min_bending_stress_Pa": 0,
+        "max_shear_stress_Pa": 0,
+        "failure_checks": {}
+    }
+
+
+def new_column_results():
+    """Empty column results structure (a new dict on every call, never shared)."""
+    return {
+        "axial_stress_Pa": 0,
+        "critical_buckling_load_Pcr_x_N": 0,
+        "critical_buckling_load_Pcr_y_N": 0,
+        "critical_buckling_stress_Fcr_x_Pa": 0,
+        "critical_buckling_stress_Fcr_y_Pa": 0,
+        "min_critical_buckling_load_N": 0,
+        "failure_checks": {}
+    }
+
+
 class Beam(StructuralElement):
     def __init__(self, length_m, material_name, section_type, section_params_mm, support_type):
         super().__init__(length_m, material_name, section_type, section_params_mm)
         self.support_type = support_type # e.g., "simply_supported", "cantilever_left_fixed"
-        self.results = { # Initialize results structure for beams
-            "reactions": {},
-            "sfd_points": [], "bmd_points": [], "deflection_points": [],
-            "max_shear_N": 0, "min_shear_N": 0,
-            "max_moment_Nm": 0, "min_moment_Nm": 0,
-            "max_deflection_m": 0, "min_deflection_m": 0,
-            "max_bending_stress_Pa": 0, "min_bending_stress_Pa": 0,
-            "max_shear_stress_Pa": 0,
-            "failure_checks": {}
-        }
-
-
-# core/elements.py
+        self.results = new_beam_results()
 
-# ... (other imports and classes like StructuralElement, Beam) ...
 
 class Column(StructuralElement):
     def __init__(self, length_m, material_name, section_type, section_params_mm, effective_length_factor_Kx, effective_length_factor_Ky):
         super().__init__(length_m, material_name, section_type, section_params_mm)
         self.Kx = float(effective_length_factor_Kx) # Effective length factor for buckling about x-axis
         self.Ky = float(effective_length_factor_Ky) # Effective length factor for buckling about y-axis
-        self.results = { # Initialize results structure for columns
-            "axial_stress_Pa": 0,
-            "critical_buckling_load_Pcr_x_N": 0,
-            "critical_buckling_load_Pcr_y_N": 0,
-            "critical_buckling_stress_Fcr_x_Pa": 0,
-            "critical_buckling_stress_Fcr_y_Pa": 0,
-            "min_critical_buckling_load_N": 0,
-            "failure_checks": {}
-        }
+        self.results = new_column_results()
 
-    def get_element_info(self): # <<<< ADD THIS METHOD TO OVERRIDE THE BASE CLASS
+    def get_element_info(self):
         """Returns a dictionary with the column's properties, including Kx and Ky."""
         info = super().get_element_info() # Get common properties from base class
         info['Kx'] = self.Kx
         info['Ky'] = self.Ky
         return info
-    def __init__(self, length_m, material_name, section_type, section_params_mm, effective_length_factor_Kx, effective_length_factor_Ky):
-        super().__init__(length_m, material_name, section_type, section_params_mm)
-        self.Kx = float(effective_length_factor_Kx) # Effective length factor for buckling about x-axis
-        self.Ky = float(effective_length_factor_Ky) # Effective length factor for buckling about y-axis
-        self.results = { # Initialize results structure for columns
-            "axial_stress_Pa": 0,
-            "critical_buckling_load_Pcr_x_N": 0,
-            "critical_buckling_load_Pcr_y_N": 0,
-            "critical_buckling_stress_Fcr_x_Pa": 0,
-            "critical_buckling_stress_Fcr_y_Pa": 0,
-            "min_critical_buckling_load_N": 0,
-            "failure_checks": {}
-        }
\ No newline at end of file
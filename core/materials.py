@@ -1,5 +1,6 @@
 # core/materials.py
 import math
+from functools import lru_cache
 
 class Material:
     def __init__(self, name, youngs_modulus_E_GPa, yield_strength_MPa, poissons_ratio=0.3, density_kg_m3=7850):
@@ -16,37 +17,46 @@ class Material:
         self.Fsy_Pa = self.Fy_Pa / math.sqrt(3)
 
 
-# Predefined materials dictionary
-MATERIALS_LIB = {
-    "steel_generic_s275": Material(
-        name="Generic S275 Steel",
-        youngs_modulus_E_GPa=200,
-        yield_strength_MPa=275,
-        poissons_ratio=0.3,
-        density_kg_m3=7850
-    ),
-    "steel_generic_s355": Material(
-        name="Generic S355 Steel",
-        youngs_modulus_E_GPa=200,
-        yield_strength_MPa=355,
-        poissons_ratio=0.3,
-        density_kg_m3=7850
-    ),
-    "aluminum_6061_t6": Material(
-        name="Aluminum 6061-T6",
-        youngs_modulus_E_GPa=69,
-        yield_strength_MPa=276,
-        poissons_ratio=0.33,
-        density_kg_m3=2700
-    ),
-    "wood_douglas_fir": Material( # Properties highly variable, illustrative
-        name="Wood (Douglas Fir, No.1/2)",
-        youngs_modulus_E_GPa=11, # Average E
-        yield_strength_MPa=30,   # Bending strength Fb, treat as pseudo-yield
-        poissons_ratio=0.37, # Approx
-        density_kg_m3=530
-    ),
-}
+# Predefined materials dictionary, built on first use (see __getattr__ below)
+@lru_cache(maxsize=None)
+def _materials_lib():
+    return {
+        "steel_generic_s275": Material(
+            name="Generic S275 Steel",
+            youngs_modulus_E_GPa=200,
+            yield_strength_MPa=275,
+            poissons_ratio=0.3,
+            density_kg_m3=7850
+        ),
+        "steel_generic_s355": Material(
+            name="Generic S355 Steel",
+            youngs_modulus_E_GPa=200,
+            yield_strength_MPa=355,
+            poissons_ratio=0.3,
+            density_kg_m3=7850
+        ),
+        "aluminum_6061_t6": Material(
+            name="Aluminum 6061-T6",
+            youngs_modulus_E_GPa=69,
+            yield_strength_MPa=276,
+            poissons_ratio=0.33,
+            density_kg_m3=2700
+        ),
+        "wood_douglas_fir": Material( # Properties highly variable, illustrative
+            name="Wood (Douglas Fir, No.1/2)",
+            youngs_modulus_E_GPa=11, # Average E
+            yield_strength_MPa=30,   # Bending strength Fb, treat as pseudo-yield
+            poissons_ratio=0.37, # Approx
+            density_kg_m3=530
+        ),
+    }
+
+
+def __getattr__(name):
+    if name == "MATERIALS_LIB":
+        return _materials_lib()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def get_material(name="steel_generic_s275"):
-    return MATERIALS_LIB.get(name, MATERIALS_LIB["steel_generic_s275"])
\ No newline at end of file
+    lib = _materials_lib()
+    return lib.get(name, lib["steel_generic_s275"])
\ No newline at end of file
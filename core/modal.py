@@ -0,0 +1,170 @@
+# core/modal.py
+import numpy as np
+
+# Free vibration of Euler-Bernoulli beams.
+#   Closed form (prismatic):  omega_n = (beta_n L)^2 sqrt(E I / (m L^4)),  f_n = omega_n / (2 pi)
+#   General (EI(x), m(x) per element): consistent-mass Hermite finite elements,
+#   first k modes by shift-invert Lanczos (scipy.sparse.linalg.eigsh) when SciPy
+#   is installed, dense generalized eigenproblem otherwise.
+# m is the mass per unit length (kg/m) = density * area.
+
+# beta_n L roots of cos(bL) cosh(bL) = -1 (cantilever); higher modes use (2n - 1) pi / 2
+CANTILEVER_BETA_L = (1.8751040687, 4.6940911330, 7.8547574382, 10.9955407349)
+
+MODAL_ELEMENTS_DEFAULT = 40
+
+
+def beta_l_roots(support_type, n_modes):
+    """beta_n L for the first n_modes of a support type."""
+    n = np.arange(1, n_modes + 1)
+    if support_type == "simplySupported":
+        return n * np.pi
+    if support_type == "cantilever":
+        roots = (2 * n - 1) * np.pi / 2
+        known = min(n_modes, len(CANTILEVER_BETA_L))
+        roots[:known] = CANTILEVER_BETA_L[:known]
+        return roots
+    raise ValueError(f"Support type '{support_type}' has no closed-form modal solution")
+
+
+def natural_frequencies(support_type, L, E, I, mass_per_length_kg_m, n_modes=1):
+    """
+    Closed-form natural frequencies for many prismatic beams at once.
+    Args:
+        support_type (str | array-like of str): "simplySupported" or "cantilever".
+        L, E, I, mass_per_length_kg_m (array-like): Span (m), modulus (Pa), Ix (m^4), m (kg/m).
+        n_modes (int): Number of modes per case.
+    Returns:
+        np.ndarray: Frequencies in Hz, shape (n_cases, n_modes); NaN for unsupported cases.
+    """
+    support_type = np.asarray(support_type)
+    L, E, I, m, support_type = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (L, E, I, mass_per_length_kg_m)), support_type)
+    L, E, I, m, support_type = (np.atleast_1d(v) for v in (L, E, I, m, support_type))
+
+    beta_l = np.full((len(L), n_modes), np.nan)
+    for name in ("simplySupported", "cantilever"):
+        beta_l[support_type == name] = beta_l_roots(name, n_modes)
+    stiffness = np.divide(E * I, m * L**4, out=np.full(L.shape, np.nan), where=(m > 0) & (L > 0))
+    return beta_l**2 * np.sqrt(stiffness)[:, None] / (2 * np.pi)
+
+
+def fundamental_frequencies(support_type, L, E, I, mass_per_length_kg_m):
+    """First natural frequency (Hz) for each case; see natural_frequencies."""
+    return natural_frequencies(support_type, L, E, I, mass_per_length_kg_m, n_modes=1)[:, 0]
+
+
+def _assemble(EI, m, le):
+    """Global stiffness and consistent mass triplets for a chain of Hermite beam elements."""
+    ne = len(EI)
+    k = np.array([[12, 6, -12, 6], [6, 4, -6, 2], [-12, -6, 12, -6], [6, 2, -6, 4]], dtype=float)
+    mm = np.array([[156, 22, 54, -13], [22, 4, 13, -3], [54, 13, 156, -22], [-13, -3, -22, 4]], dtype=float)
+    # Rotational DOF entries carry le (le^2 on the diagonal blocks)
+    rot = np.array([0, 1, 0, 1])
+    pow_le = rot[:, None] + rot[None, :] # Number of rotational indices in each entry
+    k_e = (EI / le**3)[:, None, None] * k * le[:, None, None] ** pow_le
+    m_e = (m * le / 420)[:, None, None] * mm * le[:, None, None] ** pow_le
+    dofs = 2 * np.arange(ne)[:, None] + np.arange(4)
+    rows = np.repeat(dofs, 4, axis=1).ravel()
+    cols = np.tile(dofs, (1, 4)).ravel()
+    return rows, cols, k_e.ravel(), m_e.ravel(), 2 * (ne + 1)
+
+
+def _fixed_dofs(support_type, n_dof):
+    if support_type == "simplySupported":
+        return [0, n_dof - 2] # Deflection at both ends
+    if support_type == "cantilever":
+        return [0, 1] # Deflection and rotation at the fixed (left) end
+    raise ValueError(f"Support type '{support_type}' not implemented")
+
+
+def _dense_eigh(K, M, n_modes):
+    """Generalized symmetric eigenproblem K v = w^2 M v via Cholesky of M (NumPy only)."""
+    C = np.linalg.cholesky(M)
+    C_inv = np.linalg.inv(C)
+    eigvals, eigvecs = np.linalg.eigh(C_inv @ K @ C_inv.T)
+    return eigvals[:n_modes], (C_inv.T @ eigvecs)[:, :n_modes]
+
+
+def fe_modal_analysis(support_type, L, EI, mass_per_length_kg_m, n_modes=3, num_elements=MODAL_ELEMENTS_DEFAULT):
+    """
+    First n_modes of a beam with (optionally) varying stiffness and mass.
+    Args:
+        support_type (str): "simplySupported" or "cantilever" (fixed at x = 0).
+        L (float): Span (m).
+        EI, mass_per_length_kg_m (float | array-like): Constant, or one value per element.
+        n_modes (int): Number of modes returned.
+        num_elements (int): Elements when EI and m are constant.
+    Returns:
+        dict: "frequencies_hz" (n_modes,), "x_m" (nodes), "mode_shapes" (n_modes, nodes),
+              normalized to a peak deflection of +1.
+    """
+    EI = np.atleast_1d(np.asarray(EI, dtype=float))
+    m = np.atleast_1d(np.asarray(mass_per_length_kg_m, dtype=float))
+    ne = max(len(EI), len(m)) if max(len(EI), len(m)) > 1 else int(num_elements)
+    EI = np.broadcast_to(EI, (ne,))
+    m = np.broadcast_to(m, (ne,))
+    le = np.full(ne, L / ne)
+
+    rows, cols, k_vals, m_vals, n_dof = _assemble(EI, m, le)
+    free = np.setdiff1d(np.arange(n_dof), _fixed_dofs(support_type, n_dof))
+    n_modes = min(n_modes, len(free))
+
+    try:
+        import scipy.sparse as sp
+        from scipy.sparse.linalg import eigsh
+    except ImportError:
+        sp = None
+
+    if sp is not None and n_modes < len(free) - 1:
+        K = sp.coo_matrix((k_vals, (rows, cols)), shape=(n_dof, n_dof)).tocsr()[free][:, free]
+        M = sp.coo_matrix((m_vals, (rows, cols)), shape=(n_dof, n_dof)).tocsr()[free][:, free]
+        # Shift-invert about 0 returns the lowest modes without factoring the full spectrum
+        eigvals, eigvecs = eigsh(K.tocsc(), k=n_modes, M=M.tocsc(), sigma=0, which="LM")
+        order = np.argsort(eigvals)
+        eigvals, eigvecs = eigvals[order], eigvecs[:, order]
+    else:
+        K = np.zeros((n_dof, n_dof))
+        M = np.zeros((n_dof, n_dof))
+        np.add.at(K, (rows, cols), k_vals)
+        np.add.at(M, (rows, cols), m_vals)
+        eigvals, eigvecs = _dense_eigh(K[np.ix_(free, free)], M[np.ix_(free, free)], n_modes)
+
+    full = np.zeros((n_dof, n_modes))
+    full[free] = eigvecs
+    shapes = full[0::2].T # Nodal deflections
+    peaks = shapes[np.arange(n_modes), np.argmax(np.abs(shapes), axis=1)]
+    shapes = shapes / np.where(peaks == 0, 1.0, peaks)[:, None]
+
+    return {
+        "frequencies_hz": np.sqrt(np.maximum(eigvals, 0.0)) / (2 * np.pi),
+        "x_m": np.linspace(0.0, L, ne + 1),
+        "mode_shapes": shapes,
+    }
+
+
+def beam_modal_analysis(beam_element, n_modes=3, num_elements=MODAL_ELEMENTS_DEFAULT):
+    """
+    Modal results for a Beam element: closed-form frequencies and FE mode shapes.
+    Returns:
+        dict: mass_per_length_kg_m, frequencies_hz (closed form), fe_frequencies_hz,
+              and mode_shapes as [{"mode", "frequency_hz", "x", "w"}].
+    """
+    cs = beam_element.cross_section
+    mat = beam_element.material
+    m = mat.density_kg_m3 * cs.area_m2
+    EI = mat.E_Pa * cs.Ix_m4
+    if m <= 0 or EI <= 0:
+        return {"mass_per_length_kg_m": m, "frequencies_hz": [], "fe_frequencies_hz": [], "mode_shapes": []}
+
+    closed_form = natural_frequencies(beam_element.support_type, beam_element.length_m, mat.E_Pa, cs.Ix_m4, m, n_modes)[0]
+    fe = fe_modal_analysis(beam_element.support_type, beam_element.length_m, EI, m, n_modes, num_elements)
+    return {
+        "mass_per_length_kg_m": m,
+        "frequencies_hz": closed_form.tolist(),
+        "fe_frequencies_hz": fe["frequencies_hz"].tolist(),
+        "mode_shapes": [
+            {"mode": i + 1, "frequency_hz": float(f), "x": fe["x_m"].tolist(), "w": shape.tolist()}
+            for i, (f, shape) in enumerate(zip(fe["frequencies_hz"], fe["mode_shapes"]))
+        ],
+    }
@@ -0,0 +1,284 @@
+# core/nonprismatic.py
+from functools import lru_cache
+
+import numpy as np
+
+from .materials import get_material
+from .batch_solvers import (rectangular_section_arrays, circular_section_arrays,
+                            DEFLECTION_LIMIT_SPAN_RATIO_BEAM, DEFLECTION_LIMIT_SPAN_RATIO_CANTILEVER)
+
+# Non-prismatic beams (tapered, haunched, stepped). The closed-form solvers
+# assume constant E and Ix; here the curvature kappa(x) = -M(x) / (E I(x)) is
+# integrated twice along the member with cumulative quadrature, vectorized over
+# stations (and over cases for deflection_from_curvature), and the support
+# conditions fix the integration constants:
+#   cantilever (fixed at x = 0):  w(0) = w'(0) = 0
+#   simply supported:             w(0) = w(L) = 0 (the chord is subtracted)
+# Sign conventions as beam_solvers: M positive sagging, w positive downward.
+#
+# The section is described by stations: (x_m, section_params_mm) knots, with
+# the dimensions linearly interpolated between knots. A repeated x is a step;
+# tapered_stations / haunched_stations / stepped_stations build common shapes.
+# Section properties along the member are evaluated in one array operation and
+# cached per (section type, stations, grid), so re-solving the same member for
+# other loads skips the section work.
+
+NONPRISMATIC_POINTS = 201
+SECTION_PROFILE_CACHE_SIZE = 128
+
+_SECTION_ARRAYS = {
+    "rectangular": rectangular_section_arrays,  # params (width_mm, height_mm)
+    "circular": circular_section_arrays,        # params (diameter_mm,)
+}
+
+
+def tapered_stations(length_m, params_start_mm, params_end_mm):
+    """Linear taper from params_start_mm at x = 0 to params_end_mm at x = L."""
+    return ((0.0, tuple(params_start_mm)), (float(length_m), tuple(params_end_mm)))
+
+
+def haunched_stations(length_m, haunch_length_m, params_support_mm, params_span_mm):
+    """Linear haunches of haunch_length_m at both ends, constant section in between."""
+    L, h = float(length_m), float(haunch_length_m)
+    if not 0 < h <= L / 2:
+        raise ValueError("Haunch length must be positive and at most half the span.")
+    support, span = tuple(params_support_mm), tuple(params_span_mm)
+    return ((0.0, support), (h, span), (L - h, span), (L, support))
+
+
+def stepped_stations(length_m, step_positions_m, params_mm_list):
+    """Piecewise constant section; params_mm_list has one entry more than step_positions_m."""
+    steps = [float(s) for s in step_positions_m]
+    if len(params_mm_list) != len(steps) + 1:
+        raise ValueError("Stepped member needs one section per segment (len(steps) + 1).")
+    bounds = [0.0] + steps + [float(length_m)]
+    stations = []
+    for start, end, params in zip(bounds[:-1], bounds[1:], params_mm_list):
+        stations += [(start, tuple(params)), (end, tuple(params))]
+    return tuple(stations)
+
+
+def _normalize_stations(stations, length_m):
+    stations = tuple((float(x), tuple(float(p) for p in params)) for x, params in stations)
+    xs = [x for x, _ in stations]
+    if len(stations) < 2 or xs[0] != 0.0 or abs(xs[-1] - length_m) > 1e-9 * max(length_m, 1.0):
+        raise ValueError("Stations must start at x = 0 and end at x = L.")
+    if any(b < a for a, b in zip(xs, xs[1:])):
+        raise ValueError("Station positions must be non-decreasing.")
+    return stations
+
+
+@lru_cache(maxsize=SECTION_PROFILE_CACHE_SIZE)
+def _profile_properties(section_type, stations, x_bytes, side_bytes):
+    x = np.frombuffer(x_bytes, dtype=float)
+    right = np.frombuffer(side_bytes, dtype=bool)
+    knots = np.array([s[0] for s in stations])
+    params = np.array([s[1] for s in stations])
+
+    # Segment of each station: at a step the left limit takes the segment ending
+    # there, the right limit the one starting there
+    seg = np.where(right, np.searchsorted(knots, x, side="right"), np.searchsorted(knots, x, side="left")) - 1
+    seg = np.clip(seg, 0, len(knots) - 2)
+    x0, x1 = knots[seg], knots[seg + 1]
+    t = np.divide(x - x0, x1 - x0, out=np.zeros_like(x), where=x1 > x0)
+    dims = params[seg] + t[:, None] * (params[seg + 1] - params[seg])
+
+    props = _SECTION_ARRAYS[section_type](*dims.T)
+    for arr in props.values():
+        arr.setflags(write=False) # Shared by every caller that hits the cache
+    return props
+
+
+def section_properties_along(section_type, stations, x, right_limit=None):
+    """
+    Section properties at many stations in one pass (cached).
+    Args:
+        section_type (str): "rectangular" or "circular".
+        stations (sequence): (x_m, section_params_mm) knots (see module header).
+        x (array-like): Positions along the member (m).
+        right_limit (array-like of bool): At a step, True takes the section just
+            right of x, False the one just left (default: right).
+    Returns:
+        dict: Read-only arrays "area_m2", "Ix_m4", "Iy_m4", "Zx_top_m3",
+            "Zx_bottom_m3", "tau_per_V", one value per x.
+    """
+    section_type = section_type.lower()
+    if section_type not in _SECTION_ARRAYS:
+        raise ValueError(f"Non-prismatic members support {sorted(_SECTION_ARRAYS)} sections, not '{section_type}'.")
+    x = np.ascontiguousarray(x, dtype=float)
+    right = np.ones(x.shape, dtype=bool) if right_limit is None else np.ascontiguousarray(right_limit, dtype=bool)
+    stations = tuple((float(sx), tuple(float(p) for p in params)) for sx, params in stations)
+    return _profile_properties(section_type, stations, x.tobytes(), right.tobytes())
+
+
+def clear_section_profile_cache():
+    _profile_properties.cache_clear()
+
+
+def member_grid(length_m, n_points=NONPRISMATIC_POINTS, breakpoints=()):
+    """
+    Integration stations: n_points evenly spaced, plus every breakpoint twice
+    (its left and right limit), so steps in EI and jumps in shear are resolved.
+    Returns:
+        tuple: (x, right_limit) arrays, sorted by position.
+    """
+    L = float(length_m)
+    x = np.linspace(0.0, L, n_points)
+    bp = np.unique([b for b in breakpoints if 0.0 < b < L])
+    if len(bp):
+        x = x[np.min(np.abs(x[:, None] - bp[None, :]), axis=1) > 1e-12 * L]
+    x = np.concatenate([x, bp, bp])
+    right = np.concatenate([np.ones(len(x) - 2 * len(bp), dtype=bool), np.zeros(len(bp), dtype=bool),
+                            np.ones(len(bp), dtype=bool)])
+    order = np.lexsort((right, x))
+    return x[order], right[order]
+
+
+def shear_moment_along(support_type, load_type, length_m, load, x, right_limit=None, load_pos_a_m=None):
+    """
+    Shear and moment at the stations for the statically determinate cases.
+    Args:
+        support_type, load_type (str): As solve_beam.
+        load (float): Point load (N) or UDL (N/m), positive downwards.
+        x, right_limit (array-like): Stations (see member_grid); right_limit picks
+            the side of a point load's shear jump.
+    Returns:
+        tuple: (V, M) arrays.
+    """
+    L = float(length_m)
+    x = np.asarray(x, dtype=float)
+    right = np.ones(x.shape, dtype=bool) if right_limit is None else np.asarray(right_limit, dtype=bool)
+    if support_type == "simplySupported" and load_type == "pointLoad":
+        a = L / 2 if load_pos_a_m is None else float(load_pos_a_m)
+        R_A = load * (L - a) / L
+        past = (x > a) | ((x == a) & right)
+        return R_A - load * past, R_A * x - load * np.maximum(x - a, 0.0)
+    if support_type == "simplySupported" and load_type == "udl":
+        return load * (L / 2 - x), load * x * (L - x) / 2
+    if support_type == "cantilever" and load_type == "pointLoadEnd":
+        return np.full(x.shape, float(load)), -load * (L - x)
+    if support_type == "cantilever" and load_type == "udl":
+        return load * (L - x), -load * (L - x) ** 2 / 2
+    raise ValueError(f"Unsupported non-prismatic case: {support_type} / {load_type}")
+
+
+def deflection_from_curvature(x, kappa, cantilever):
+    """
+    Slope and deflection from curvature by cumulative quadrature, for many cases at once.
+    Slope is the cumulative trapezoid of kappa; deflection adds
+    h * theta_i + h^2 (2 kappa_i + kappa_i+1) / 6 per interval, which is exact
+    when kappa is piecewise linear (point loads on members of constant EI).
+    Args:
+        x (array-like): Stations (m), (n_points,) or (n_cases, n_points); repeated
+            stations (zero-length intervals) carry jumps in kappa.
+        kappa (array-like): Curvature w'' (1/m), (n_cases, n_points) or (n_points,).
+        cantilever (array-like of bool): Per case; True fixes w = w' = 0 at x = 0,
+            False pins both ends (w(0) = w(L) = 0).
+    Returns:
+        tuple: (theta, w) arrays shaped like kappa.
+    """
+    kappa = np.asarray(kappa, dtype=float)
+    x = np.broadcast_to(np.asarray(x, dtype=float), kappa.shape)
+    h = np.diff(x, axis=-1)
+    k0, k1 = kappa[..., :-1], kappa[..., 1:]
+    zeros = np.zeros(kappa.shape[:-1] + (1,))
+
+    theta = np.concatenate([zeros, np.cumsum(h * (k0 + k1) / 2, axis=-1)], axis=-1)
+    w = np.concatenate([zeros, np.cumsum(h * theta[..., :-1] + h**2 * (2 * k0 + k1) / 6, axis=-1)], axis=-1)
+
+    # Simply supported: subtract the chord (a rigid rotation about x = 0)
+    pinned = ~np.asarray(cantilever, dtype=bool)[..., None]
+    span = x[..., -1:] - x[..., :1]
+    rotation = np.divide(w[..., -1:], span, out=np.zeros_like(span), where=span > 0) * pinned
+    return theta - rotation, w - rotation * (x - x[..., :1])
+
+
+def solve_nonprismatic_beam(support_type, load_type, length_m, material_name, section_type, stations,
+                            load_N, load_pos_a_m=None, n_points=NONPRISMATIC_POINTS):
+    """
+    Solves a tapered, haunched or stepped beam by integrating M / EI(x).
+    Args:
+        support_type (str): "simplySupported" or "cantilever".
+        load_type (str): "pointLoad", "pointLoadEnd" or "udl".
+        length_m (float): Span (m).
+        material_name (str): Key in MATERIALS_LIB.
+        section_type (str): "rectangular" or "circular".
+        stations (sequence): (x_m, section_params_mm) knots (see module header).
+        load_N (float): Point load (N) or UDL (N/m), positive downwards.
+        load_pos_a_m (float): Point-load position for simply supported point loads.
+        n_points (int): Evenly spaced stations (breakpoints are added on top).
+    Returns:
+        dict: Same layout as solve_beam (reactions, diagram points, extremes,
+            failure_checks), plus "section_profile" points {"x", "Ix_m4"} and the
+            stations of peak bending stress and deflection.
+    """
+    L = float(length_m)
+    material = get_material(material_name)
+    stations = _normalize_stations(stations, L)
+    cantilever = support_type == "cantilever"
+    a = None
+    if support_type == "simplySupported" and load_type == "pointLoad":
+        a = L / 2 if load_pos_a_m is None else float(load_pos_a_m)
+        if not 0 < a < L:
+            raise ValueError("Load position 'a' must be between 0 and L (exclusive).")
+
+    breakpoints = [sx for sx, _ in stations[1:-1]] + ([a] if a is not None else [])
+    x, right = member_grid(L, n_points, breakpoints)
+    V, M = shear_moment_along(support_type, load_type, L, load_N, x, right, a)
+    sec = section_properties_along(section_type, stations, x, right)
+    EI = material.E_Pa * sec["Ix_m4"]
+    if np.any(EI <= 0):
+        raise ValueError("Section stiffness must be positive along the whole member.")
+    _, w = deflection_from_curvature(x, -M / EI, cantilever)
+
+    results = {"failure_checks": {}}
+    if cantilever:
+        results["reactions"] = {"R_A_vertical_N": float(V[0]), "M_A_moment_Nm": float(M[0])}
+    else:
+        results["reactions"] = {"R_A_N": float(V[0]), "R_B_N": float(-V[-1])}
+    results["sfd_points"] = [{"x": xi, "v": vi} for xi, vi in zip(x.tolist(), V.tolist())]
+    results["bmd_points"] = [{"x": xi, "m": mi} for xi, mi in zip(x.tolist(), M.tolist())]
+    results["deflection_points"] = [{"x": xi, "d": di} for xi, di in zip(x.tolist(), w.tolist())]
+    results["section_profile"] = [{"x": xi, "Ix_m4": Ii} for xi, Ii in zip(x.tolist(), sec["Ix_m4"].tolist())]
+
+    results["max_shear_N"], results["min_shear_N"] = float(V.max()), float(V.min())
+    results["max_moment_Nm"], results["min_moment_Nm"] = float(M.max()), float(M.min())
+    results["max_deflection_m"], results["min_deflection_m"] = float(w.max()), float(w.min())
+
+    # Fibre stresses vary with Z(x), so the peak need not sit at the peak moment
+    sigma_bottom = np.divide(M, sec["Zx_bottom_m3"], out=np.zeros_like(M), where=sec["Zx_bottom_m3"] > 0)
+    sigma_top = np.divide(-M, sec["Zx_top_m3"], out=np.zeros_like(M), where=sec["Zx_top_m3"] > 0)
+    sigma = np.maximum(sigma_bottom, sigma_top)
+    results["max_bending_stress_Pa"] = float(sigma.max())
+    results["min_bending_stress_Pa"] = float(np.minimum(sigma_bottom, sigma_top).min())
+    tau = np.abs(V) * sec["tau_per_V"]
+    results["max_shear_stress_Pa"] = float(tau.max())
+    results["governing_bending_stress_x_m"] = float(x[np.argmax(np.abs(np.stack([sigma_bottom, sigma_top])).max(axis=0))])
+    results["governing_deflection_x_m"] = float(x[np.argmax(np.abs(w))])
+
+    sigma_gov = max(abs(results["max_bending_stress_Pa"]), abs(results["min_bending_stress_Pa"]))
+    bending_ratio = sigma_gov / material.Fy_Pa if material.Fy_Pa > 0 else float('inf')
+    results["failure_checks"]["bending_yield"] = {
+        "demand_Pa": sigma_gov, "capacity_Pa": material.Fy_Pa, "ratio": bending_ratio,
+        "status": "FAIL" if bending_ratio >= 1.0 else "PASS",
+    }
+    shear_ratio = results["max_shear_stress_Pa"] / material.Fsy_Pa if material.Fsy_Pa > 0 else float('inf')
+    results["failure_checks"]["shear_yield"] = {
+        "demand_Pa": results["max_shear_stress_Pa"], "capacity_Pa": material.Fsy_Pa, "ratio": shear_ratio,
+        "status": "FAIL" if shear_ratio >= 1.0 else "PASS",
+    }
+    if cantilever:
+        span_ratio = getattr(material, 'default_deflection_limit_cantilever_total_load_span_ratio',
+                             DEFLECTION_LIMIT_SPAN_RATIO_CANTILEVER)
+    else:
+        span_ratio = getattr(material, 'default_deflection_limit_beams_total_load_span_ratio',
+                             DEFLECTION_LIMIT_SPAN_RATIO_BEAM)
+    max_abs_deflection = max(abs(results["max_deflection_m"]), abs(results["min_deflection_m"]))
+    allowable = L / span_ratio if span_ratio > 0 else float('inf')
+    deflection_ratio = max_abs_deflection / allowable if allowable > 0 else 0
+    results["failure_checks"]["deflection_limit"] = {
+        "demand_m": max_abs_deflection, "limit_m": allowable, "limit_description": f"L/{span_ratio}",
+        "ratio": deflection_ratio,
+        "status": "FAIL" if deflection_ratio >= 1.0 else "PASS",
+    }
+    return results
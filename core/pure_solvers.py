@@ -0,0 +1,136 @@
+# core/pure_solvers.py
+import copy
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+
+from .materials import Material, get_material
+from .cross_sections import CrossSection, create_cross_section
+from .beam_solvers import compute_beam_results
+from .column_solvers import compute_column_results
+
+# Reentrant solver API: immutable inputs in, new immutable results out.
+# A spec is a frozen value holding everything a solve reads. Its material and
+# cross-section are private read-only snapshots (not the shared MATERIALS_LIB
+# entry or the caller's element objects), so nothing can change a spec after
+# it is built and one spec can be solved from any number of threads at once -
+# including on free-threaded CPython, where nothing here relies on the GIL.
+# Results are deep-frozen: mappings become read-only MappingProxyType views,
+# lists become tuples and NumPy scalars plain floats. thaw_results gives
+# plain dicts back (e.g. for JSON).
+
+
+@lru_cache(maxsize=None)
+def _snapshot_type(cls):
+    """Read-only subclass of a Material / CrossSection class (methods and isinstance unchanged)."""
+    def _read_only(self, name, *args):
+        raise AttributeError(f"'{cls.__name__}' snapshot held by a spec is read-only (cannot set '{name}')")
+
+    def __reduce__(self): # Picklable, although the class is created here
+        return (_restore_snapshot, (cls, self.__dict__))
+
+    return type(cls.__name__, (cls,), {"__setattr__": _read_only, "__delattr__": _read_only,
+                                       "__reduce__": __reduce__, "_is_snapshot": True})
+
+
+def _restore_snapshot(cls, state):
+    snapshot = object.__new__(_snapshot_type(cls))
+    snapshot.__dict__.update(state)
+    return snapshot
+
+
+def _snapshot(obj):
+    """Private read-only copy of a material or cross-section; snapshots are reused as is."""
+    if getattr(obj, "_is_snapshot", False):
+        return obj
+    state = copy.deepcopy(obj.__dict__)
+    for value in state.values():
+        if isinstance(value, np.ndarray):
+            value.setflags(write=False)
+    return _restore_snapshot(type(obj), state)
+
+
+@dataclass(frozen=True)
+class BeamSpec:
+    length_m: float
+    material: Material
+    cross_section: CrossSection
+    support_type: str
+
+    def __post_init__(self):
+        object.__setattr__(self, "material", _snapshot(self.material))
+        object.__setattr__(self, "cross_section", _snapshot(self.cross_section))
+
+    @classmethod
+    def from_inputs(cls, length_m, material_name, section_type, section_params_mm, support_type):
+        return cls(float(length_m), get_material(material_name),
+                   create_cross_section(section_type, section_params_mm), support_type)
+
+    @classmethod
+    def from_element(cls, beam_element):
+        return cls(beam_element.length_m, beam_element.material, beam_element.cross_section, beam_element.support_type)
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    length_m: float
+    material: Material
+    cross_section: CrossSection
+    Kx: float = 1.0
+    Ky: float = 1.0
+
+    def __post_init__(self):
+        object.__setattr__(self, "material", _snapshot(self.material))
+        object.__setattr__(self, "cross_section", _snapshot(self.cross_section))
+
+    @classmethod
+    def from_inputs(cls, length_m, material_name, section_type, section_params_mm, Kx=1.0, Ky=1.0):
+        return cls(float(length_m), get_material(material_name),
+                   create_cross_section(section_type, section_params_mm), float(Kx), float(Ky))
+
+    @classmethod
+    def from_element(cls, column_element):
+        return cls(column_element.length_m, column_element.material, column_element.cross_section,
+                   column_element.Kx, column_element.Ky)
+
+
+def freeze_results(value):
+    """Deep read-only copy of a results structure."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze_results(v) for key, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_results(v) for v in value)
+    if isinstance(value, np.ndarray):
+        return tuple(value.tolist())
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def thaw_results(value):
+    """Plain (mutable, JSON-serializable) copy of frozen results."""
+    if isinstance(value, (MappingProxyType, dict)):
+        return {key: thaw_results(v) for key, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw_results(v) for v in value]
+    return value
+
+
+def solve_beam_spec(spec, load_type, load_N, load_pos_a_m=None):
+    """
+    Solves a BeamSpec; same cases and result layout as beam_solvers.solve_beam.
+    Returns:
+        MappingProxyType: Frozen results
+    """
+    return freeze_results(compute_beam_results(spec, load_type, load_N, load_pos_a_m))
+
+
+def solve_column_spec(spec, axial_load_P_N):
+    """
+    Solves a ColumnSpec; same result layout as solve_column_axial_buckling.
+    Returns:
+        MappingProxyType: Frozen results
+    """
+    return freeze_results(compute_column_results(spec, axial_load_P_N))
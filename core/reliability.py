@@ -0,0 +1,307 @@
+# core/reliability.py
+import math
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+import numpy as np
+
+from .materials import get_material
+from .batch_solvers import (
+    rectangular_section_arrays, circular_section_arrays, section_arrays_from_objects,
+    solve_beam_cases, solve_column_cases,
+)
+from .cross_sections import create_cross_section
+from .beam_solvers import is_beam_case_supported
+
+try: # Optional: exact normal CDF; the erfc fallback is slower but as accurate
+    from scipy.special import ndtr as _ndtr
+except ImportError:
+    _ndtr = None
+
+# Monte Carlo reliability analysis. A case is described with the same keys and
+# units as the /calculate payload; any of its inputs can be given a distribution:
+#   "length", "pointLoad", "udlValue", "pointLoadPositionRatio", "axialLoad",
+#   "effLengthFactorKx", "effLengthFactorKy", "sectionParams.0", "sectionParams.1",
+#   "youngs_modulus_E_GPa", "yield_strength_MPa" (material properties).
+# Only inputs the case actually uses may be given a distribution; unknown or
+# unused names (and support / load combinations /calculate rejects) raise ValueError.
+# Distributions: {"dist": "normal", "mean", "std"}, {"dist": "lognormal", "mean", "std"},
+#                {"dist": "uniform", "low", "high"}, {"dist": "gumbel", "mean", "std"}.
+#
+# Every variable is sampled through a standard normal variate z (x = T(z)), which
+# makes importance sampling generic: shifting z by a vector s gives weights
+# w = phi(z) / phi(z - s) = exp(-s.z + s.s / 2) for any mix of distributions.
+
+MC_CHUNK_SIZE = 200_000
+EULER_GAMMA = 0.5772156649015329
+
+BEAM_CHECKS = ("bending_yield", "shear_yield", "deflection_limit")
+COLUMN_CHECKS = ("yielding_crushing", "euler_buckling")
+
+
+_erfc = np.vectorize(math.erfc, otypes=[float])
+
+
+def _std_normal_cdf(z):
+    """
+    Vectorized standard normal CDF with full relative accuracy in both tails
+    (the lower tail via erfc, not 1 - erf), which the failure region lives in.
+    """
+    if _ndtr is not None:
+        return _ndtr(z)
+    return 0.5 * _erfc(-np.asarray(z, dtype=float) / math.sqrt(2.0))
+
+
+def _transform(spec, z):
+    """Maps standard normal samples z to the variable's distribution."""
+    dist = spec["dist"]
+    if dist == "normal":
+        return spec["mean"] + spec["std"] * z
+    if dist == "lognormal":
+        s2 = math.log(1.0 + (spec["std"] / spec["mean"]) ** 2)
+        return np.exp(math.log(spec["mean"]) - 0.5 * s2 + math.sqrt(s2) * z)
+    if dist == "uniform":
+        u = np.clip(_std_normal_cdf(z), 1e-16, 1 - 1e-16)
+        return spec["low"] + (spec["high"] - spec["low"]) * u
+    if dist == "gumbel": # Maximum (e.g. annual load) distribution
+        beta = spec["std"] * math.sqrt(6.0) / math.pi
+        q = np.clip(_std_normal_cdf(-z), 1e-300, 1 - 1e-16) # 1 - u, exact in the upper (load) tail
+        return spec["mean"] - EULER_GAMMA * beta - beta * np.log(-np.log1p(-q))
+    raise ValueError(f"Unknown distribution '{dist}'")
+
+
+def _nominal_inputs(case):
+    material = get_material(case.get("material"))
+    params = [float(p) for p in case.get("sectionParams", [])]
+    nominal = {
+        "length": float(case["length"]),
+        "youngs_modulus_E_GPa": material.E_Pa / 1e9,
+        "yield_strength_MPa": material.Fy_Pa / 1e6,
+        "pointLoadPositionRatio": float(case.get("pointLoadPositionRatio", 0.5)),
+        "effLengthFactorKx": float(case.get("effLengthFactorKx", 1.0)),
+        "effLengthFactorKy": float(case.get("effLengthFactorKy", 1.0)),
+    }
+    for key in ("pointLoad", "udlValue", "axialLoad"):
+        if case.get(key) is not None:
+            nominal[key] = float(case[key])
+    for i, p in enumerate(params):
+        nominal[f"sectionParams.{i}"] = p
+    return nominal
+
+
+def _used_variables(case):
+    """Names of the inputs the case's solve reads (the ones worth sampling)."""
+    element_type = case.get("elementType", "beam")
+    used = {"length", "youngs_modulus_E_GPa", "yield_strength_MPa"}
+    if element_type == "beam":
+        support_type, load_type = case.get("beamSupportType"), case.get("beamLoadType")
+        if not is_beam_case_supported(support_type, load_type):
+            raise ValueError(f"Load type '{load_type}' not implemented for support type '{support_type}'")
+        used.add("udlValue" if load_type == "udl" else "pointLoad")
+        if load_type == "pointLoad":
+            used.add("pointLoadPositionRatio")
+    elif element_type == "column":
+        used |= {"axialLoad", "effLengthFactorKx", "effLengthFactorKy"}
+    else:
+        raise ValueError(f"Reliability analysis supports beam and column elements, not '{element_type}'")
+    n_params = {"rectangular": 2, "circular": 1}.get(case.get("sectionType"), 0) # Other geometry is fixed
+    used |= {f"sectionParams.{i}" for i in range(n_params)}
+    return used
+
+
+def _check_variables(case, variables):
+    known = set(_nominal_inputs(case))
+    used = _used_variables(case)
+    for name in variables:
+        if name not in known:
+            raise ValueError(f"Unknown variable '{name}' (case inputs: {', '.join(sorted(known))})")
+        if name not in used:
+            raise ValueError(f"Variable '{name}' has no effect on this case")
+
+
+def _check_shift(importance_shift, variables):
+    """Validates an explicit importance shift; returns it as name -> float."""
+    if not isinstance(importance_shift, dict):
+        raise ValueError('Importance shift must be "auto" or an object of variable name -> shift')
+    shift = {}
+    for name, value in importance_shift.items():
+        if name not in variables:
+            raise ValueError(f"Importance shift given for '{name}', which is not a random variable")
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+            raise ValueError(f"Importance shift for '{name}' must be a finite number")
+        shift[name] = float(value)
+    return shift
+
+
+def evaluate_case_samples(case, inputs):
+    """
+    Evaluates the check ratios for arrays of inputs (nominal values broadcast).
+    Args:
+        case (dict): /calculate-style case.
+        inputs (dict): Variable name -> array (or scalar) in payload units.
+    Returns:
+        dict: Check name -> ratio array.
+    """
+    n = max(np.size(v) for v in inputs.values())
+    L = np.asarray(inputs["length"], dtype=float)
+    E = np.asarray(inputs["youngs_modulus_E_GPa"], dtype=float) * 1e9
+    Fy = np.asarray(inputs["yield_strength_MPa"], dtype=float) * 1e6
+    Fsy = Fy / math.sqrt(3)
+
+    section_type = case.get("sectionType")
+    if section_type == "rectangular":
+        section = rectangular_section_arrays(inputs["sectionParams.0"], inputs["sectionParams.1"])
+    elif section_type == "circular":
+        section = circular_section_arrays(inputs["sectionParams.0"])
+    else: # Geometry is fixed for other section types
+        section = section_arrays_from_objects([create_cross_section(section_type, case.get("sectionParams", []))])
+        section = {k: v[0] for k, v in section.items()}
+
+    if case.get("elementType", "beam") == "beam":
+        load_type = case.get("beamLoadType")
+        load = inputs["udlValue"] if load_type == "udl" else inputs["pointLoad"]
+        res = solve_beam_cases(
+            np.full(n, case.get("beamSupportType")), np.full(n, load_type), L, E, Fy, Fsy, section,
+            np.asarray(load, dtype=float) * 1000, L * np.asarray(inputs["pointLoadPositionRatio"], dtype=float))
+        checks = BEAM_CHECKS
+    else:
+        res = solve_column_cases(L, E, Fy, section["area_m2"], section["Ix_m4"], section["Iy_m4"],
+                                 inputs["effLengthFactorKx"], inputs["effLengthFactorKy"],
+                                 np.asarray(inputs["axialLoad"], dtype=float) * 1000)
+        checks = COLUMN_CHECKS
+    ratios = {check: np.broadcast_to(res[f"{check}.ratio"], (n,)) for check in checks}
+    for check, ratio in ratios.items():
+        # NaN >= 1 is False, so an undefined ratio would silently count as safe
+        # (inf, from a capacity <= 0, does count as a failure)
+        if np.isnan(ratio).any():
+            raise ValueError(f"Check '{check}' is undefined for some samples (inputs outside the solver's range)")
+    return ratios
+
+
+def _run_chunk(case, variables, n, seed_seq, shift, return_samples=False):
+    """Samples and evaluates one chunk; returns per-check sums for the estimators."""
+    rng = np.random.default_rng(seed_seq)
+    names = list(variables)
+    z = rng.standard_normal((len(names), n))
+    if shift is not None:
+        s = np.array([shift.get(name, 0.0) for name in names])[:, None]
+        z = z + s
+        w = np.exp(-(s * z).sum(axis=0) + 0.5 * float((s * s).sum()))
+    else:
+        w = None
+
+    inputs = _nominal_inputs(case)
+    for i, name in enumerate(names):
+        inputs[name] = _transform(variables[name], z[i])
+    ratios = evaluate_case_samples(case, inputs)
+
+    failed_any = np.zeros(n, dtype=bool)
+    sums = {}
+    for check, ratio in list(ratios.items()) + [("any", None)]:
+        failed = failed_any if ratio is None else ratio >= 1.0
+        if ratio is not None:
+            failed_any |= failed
+        contrib = failed.astype(float) if w is None else np.where(failed, w, 0.0)
+        sums[check] = (float(contrib.sum()), float((contrib * contrib).sum()), int(failed.sum()))
+    if return_samples:
+        max_ratio = np.max(np.vstack(list(ratios.values())), axis=0)
+        return n, sums, (z, max_ratio, np.ones(n) if w is None else w)
+    return n, sums, None
+
+
+def _wilson_interval(k, n, z_crit):
+    """Wilson score interval for a binomial proportion (well behaved at k = 0)."""
+    if n == 0:
+        return 0.0, 1.0
+    p = k / n
+    denom = 1 + z_crit**2 / n
+    centre = (p + z_crit**2 / (2 * n)) / denom
+    half = z_crit * math.sqrt(p * (1 - p) / n + z_crit**2 / (4 * n * n)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+def _auto_shift(case, variables, seed_seq, pilot_samples, elite_fraction=0.1, max_iterations=10):
+    """
+    Importance-sampling shift by the cross-entropy method: pilot runs move the
+    sampling mean (in standard normal space) to the likelihood-weighted mean of
+    the most critical samples, raising the intermediate threshold on the
+    governing ratio until it reaches failure (ratio = 1).
+    """
+    names = list(variables)
+    shift = None
+    for seq in seed_seq.spawn(max_iterations):
+        _, _, (z, max_ratio, w) = _run_chunk(case, variables, pilot_samples, seq, shift, return_samples=True)
+        threshold = min(1.0, float(np.quantile(max_ratio, 1.0 - elite_fraction)))
+        elite = max_ratio >= threshold
+        centre = (z[:, elite] * w[elite]).sum(axis=1) / w[elite].sum()
+        shift = {name: float(centre[i]) for i, name in enumerate(names)}
+        if threshold >= 1.0:
+            break
+    return shift
+
+
+def run_monte_carlo(case, variables, n_samples=1_000_000, seed=None, chunk_size=MC_CHUNK_SIZE,
+                    workers=1, importance_shift=None, pilot_samples=10_000, confidence=0.95):
+    """
+    Probability of failure per check by (importance-sampled) Monte Carlo.
+    Args:
+        case (dict): /calculate-style case (nominal values).
+        variables (dict): Variable name -> distribution spec (see module header).
+        n_samples (int): Total samples, drawn in chunks of chunk_size.
+        seed (int): Root seed. Each chunk gets its own spawned stream, so results
+            are reproducible and independent of the number of workers.
+        workers (int): Processes evaluating chunks in parallel.
+        importance_shift (dict | "auto"): Shift of the sampling density in standard
+            normal space per variable, or "auto" to estimate it from a pilot run.
+        confidence (float): Confidence level of the reported intervals.
+    Returns:
+        dict: "checks": {check: {"pf", "ci_low", "ci_high", "std_error", "n_failures"}}
+            including the system check "any", plus sampling metadata.
+    """
+    if not isinstance(variables, dict):
+        raise ValueError("Variables must be an object of variable name -> distribution")
+    _check_variables(case, variables)
+    for name, spec in variables.items():
+        _transform(spec, np.zeros(1)) # Validates the spec early
+    root = np.random.SeedSequence(seed)
+    pilot_seq, sampling_seq = root.spawn(2)
+    if importance_shift == "auto":
+        shift = _auto_shift(case, variables, pilot_seq, pilot_samples)
+    else:
+        shift = None if importance_shift is None else _check_shift(importance_shift, variables)
+
+    sizes = [chunk_size] * (n_samples // chunk_size) + ([n_samples % chunk_size] if n_samples % chunk_size else [])
+    chunk_seqs = sampling_seq.spawn(len(sizes))
+    jobs = [(case, variables, size, seq, shift) for size, seq in zip(sizes, chunk_seqs)]
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            outputs = list(pool.map(_run_chunk, *zip(*jobs)))
+    else:
+        outputs = [_run_chunk(*job) for job in jobs]
+
+    z_crit = NormalDist().inv_cdf(0.5 + confidence / 2)
+    totals = {}
+    for _, sums, _ in outputs:
+        for check, (s1, s2, k) in sums.items():
+            t = totals.setdefault(check, [0.0, 0.0, 0])
+            t[0] += s1; t[1] += s2; t[2] += k
+
+    checks = {}
+    for check, (s1, s2, k) in totals.items():
+        pf = s1 / n_samples
+        variance = max(s2 / n_samples - pf * pf, 0.0) / n_samples
+        std_error = math.sqrt(variance)
+        if shift is None:
+            ci_low, ci_high = _wilson_interval(k, n_samples, z_crit)
+        else:
+            ci_low, ci_high = max(0.0, pf - z_crit * std_error), pf + z_crit * std_error
+        checks[check] = {
+            "pf": pf, "ci_low": ci_low, "ci_high": ci_high, "std_error": std_error,
+            "cov": std_error / pf if pf > 0 else float("inf"),
+            "reliability_index_beta": -NormalDist().inv_cdf(pf) if 0 < pf < 1 else (float("inf") if pf == 0 else float("-inf")),
+            "n_failures": k,
+        }
+    return {
+        "checks": checks, "n_samples": n_samples, "seed": seed, "confidence": confidence,
+        "importance_shift": shift,
+    }
@@ -0,0 +1,127 @@
+# core/response_cache.py
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .beam_solvers import compute_beam_results, solve_beam
+
+# Every beam case is linear in the load magnitude, so a solve for load F is the
+# solve for a unit load of the same sign scaled by |F|: diagrams, reactions,
+# extreme values, stresses, check demands and ratios scale; capacities and
+# limits do not. (Keeping the sign in the key preserves which extreme is the
+# max/min and which fibre governs for unsymmetric sections.) The cache stores
+# those unit-load responses as arrays, keyed on everything else the solvers
+# read, so a load-only change costs a multiply and the check evaluation.
+
+UNIT_LOAD_CACHE_SIZE = 512
+
+_DIAGRAMS = (("sfd_points", "v"), ("bmd_points", "m"), ("deflection_points", "d"))
+_UNSCALED_CHECK_FIELDS = ("capacity_Pa", "capacity_N", "limit_m", "limit_description", "note")
+
+
+def _beam_key(beam_element, load_type, load_pos_a_m, sign):
+    cs = beam_element.cross_section
+    mat = beam_element.material
+    section = (cs.type_name, cs.area_m2, cs.Ix_m4, cs.Zx_top_m3, cs.Zx_bottom_m3,
+               getattr(cs, "Qx_max_m3", None), getattr(cs, "bx_at_Qx_max_m", None))
+    material = (mat.name, mat.E_Pa, mat.Fy_Pa, mat.Fsy_Pa)
+    return (beam_element.support_type, load_type, beam_element.length_m, load_pos_a_m, sign, section, material)
+
+
+def _to_unit_response(results):
+    """Splits solver results into arrays (diagrams) and the remaining scalar fields."""
+    unit = {"diagrams": {}, "fields": {}}
+    for key, value_key in _DIAGRAMS:
+        points = results[key]
+        unit["diagrams"][key] = (
+            np.array([float(p["x"]) for p in points]),
+            np.array([float(p[value_key]) for p in points]),
+        )
+    for key, value in results.items():
+        if key not in unit["diagrams"]:
+            unit["fields"][key] = value
+    return unit
+
+
+def _scale_value(value, scale):
+    return float(value) * scale
+
+
+def _scaled_results(unit, scale):
+    results = {}
+    for (key, value_key), (x, values) in zip(_DIAGRAMS, unit["diagrams"].values()):
+        results[key] = [{"x": xi, value_key: vi} for xi, vi in zip(x.tolist(), (values * scale).tolist())]
+    for key, value in unit["fields"].items():
+        if key == "failure_checks":
+            checks = {}
+            for name, check in value.items():
+                scaled = {}
+                for field, v in check.items():
+                    if field in _UNSCALED_CHECK_FIELDS or not isinstance(v, (int, float, np.number)):
+                        scaled[field] = v
+                    else:
+                        scaled[field] = _scale_value(v, scale)
+                if "ratio" in scaled:
+                    scaled["status"] = "FAIL" if scaled["ratio"] >= 1.0 else "PASS"
+                checks[name] = scaled
+            results[key] = checks
+        elif isinstance(value, dict):
+            results[key] = {k: _scale_value(v, scale) for k, v in value.items()}
+        elif isinstance(value, (int, float, np.number)):
+            results[key] = _scale_value(value, scale)
+        else:
+            results[key] = value
+    return results
+
+
+class UnitLoadResponseCache:
+    """
+    LRU cache of unit-load beam responses (thread-safe).
+    solve() has the signature and result layout of beam_solvers.solve_beam.
+    """
+
+    def __init__(self, maxsize=UNIT_LOAD_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def solve(self, beam_element, load_type, load_N, load_pos_a_m=None):
+        if load_N == 0: # Degenerate diagrams (no shear jump); not worth caching
+            return solve_beam(beam_element, load_type, load_N, load_pos_a_m)
+        sign = -1.0 if load_N < 0 else 1.0
+        key = _beam_key(beam_element, load_type, load_pos_a_m, sign)
+        with self._lock:
+            unit = self._entries.get(key)
+            if unit is not None:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+        if unit is None:
+            unit = _to_unit_response(compute_beam_results(beam_element, load_type, sign, load_pos_a_m))
+            with self._lock:
+                self.stats["misses"] += 1
+                self._entries[key] = unit
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.stats["evictions"] += 1
+
+        results = _scaled_results(unit, abs(load_N))
+        beam_element.results = results
+        return results
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self.stats, size=len(self._entries), maxsize=self.maxsize)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+
+# Shared by the web app; solvers stay usable without it.
+unit_load_cache = UnitLoadResponseCache()
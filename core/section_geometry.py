@@ -0,0 +1,321 @@
+# core/section_geometry.py
+import math
+from functools import lru_cache
+
+import numpy as np
+
+from .cross_sections import CrossSection
+
+# General section property engine for arbitrary polygons (with holes) and
+# multi-material composites. Every property is an area integral which Green's
+# theorem turns into a boundary integral of the form  ∮ f(x, y) dy.  Along a
+# straight edge x is linear in y, so each integrand is a polynomial of degree
+# <= 3 and Simpson's rule over the edge is exact. All edges are evaluated in one
+# array operation, and the same kernel clipped at a horizontal level gives the
+# "area above y" quantities needed for Q(y), b(y) and the plastic neutral axis.
+
+PROFILE_LEVELS_DEFAULT = 101
+
+
+def _as_ring(vertices):
+    """Returns an (n, 2) float array of a closed ring's vertices (without repeat of the first point)."""
+    ring = np.asarray(vertices, dtype=float).reshape(-1, 2)
+    if len(ring) > 1 and np.allclose(ring[0], ring[-1]):
+        ring = ring[:-1]
+    if len(ring) < 3:
+        raise ValueError("A polygon needs at least 3 vertices.")
+    return ring
+
+
+def _signed_area(ring):
+    x, y = ring[:, 0], ring[:, 1]
+    return 0.5 * np.sum(x * np.roll(y, -1) - np.roll(x, -1) * y)
+
+
+def _oriented(ring, counter_clockwise):
+    """Returns the ring with the requested orientation (CCW for solids, CW for holes)."""
+    if (_signed_area(ring) > 0) != counter_clockwise:
+        return ring[::-1]
+    return ring
+
+
+def _edges(ring):
+    """Returns x0, y0, x1, y1 arrays for the ring's edges."""
+    nxt = np.roll(ring, -1, axis=0)
+    return ring[:, 0], ring[:, 1], nxt[:, 0], nxt[:, 1]
+
+
+def _boundary_moments(x0, y0, x1, y1, weight):
+    """
+    Exact area integrals of a set of oriented edges via ∮ f dy with Simpson's rule.
+    Args:
+        x0, y0, x1, y1 (np.ndarray): Edge end points, shape (..., n_edges).
+        weight (np.ndarray): Modulus ratio of the region each edge bounds, shape (n_edges,).
+    Returns:
+        tuple: (A, Sx, Sy, Ixx, Iyy, Ixy) summed over the last axis, where
+            Sx = ∫y dA, Sy = ∫x dA, Ixx = ∫y² dA, Iyy = ∫x² dA, Ixy = ∫xy dA.
+    """
+    dy = y1 - y0
+    xm = 0.5 * (x0 + x1)
+    ym = 0.5 * (y0 + y1)
+
+    def simpson(f0, fm, f1):
+        return np.sum(weight * dy * (f0 + 4.0 * fm + f1) / 6.0, axis=-1)
+
+    A = simpson(x0, xm, x1)
+    Sx = simpson(x0 * y0, xm * ym, x1 * y1)
+    Sy = simpson(x0**2, xm**2, x1**2) / 2.0
+    Ixx = simpson(x0 * y0**2, xm * ym**2, x1 * y1**2)
+    Iyy = simpson(x0**3, xm**3, x1**3) / 3.0
+    Ixy = simpson(x0**2 * y0, xm**2 * ym, x1**2 * y1) / 2.0
+    return A, Sx, Sy, Ixx, Iyy, Ixy
+
+
+def _clip_edges_above(x0, y0, x1, y1, levels):
+    """
+    Clips every edge to the half-plane y >= level for each level, broadcasting to
+    shape (n_levels, n_edges). The closing segments along y = level have dy = 0 and
+    so contribute nothing to ∮ f dy; they never need to be constructed.
+    """
+    c = np.asarray(levels, dtype=float)[:, None]
+    dy = y1 - y0
+    slope = np.divide(x1 - x0, dy, out=np.zeros_like(dy), where=dy != 0)
+    cy0 = np.maximum(y0, c)
+    cy1 = np.maximum(y1, c)
+    cx0 = x0 + (cy0 - y0) * slope
+    cx1 = x0 + (cy1 - y0) * slope
+    return cx0, cy0, cx1, cy1
+
+
+def _width_at_levels(x0, y0, x1, y1, weight, levels):
+    """Chord width b(y) = -dA_above/dy at each level (crossing edges only)."""
+    c = np.asarray(levels, dtype=float)[:, None]
+    dy = y1 - y0
+    lo = np.minimum(y0, y1)
+    hi = np.maximum(y0, y1)
+    crossing = (lo <= c) & (c < hi)
+    slope = np.divide(x1 - x0, dy, out=np.zeros_like(dy), where=dy != 0)
+    x_at = x0 + (c - y0) * slope
+    return np.sum(np.where(crossing, np.sign(dy) * weight * x_at, 0.0), axis=-1)
+
+
+class _EdgeSet:
+    """All boundary edges of a (composite) section, flattened into arrays."""
+
+    def __init__(self, regions):
+        x0, y0, x1, y1, w = [], [], [], [], []
+        for outer, holes, n in regions:
+            rings = [_oriented(outer, True)] + [_oriented(h, False) for h in holes]
+            for ring in rings:
+                ex0, ey0, ex1, ey1 = _edges(ring)
+                x0.append(ex0); y0.append(ey0); x1.append(ex1); y1.append(ey1)
+                w.append(np.full(len(ring), float(n)))
+        self.x0 = np.concatenate(x0); self.y0 = np.concatenate(y0)
+        self.x1 = np.concatenate(x1); self.y1 = np.concatenate(y1)
+        self.weight = np.concatenate(w)
+
+    def swapped(self):
+        """Same edges with x and y exchanged (orientation reversed to keep areas positive)."""
+        other = _EdgeSet.__new__(_EdgeSet)
+        other.x0, other.y0 = self.y1, self.x1
+        other.x1, other.y1 = self.y0, self.x0
+        other.weight = self.weight
+        return other
+
+    def totals(self):
+        return _boundary_moments(self.x0, self.y0, self.x1, self.y1, self.weight)
+
+    def above(self, levels):
+        """(A, Sx) of the part of the section with y >= level, for each level."""
+        cx0, cy0, cx1, cy1 = _clip_edges_above(self.x0, self.y0, self.x1, self.y1, levels)
+        A, Sx, _, _, _, _ = _boundary_moments(cx0, cy0, cx1, cy1, self.weight)
+        return A, Sx
+
+    def width(self, levels, weighted=False):
+        w = self.weight if weighted else np.ones_like(self.weight)
+        return _width_at_levels(self.x0, self.y0, self.x1, self.y1, w, levels)
+
+    def bounds(self):
+        xs = np.concatenate([self.x0, self.x1]); ys = np.concatenate([self.y0, self.y1])
+        return xs.min(), xs.max(), ys.min(), ys.max()
+
+
+def _plastic_neutral_axis(edges, A_total, y_min, y_max, iterations=60):
+    """Level that splits the (weighted) area in half, by bisection on A_above(y)."""
+    lo, hi = y_min, y_max
+    for _ in range(iterations):
+        mid = 0.5 * (lo + hi)
+        A_above, _ = edges.above([mid])
+        if A_above[0] > 0.5 * A_total:
+            lo = mid
+        else:
+            hi = mid
+    return 0.5 * (lo + hi)
+
+
+def _axis_properties(edges, A, S, y_c, levels_count):
+    """
+    Extreme fibre distances, Q profile, plastic neutral axis and plastic modulus
+    for bending about a horizontal axis through y_c.
+    """
+    _, _, y_min, y_max = edges.bounds()
+    levels = np.linspace(y_min, y_max, levels_count)
+    A_above, S_above = edges.above(levels)
+    Q_profile = S_above - y_c * A_above
+
+    A_na, S_na = edges.above([y_c])
+    Q_na = float(S_na[0] - y_c * A_na[0])
+    b_na = float(edges.width([y_c])[0])
+
+    y_p = _plastic_neutral_axis(edges, A, y_min, y_max)
+    A_p, S_p = edges.above([y_p])
+    Zp = float(2.0 * (S_p[0] - y_p * A_p[0]) - (S - y_p * A))
+
+    return {
+        "c_pos": y_max - y_c, "c_neg": y_c - y_min,
+        "levels": levels, "Q_profile": Q_profile, "b_profile": edges.width(levels),
+        "Q_na": Q_na, "b_na": b_na, "pna": y_p, "Zp": Zp,
+    }
+
+
+@lru_cache(maxsize=256)
+def _section_properties_cached(geometry_key, levels_count):
+    regions = [
+        (np.array(outer), [np.array(h) for h in holes], n)
+        for outer, holes, n in geometry_key
+    ]
+    edges = _EdgeSet(regions)
+    A, Sx, Sy, Ixx, Iyy, Ixy = (float(v) for v in edges.totals())
+    if A <= 0:
+        raise ValueError("Section area must be positive (check hole placement and vertex order).")
+
+    x_c, y_c = Sy / A, Sx / A
+    # Parallel-axis transfer to the centroid
+    Ix = Ixx - A * y_c**2
+    Iy = Iyy - A * x_c**2
+    Ixy_c = Ixy - A * x_c * y_c
+
+    # Principal axes
+    I_avg = 0.5 * (Ix + Iy)
+    I_rad = math.hypot(0.5 * (Ix - Iy), Ixy_c)
+    theta_p = 0.5 * math.atan2(-2.0 * Ixy_c, Ix - Iy)
+
+    strong = _axis_properties(edges, A, Sx, y_c, levels_count)
+    weak = _axis_properties(edges.swapped(), A, Sy, x_c, levels_count)
+
+    for profile in (strong, weak):
+        for key in ("levels", "Q_profile", "b_profile"):
+            profile[key].setflags(write=False)  # Shared between cache hits
+
+    return {
+        "area": A, "x_c": x_c, "y_c": y_c,
+        "Ix": Ix, "Iy": Iy, "Ixy": Ixy_c,
+        "I1": I_avg + I_rad, "I2": I_avg - I_rad, "theta_p_rad": theta_p,
+        "x_axis": strong, "y_axis": weak,
+    }
+
+
+def _geometry_key(regions, scale):
+    """Hashable, order-preserving key for the geometry (coordinates rounded to 1e-12 m)."""
+    key = []
+    for outer, holes, n in regions:
+        outer_t = tuple(map(tuple, np.round(_as_ring(outer) * scale, 12).tolist()))
+        holes_t = tuple(
+            tuple(map(tuple, np.round(_as_ring(h) * scale, 12).tolist())) for h in holes
+        )
+        key.append((outer_t, holes_t, float(n)))
+    return tuple(key)
+
+
+def section_properties_from_polygons(regions, scale=1.0, levels_count=PROFILE_LEVELS_DEFAULT):
+    """
+    Computes section properties for one or more polygonal regions.
+    Args:
+        regions (list): [(outer_vertices, [hole_vertices, ...], modulus_ratio), ...].
+            Vertices are (x, y) pairs in any orientation. modulus_ratio is E_i / E_ref
+            (1.0 for a homogeneous section) and gives the transformed section.
+        scale (float): Factor applied to the coordinates (e.g. 1e-3 for mm input).
+        levels_count (int): Number of levels in the Q(y) / b(y) profiles.
+    Returns:
+        dict: Area, centroid, Ix/Iy/Ixy, principal values, and per-axis profiles.
+            Results are cached by geometry, so repeated shapes are free.
+    """
+    return _section_properties_cached(_geometry_key(regions, scale), int(levels_count))
+
+
+def clear_section_cache():
+    _section_properties_cached.cache_clear()
+
+
+class PolygonSection(CrossSection):
+    """
+    Arbitrary polygonal section with optional holes and composite parts.
+    Coordinates are in mm, about any origin; properties refer to the (transformed) centroid.
+    """
+
+    def __init__(self, outer_mm, holes_mm=None, parts=None, type_name="Polygon"):
+        super().__init__(type_name)
+        regions = []
+        if outer_mm is not None:
+            regions.append((outer_mm, holes_mm or [], 1.0))
+        for part in parts or []:
+            # part = (outer_mm, holes_mm, modulus_ratio)
+            regions.append((part[0], part[1] or [], part[2] if len(part) > 2 else 1.0))
+        if not regions:
+            raise ValueError("PolygonSection needs at least one region.")
+        self.regions_mm = regions
+        self._calculate_properties()
+
+    def _calculate_properties(self):
+        props = section_properties_from_polygons(self.regions_mm, scale=1e-3)
+        self.geometry = props
+        self.area_m2 = props["area"]
+        self.centroid_x_m = props["x_c"]
+        self.centroid_y_m = props["y_c"]
+        self.Ix_m4 = props["Ix"]
+        self.Iy_m4 = props["Iy"]
+        self.Ixy_m4 = props["Ixy"]
+        self.I1_m4 = props["I1"]
+        self.I2_m4 = props["I2"]
+        self.principal_angle_rad = props["theta_p_rad"]
+
+        strong, weak = props["x_axis"], props["y_axis"]
+        self.cy_top_m, self.cy_bottom_m = strong["c_pos"], strong["c_neg"]
+        self.cx_right_m, self.cx_left_m = weak["c_pos"], weak["c_neg"]
+        self.Zx_top_m3 = self.Ix_m4 / self.cy_top_m if self.cy_top_m > 0 else 0.0
+        self.Zx_bottom_m3 = self.Ix_m4 / self.cy_bottom_m if self.cy_bottom_m > 0 else 0.0
+        self.Zy_right_m3 = self.Iy_m4 / self.cx_right_m if self.cx_right_m > 0 else 0.0
+        self.Zy_left_m3 = self.Iy_m4 / self.cx_left_m if self.cx_left_m > 0 else 0.0
+        self.Zpx_m3 = strong["Zp"]
+        self.Zpy_m3 = weak["Zp"]
+
+        self.Qx_max_m3 = strong["Q_na"]
+        self.bx_at_Qx_max_m = strong["b_na"]
+        self.Qy_max_m3 = weak["Q_na"]
+        self.by_at_Qy_max_m = weak["b_na"]
+
+        if self.area_m2 > 0:
+            self.rx_m = math.sqrt(self.Ix_m4 / self.area_m2)
+            self.ry_m = math.sqrt(self.Iy_m4 / self.area_m2)
+
+    def first_moment_profile(self, axis="x", num_levels=PROFILE_LEVELS_DEFAULT):
+        """
+        Returns (y_from_na_m, Q_m3, b_m) arrays for shear about the given axis,
+        with y measured from the centroidal axis.
+        """
+        geometry = self.geometry
+        if num_levels != PROFILE_LEVELS_DEFAULT:
+            geometry = section_properties_from_polygons(self.regions_mm, scale=1e-3, levels_count=num_levels)
+        profile = geometry["x_axis" if axis == "x" else "y_axis"]
+        origin = self.centroid_y_m if axis == "x" else self.centroid_x_m
+        return profile["levels"] - origin, profile["Q_profile"], profile["b_profile"]
+
+    def get_properties_dict(self):
+        props = super().get_properties_dict()
+        props.update({
+            "centroid_x_m": self.centroid_x_m, "centroid_y_m": self.centroid_y_m,
+            "Ixy_m4": self.Ixy_m4, "I1_m4": self.I1_m4, "I2_m4": self.I2_m4,
+            "principal_angle_rad": self.principal_angle_rad,
+            "Zpx_m3": self.Zpx_m3, "Zpy_m3": self.Zpy_m3,
+        })
+        return props
@@ -0,0 +1,209 @@
+# core/sensitivities.py
+import numpy as np
+
+from .batch_solvers import beam_response_coefficients, section_arrays_from_objects, solve_beam_cases, solve_column_cases
+
+# Exact first derivatives of the governing responses and check ratios of the
+# batch solvers, evaluated alongside the primal solve (same vectorized inputs).
+# Gradients are returned as {output: {input: array}} with inputs named
+#   beams:   "L_m", "E_Pa", "Ix_m4", "Z_m3", "A_m2", "Fy_Pa", "load", "load_pos_a_m"
+#   columns: "L_m", "E_Pa", "Fy_Pa", "A_m2", "Ix_m4", "Iy_m4", "Kx", "Ky", "load"
+# Conventions:
+#   - Z_m3 is the governing (smaller) elastic modulus min(Zx_top, Zx_bottom).
+#   - The shear yield strength is Fy / sqrt(3) (as in Material), so d/dFy covers both checks.
+#   - d/dA assumes a fixed shear shape factor, tau_max = k * V / A (exact for the
+#     rectangular and circular sections).
+#   - d/dL holds the absolute point-load position a fixed.
+#   - At kinks (load at midspan, equal buckling loads about both axes) the
+#     one-sided derivative of the branch used by the primal solve is returned.
+
+SQRT3 = np.sqrt(3.0)
+
+
+def beam_response_coefficient_gradients(support_type, load_type, L, load_pos_a_m=None):
+    """
+    d/dL and d/da of the unit-load coefficients from beam_response_coefficients.
+    Returns:
+        dict: {"V": (dV/dL, dV/da), "M": (...), "D_EI": (...)}
+    """
+    support_type = np.asarray(support_type)
+    load_type = np.asarray(load_type)
+    L = np.asarray(L, dtype=float)
+    a = np.asarray(load_pos_a_m if load_pos_a_m is not None else L / 2.0, dtype=float)
+    a, L, support_type, load_type = np.broadcast_arrays(a, L, support_type, load_type)
+
+    ss = support_type == "simplySupported"
+    cant = support_type == "cantilever"
+    point = (load_type == "pointLoad") | (load_type == "pointLoadEnd")
+    udl = load_type == "udl"
+    cases = [ss & point, ss & udl, cant & point, cant & udl]
+    zero = np.zeros_like(L)
+
+    # Simply supported point load: V = max(a, b) / L, M = a b / L, b = L - a
+    near_left = a <= L - a # a is the shorter segment
+    ss_p_V_L = np.where(near_left, a / L**2, -a / L**2)
+    ss_p_V_a = np.where(near_left, -1.0 / L, 1.0 / L)
+    ss_p_M_L = a**2 / L**2
+    ss_p_M_a = 1.0 - 2.0 * a / L
+    # D = s (L^2 - s^2)^1.5 / (9 sqrt(3) L), s = min(a, b)
+    s = np.minimum(a, L - a)
+    root = np.sqrt(np.maximum(L**2 - s**2, 0.0))
+    dD_ds = root * (L**2 - 4 * s**2) / (9 * SQRT3 * L)
+    dD_dL_fixed_s = s * root * (2 * L**2 + s**2) / (9 * SQRT3 * L**2)
+    ss_p_D_L = dD_dL_fixed_s + np.where(near_left, 0.0, dD_ds) # s = L - a when a is the longer segment
+    ss_p_D_a = np.where(near_left, dD_ds, -dD_ds)
+
+    return {
+        "V": (np.select(cases, [ss_p_V_L, 0.5 + zero, zero, 1.0 + zero], np.nan),
+              np.select(cases, [ss_p_V_a, zero, zero, zero], np.nan)),
+        "M": (np.select(cases, [ss_p_M_L, L / 4, 1.0 + zero, L], np.nan),
+              np.select(cases, [ss_p_M_a, zero, zero, zero], np.nan)),
+        "D_EI": (np.select(cases, [ss_p_D_L, 5 * L**3 / 96, L**2, L**3 / 2], np.nan),
+                 np.select(cases, [ss_p_D_a, zero, zero, zero], np.nan)),
+    }
+
+
+def solve_beam_cases_with_gradients(support_type, load_type, L, E, Fy, section, load, load_pos_a_m=None):
+    """
+    solve_beam_cases plus exact gradients of its governing responses and ratios.
+    Args:
+        As solve_beam_cases, with the shear yield strength taken as Fy / sqrt(3).
+    Returns:
+        tuple: (results dict of solve_beam_cases, gradients {output: {input: array}})
+    """
+    L = np.asarray(L, dtype=float)
+    E = np.asarray(E, dtype=float)
+    Fy = np.asarray(Fy, dtype=float)
+    load = np.asarray(load, dtype=float)
+    results = solve_beam_cases(support_type, load_type, L, E, Fy, Fy / SQRT3, section, load, load_pos_a_m)
+
+    V1, M1, D1, span_ratio = beam_response_coefficients(support_type, load_type, L, load_pos_a_m)
+    coeff_grads = beam_response_coefficient_gradients(support_type, load_type, L, load_pos_a_m)
+    I = np.asarray(section["Ix_m4"], dtype=float)
+    A = np.asarray(section["area_m2"], dtype=float)
+    Z = np.minimum(section["Zx_top_m3"], section["Zx_bottom_m3"])
+    tau_per_V = np.asarray(section["tau_per_V"], dtype=float)
+    P = np.abs(load)
+    sign = np.sign(load)
+    EI = E * I
+    shape = results["max_abs_moment_Nm"].shape
+
+    def safe_div(num, den):
+        num, den = np.broadcast_arrays(np.asarray(num, dtype=float), np.asarray(den, dtype=float))
+        return np.divide(num, den, out=np.zeros(num.shape), where=den != 0)
+
+    def full(x):
+        return np.broadcast_to(np.asarray(x, dtype=float), shape)
+
+    V = results["max_abs_shear_N"]
+    M = results["max_abs_moment_Nm"]
+    defl = results["max_abs_deflection_m"]
+    sigma = results["max_abs_bending_stress_Pa"]
+    tau = results["max_shear_stress_Pa"]
+    r_b = results["bending_yield.ratio"]
+    r_s = results["shear_yield.ratio"]
+    r_d = results["deflection_limit.ratio"]
+
+    dV_dL, dV_da = (P * g for g in coeff_grads["V"])
+    dM_dL, dM_da = (P * g for g in coeff_grads["M"])
+    dd_dL, dd_da = (safe_div(P * g, EI) for g in coeff_grads["D_EI"])
+    d_limit_dL = 1.0 / span_ratio # limit = L / span_ratio
+    limit = L / span_ratio
+
+    grads = {
+        "max_abs_shear_N": {"L_m": dV_dL, "load_pos_a_m": dV_da, "load": sign * V1},
+        "max_abs_moment_Nm": {"L_m": dM_dL, "load_pos_a_m": dM_da, "load": sign * M1},
+        "max_abs_deflection_m": {
+            "L_m": dd_dL, "load_pos_a_m": dd_da, "load": safe_div(sign * D1, EI),
+            "E_Pa": -safe_div(defl, E), "Ix_m4": -safe_div(defl, I),
+        },
+        "max_abs_bending_stress_Pa": {
+            "L_m": safe_div(dM_dL, Z), "load_pos_a_m": safe_div(dM_da, Z), "load": safe_div(sign * M1, Z),
+            "Z_m3": -safe_div(sigma, Z),
+        },
+        "max_shear_stress_Pa": {
+            "L_m": dV_dL * tau_per_V, "load_pos_a_m": dV_da * tau_per_V, "load": sign * V1 * tau_per_V,
+            "A_m2": -safe_div(tau, A),
+        },
+        "bending_yield.ratio": {
+            "L_m": safe_div(dM_dL, Z * Fy), "load_pos_a_m": safe_div(dM_da, Z * Fy),
+            "load": safe_div(sign * M1, Z * Fy), "Z_m3": -safe_div(r_b, Z), "Fy_Pa": -safe_div(r_b, Fy),
+        },
+        "shear_yield.ratio": {
+            "L_m": safe_div(dV_dL * tau_per_V * SQRT3, Fy), "load_pos_a_m": safe_div(dV_da * tau_per_V * SQRT3, Fy),
+            "load": safe_div(sign * V1 * tau_per_V * SQRT3, Fy), "A_m2": -safe_div(r_s, A), "Fy_Pa": -safe_div(r_s, Fy),
+        },
+        "deflection_limit.ratio": {
+            # r = defl / limit: quotient rule in L
+            "L_m": safe_div(dd_dL, limit) - safe_div(r_d * d_limit_dL, limit),
+            "load_pos_a_m": safe_div(dd_da, limit), "load": safe_div(safe_div(sign * D1, EI), limit),
+            "E_Pa": -safe_div(r_d, E), "Ix_m4": -safe_div(r_d, I),
+        },
+    }
+    return results, {out: {name: full(g) for name, g in by_input.items()} for out, by_input in grads.items()}
+
+
+def solve_column_cases_with_gradients(L, E, Fy, A, Ix, Iy, Kx, Ky, axial_load_P_N):
+    """
+    solve_column_cases plus exact gradients of the axial stress, governing
+    buckling load and both check ratios.
+    Returns:
+        tuple: (results dict of solve_column_cases, gradients {output: {input: array}})
+    """
+    results = solve_column_cases(L, E, Fy, A, Ix, Iy, Kx, Ky, axial_load_P_N)
+    L, E, Fy, A, Ix, Iy, Kx, Ky, P = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (L, E, Fy, A, Ix, Iy, Kx, Ky, axial_load_P_N)))
+    zero = np.zeros_like(L)
+
+    def safe_div(num, den):
+        return np.divide(num, den, out=np.zeros(np.broadcast(num, den).shape), where=(den != 0) & np.isfinite(den))
+
+    stress = results["axial_stress_Pa"]
+    Pcr = results["min_critical_buckling_load_N"]
+    r_y = results["yielding_crushing.ratio"]
+    r_b = results["euler_buckling.ratio"]
+    about_x = results["critical_buckling_load_Pcr_x_N"] <= results["critical_buckling_load_Pcr_y_N"]
+    finite = np.isfinite(Pcr)
+
+    # Pcr = pi^2 E I_g / (K_g L)^2 about the governing axis g
+    dPcr = {
+        "L_m": np.where(finite, -2 * safe_div(Pcr, L), 0.0),
+        "E_Pa": np.where(finite, safe_div(Pcr, E), 0.0),
+        "Ix_m4": np.where(finite & about_x, safe_div(Pcr, Ix), 0.0),
+        "Iy_m4": np.where(finite & ~about_x, safe_div(Pcr, Iy), 0.0),
+        "Kx": np.where(finite & about_x, -2 * safe_div(Pcr, Kx), 0.0),
+        "Ky": np.where(finite & ~about_x, -2 * safe_div(Pcr, Ky), 0.0),
+    }
+    grads = {
+        "axial_stress_Pa": {"load": safe_div(1.0, A), "A_m2": -safe_div(stress, A)},
+        "min_critical_buckling_load_N": dPcr,
+        "yielding_crushing.ratio": {"load": safe_div(1.0, A * Fy), "A_m2": -safe_div(r_y, A), "Fy_Pa": -safe_div(r_y, Fy)},
+        # r = P / Pcr
+        "euler_buckling.ratio": dict(
+            {name: -safe_div(r_b * g, Pcr) for name, g in dPcr.items()},
+            load=np.where(finite, safe_div(1.0, Pcr), zero)),
+    }
+    return results, grads
+
+
+def _scalar_gradients(grads):
+    return {out: {name: float(np.asarray(g).reshape(-1)[0]) for name, g in by_input.items()} for out, by_input in grads.items()}
+
+
+def beam_element_sensitivities(beam_element, load_type, load, load_pos_a_m=None):
+    """Gradients for a single Beam element (as used by /calculate); scalar floats."""
+    section = section_arrays_from_objects([beam_element.cross_section])
+    _, grads = solve_beam_cases_with_gradients(
+        [beam_element.support_type], [load_type], [beam_element.length_m],
+        [beam_element.material.E_Pa], [beam_element.material.Fy_Pa], section, [load],
+        None if load_pos_a_m is None else [load_pos_a_m])
+    return _scalar_gradients(grads)
+
+
+def column_element_sensitivities(column_element, axial_load_P_N):
+    """Gradients for a single Column element; scalar floats."""
+    cs = column_element.cross_section
+    _, grads = solve_column_cases_with_gradients(
+        column_element.length_m, column_element.material.E_Pa, column_element.material.Fy_Pa,
+        cs.area_m2, cs.Ix_m4, cs.Iy_m4, column_element.Kx, column_element.Ky, axial_load_P_N)
+    return _scalar_gradients(grads)
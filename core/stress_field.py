@@ -0,0 +1,75 @@
+# core/stress_field.py
+import numpy as np
+
+# Grid caps for the (x × depth) stress field. The field is computed as one
+# broadcast operation, so memory and time scale with nx * ny.
+STRESS_FIELD_MAX_CELLS = 40000
+STRESS_FIELD_DEPTH_POINTS = 41
+
+
+def _resample_stations(x_coords, nx):
+    """Picks up to nx stations (end points kept) from the solver's x coordinates."""
+    if len(x_coords) <= nx:
+        return x_coords
+    idx = np.unique(np.round(np.linspace(0, len(x_coords) - 1, nx)).astype(int))
+    return x_coords[idx]
+
+
+def compute_beam_stress_field(beam_element, results=None, nx=None, ny=STRESS_FIELD_DEPTH_POINTS,
+                              max_cells=STRESS_FIELD_MAX_CELLS):
+    """
+    Bending normal stress, shear stress and von Mises stress over the beam's length and depth.
+    Args:
+        beam_element (Beam): The beam object (cross-section supplies I and the Q(y)/b(y) profile).
+        results (dict): Solver results with "bmd_points" and "sfd_points" (defaults to beam_element.results).
+        nx (int): Stations along the length (defaults to every solver station, subject to max_cells).
+        ny (int): Levels through the depth.
+        max_cells (int): Upper bound on nx * ny; nx is reduced to fit.
+    Returns:
+        dict: "x_m" (nx,), "y_m" (ny,) measured from the neutral axis (positive up),
+            "sigma_Pa", "tau_Pa", "von_mises_Pa" (ny, nx), the section's "Q_m3"/"b_m"
+            profiles (ny,), and the von Mises "hotspot".
+    """
+    results = results if results is not None else beam_element.results
+    cs = beam_element.cross_section
+    I = cs.Ix_m4
+
+    bmd = results.get("bmd_points", [])
+    sfd = results.get("sfd_points", [])
+    if not bmd or I <= 0:
+        raise ValueError("Stress field needs bending moment results and a section with Ix > 0.")
+
+    x_bmd = np.array([p["x"] for p in bmd], dtype=float)
+    m_bmd = np.array([p["m"] for p in bmd], dtype=float)
+    x_sfd = np.array([p["x"] for p in sfd], dtype=float)
+    v_sfd = np.array([p["v"] for p in sfd], dtype=float)
+
+    ny = max(2, int(ny))
+    nx_cap = max(2, int(max_cells) // ny)
+    nx = min(int(nx), nx_cap) if nx else nx_cap
+    x = _resample_stations(x_bmd, nx)
+
+    M = np.interp(x, x_bmd, m_bmd)
+    V = np.interp(x, x_sfd, v_sfd) if len(x_sfd) else np.zeros_like(x)
+
+    y, Q, b = cs.first_moment_profile("x", num_levels=ny)
+    # tau = V Q / (I b); zero where the chord vanishes (extreme fibres, cusps)
+    q_over_b = np.divide(Q, b, out=np.zeros_like(Q), where=b > 0)
+
+    # Broadcast: rows are depth levels, columns are stations. Sagging moment
+    # (M > 0) puts the top fibre (y > 0) in compression.
+    sigma = -(y[:, None] * M[None, :]) / I
+    tau = (q_over_b[:, None] * V[None, :]) / I
+    von_mises = np.sqrt(sigma**2 + 3.0 * tau**2)
+
+    iy, ix = np.unravel_index(np.argmax(von_mises), von_mises.shape)
+    return {
+        "x_m": x, "y_m": y,
+        "sigma_Pa": sigma, "tau_Pa": tau, "von_mises_Pa": von_mises,
+        "Q_m3": Q, "b_m": b,
+        "hotspot": {
+            "x_m": float(x[ix]), "y_m": float(y[iy]),
+            "von_mises_Pa": float(von_mises[iy, ix]),
+            "sigma_Pa": float(sigma[iy, ix]), "tau_Pa": float(tau[iy, ix]),
+        },
+    }
@@ -41,4 +41,41 @@ def get_color_for_value(value, min_val, max_val, colormap_name="viridis_r"):
         g = int(255 * (1 - (norm_value - 0.75) / 0.25))
         b = 0
     
-    return f"rgb({r},{g},{b})"
\ No newline at end of file
+    return f"rgb({r},{g},{b})"
+
+def downsample_series(x, y, max_points):
+    """
+    Min/max bucket downsampling of a diagram series to roughly max_points points.
+    The first/last points, the global extrema and both sides of every jump
+    (repeated x, as at a point load in the SFD) are always kept, so the plotted
+    shape and the peak values are identical to the full-resolution series.
+    Returns the sorted indices of the points to keep.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if max_points is None or n <= max_points or n < 3:
+        return np.arange(n)
+
+    keep = np.zeros(n, dtype=bool)
+    keep[[0, n - 1, int(np.argmax(y)), int(np.argmin(y))]] = True
+    jumps = np.flatnonzero(x[1:] == x[:-1])
+    keep[jumps] = True
+    keep[jumps + 1] = True
+
+    num_buckets = max(1, (int(max_points) - int(keep.sum())) // 2)
+    bucket = (np.arange(n) * num_buckets) // n
+    order = np.lexsort((y, bucket)) # Sorted by bucket, then by value within the bucket
+    starts = np.searchsorted(bucket[order], np.arange(num_buckets), side='left')
+    ends = np.searchsorted(bucket[order], np.arange(num_buckets), side='right') - 1
+    keep[order[starts]] = True # Bucket minima
+    keep[order[ends]] = True   # Bucket maxima
+    return np.flatnonzero(keep)
+
+
+def downsample_diagram_points(points, value_key, max_points):
+    """Applies downsample_series to a list of {"x": ..., value_key: ...} dicts."""
+    if not points or max_points is None or len(points) <= max_points:
+        return points
+    idx = downsample_series([p["x"] for p in points], [p[value_key] for p in points], max_points)
+    return [points[i] for i in idx]
@@ -0,0 +1,171 @@
+# live_channel.py
+import hmac
+import logging
+import secrets
+import threading
+import time
+
+# Diagram series and the value key of each point, used for delta messages.
+DIAGRAM_SERIES = (("sfd_points", "v"), ("bmd_points", "m"), ("deflection_points", "d"))
+
+
+def make_diagram_delta(previous, current):
+    """
+    Builds a delta message body against the previously pushed response.
+    Diagram series whose x coordinates are unchanged are sent as bare value
+    arrays under "diagram_values"; everything else is sent in full.
+    Returns None when a delta is not applicable (first message, error, etc.).
+    """
+    if not previous or "results" not in previous or "results" not in current:
+        return None
+    prev_results, results = previous["results"], current["results"]
+    delta_results = dict(results)
+    diagram_values = {}
+    for key, value_key in DIAGRAM_SERIES:
+        old_points, new_points = prev_results.get(key), results.get(key)
+        if not old_points or not new_points or len(old_points) != len(new_points):
+            continue
+        if any(o["x"] != n["x"] for o, n in zip(old_points, new_points)):
+            continue
+        diagram_values[key] = [p[value_key] for p in new_points]
+        del delta_results[key]
+    if not diagram_values:
+        return None
+    return {**current, "results": delta_results, "diagram_values": diagram_values}
+
+
+class LiveChannel:
+    """
+    One dashboard session's stream of analysis requests.
+
+    Updates are coalesced: submit() only records the newest payload, so rapid
+    slider moves collapse into one pending computation. The streaming thread
+    computes the newest pending payload and discards the result if a newer
+    payload arrived meanwhile, so only the latest result is ever pushed.
+
+    The session id is issued here, never taken from the client, and the channel
+    belongs to the client id (cookie) that opened it.
+    """
+
+    def __init__(self, compute_fn, owner):
+        self.session_id = secrets.token_urlsafe(16)
+        self.owner = owner
+        self.subscribers = 0          # Open streams attached (guarded by the registry lock)
+        self._compute = compute_fn
+        self._cond = threading.Condition()
+        self._pending = None          # (seq, payload) of the newest unprocessed update
+        self._latest_seq = -1         # Highest seq submitted
+        self._last_pushed = None      # Last full response pushed (base for deltas)
+        self.last_activity = time.monotonic()
+        self.stats = {"submitted": 0, "coalesced": 0, "computed": 0, "superseded": 0, "pushed": 0}
+
+    def submit(self, seq, payload):
+        """Records an update; returns False if it is older than one already submitted."""
+        with self._cond:
+            self.last_activity = time.monotonic()
+            if seq <= self._latest_seq:
+                return False
+            self.stats["submitted"] += 1
+            if self._pending is not None:
+                self.stats["coalesced"] += 1
+            self._latest_seq = seq
+            self._pending = (seq, payload)
+            self._cond.notify_all()
+            return True
+
+    def next_message(self, timeout, delta=False):
+        """
+        Blocks up to timeout seconds for the next result to push.
+        Returns a message dict {"seq", "data"} or {"seq", "delta"}, or None on timeout.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._cond:
+                while self._pending is None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        # Heartbeat: the stream is still open, so the session is not idle
+                        self.last_activity = time.monotonic()
+                        return None
+                    self._cond.wait(remaining)
+                seq, payload = self._pending
+                self._pending = None
+
+            try:
+                response = self._compute(payload)
+            except Exception: # Details stay in the log, the stream stays open
+                logging.getLogger(__name__).exception("Live analysis failed in session %s", self.session_id)
+                response = {"error": "An unexpected error occurred on the server. Please check logs."}
+            self.stats["computed"] += 1
+
+            with self._cond:
+                if seq < self._latest_seq:
+                    # A newer update arrived while computing; drop this result.
+                    self.stats["superseded"] += 1
+                    continue
+                message = {"seq": seq}
+                body = make_diagram_delta(self._last_pushed, response) if delta else None
+                if body is not None:
+                    message["delta"] = body
+                else:
+                    message["data"] = response
+                if "error" not in response:
+                    self._last_pushed = response
+                self.stats["pushed"] += 1
+                self.last_activity = time.monotonic()
+                return message
+
+
+class LiveChannelRegistry:
+    """
+    Thread-safe map of session id -> LiveChannel with idle expiry. A channel is
+    idle when it has had no update, push or stream heartbeat for idle_timeout_s.
+    Streams attach() and detach(); a channel is dropped when its last stream
+    closes. Lookups only succeed for the owner the channel was created for.
+    """
+
+    def __init__(self, compute_fn, idle_timeout_s=600):
+        self._compute = compute_fn
+        self._idle_timeout_s = idle_timeout_s
+        self._channels = {}
+        self._lock = threading.Lock()
+
+    def attach(self, session_id, owner):
+        """
+        Subscribes a stream to the owner's existing session, or to a new session
+        with a fresh id when session_id is missing, unknown or not the owner's.
+        """
+        with self._lock:
+            self._expire_idle()
+            channel = self._lookup(session_id, owner)
+            if channel is None:
+                channel = LiveChannel(self._compute, owner)
+                self._channels[channel.session_id] = channel
+            channel.subscribers += 1
+            return channel
+
+    def detach(self, channel):
+        """Unsubscribes a stream; removes the channel once no stream is attached."""
+        with self._lock:
+            channel.subscribers -= 1
+            if channel.subscribers <= 0 and self._channels.get(channel.session_id) is channel:
+                del self._channels[channel.session_id]
+
+    def get(self, session_id, owner):
+        """Returns the owner's channel for session_id, or None."""
+        with self._lock:
+            self._expire_idle()
+            return self._lookup(session_id, owner)
+
+    def _lookup(self, session_id, owner):
+        channel = self._channels.get(session_id) if session_id else None
+        if channel is None or not owner or not hmac.compare_digest(channel.owner.encode(), owner.encode()):
+            return None
+        return channel
+
+    def _expire_idle(self):
+        now = time.monotonic()
+        idle = [s for s, c in self._channels.items()
+                if c.subscribers <= 0 and now - c.last_activity > self._idle_timeout_s]
+        for sid in idle:
+            del self._channels[sid]
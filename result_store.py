@@ -0,0 +1,281 @@
+# result_store.py
+"""
+Columnar, chunked result store for large batch/sweep/Monte Carlo outputs.
+
+Layout of a store directory:
+    meta.json                  column dtypes, string dictionaries, chunk index
+    chunk-000000/<column>.npy  one array per column per chunk
+
+Chunks are read with np.load(mmap_mode="r"), so random access and filtered
+queries only touch the pages they need. Each chunk records min/max per numeric
+column in meta.json; queries skip chunks whose range cannot match.
+String columns (statuses, ids) are dictionary-encoded as int32 codes (-1 = None).
+"""
+import json
+import operator
+import os
+import re
+import shutil
+
+import numpy as np
+
+META_FILE = "meta.json"
+
+_OPS = {"<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge, "==": operator.eq, "!=": operator.ne}
+_CLAUSE_RE = re.compile(r"^\s*([\w.]+)\s*(<=|>=|==|!=|<|>)\s*(.+?)\s*$")
+
+
+def parse_filter(expression):
+    """
+    Parses "col op value [and col op value ...]" into [(col, op, value), ...].
+    Values are numbers or quoted strings, e.g. bending_yield.ratio > 0.9 and bending_yield.status == "FAIL".
+    """
+    if not expression:
+        return []
+    clauses = []
+    for part in re.split(r"\s+and\s+", expression.strip(), flags=re.IGNORECASE):
+        match = _CLAUSE_RE.match(part)
+        if not match:
+            raise ValueError(f"Invalid filter clause: '{part}'")
+        column, op, raw = match.groups()
+        if raw[:1] in "'\"" and raw[-1:] == raw[:1]:
+            value = raw[1:-1]
+        else:
+            try:
+                value = float(raw)
+            except ValueError:
+                value = raw
+        clauses.append((column, op, value))
+    return clauses
+
+
+class ResultStore:
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, META_FILE)) as f:
+            self.meta = json.load(f)
+
+    # --- Creation / writing ---
+    @classmethod
+    def create(cls, path, overwrite=False):
+        if os.path.exists(path):
+            if not overwrite:
+                raise FileExistsError(f"Result store already exists: {path}")
+            shutil.rmtree(path)
+        os.makedirs(path)
+        cls._write_meta(path, {"columns": {}, "chunks": [], "total_rows": 0})
+        return cls(path)
+
+    @classmethod
+    def open_or_create(cls, path):
+        if os.path.exists(os.path.join(path, META_FILE)):
+            return cls(path)
+        return cls.create(path)
+
+    @staticmethod
+    def _write_meta(path, meta):
+        tmp = os.path.join(path, META_FILE + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp, os.path.join(path, META_FILE)) # Readers never see a half-written index
+
+    def _encode(self, name, values):
+        """
+        Returns the stored array for a column, registering its dtype on first use
+        (None while a column has only seen missing values). An int64 column is
+        widened to float64 when a later chunk has missing or fractional values.
+        """
+        columns = self.meta["columns"]
+        arr = np.asarray(values)
+        if name not in columns:
+            if arr.dtype.kind in "iub":
+                columns[name] = {"dtype": "int64"}
+            elif arr.dtype.kind == "f":
+                columns[name] = {"dtype": "float64"}
+            else:
+                # Mixed/None values: numeric if every non-None value is a number
+                non_null = [v for v in arr.tolist() if v is not None and v != ""]
+                if not non_null:
+                    return None # Type unknown yet; the chunk reads as missing for this column
+                if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in non_null):
+                    columns[name] = {"dtype": "float64"}
+                else:
+                    columns[name] = {"dtype": "str", "categories": []}
+        spec = columns[name]
+        if spec["dtype"] == "str":
+            lookup = {c: i for i, c in enumerate(spec["categories"])}
+            codes = np.empty(len(arr), dtype=np.int32)
+            for i, v in enumerate(arr.tolist()):
+                if v is None or v == "":
+                    codes[i] = -1
+                    continue
+                v = str(v)
+                if v not in lookup:
+                    lookup[v] = len(spec["categories"])
+                    spec["categories"].append(v)
+                codes[i] = lookup[v]
+            return codes
+        if arr.dtype == object:
+            arr = np.array([np.nan if v is None or v == "" else v for v in arr.tolist()], dtype=float)
+        if spec["dtype"] == "int64" and arr.dtype.kind == "f":
+            if not (np.isfinite(arr).all() and np.array_equal(arr, np.round(arr))):
+                self._widen_to_float(name) # Missing or fractional values: int64 cannot hold them
+        return arr.astype(columns[name]["dtype"])
+
+    def _widen_to_float(self, name):
+        """Re-registers an int64 column as float64, rewriting the chunks already stored."""
+        for chunk in self.meta["chunks"]:
+            path = os.path.join(self.path, chunk["dir"], name + ".npy")
+            if not os.path.exists(path):
+                continue
+            arr = np.load(path).astype(np.float64)
+            with open(path + ".tmp", "wb") as f:
+                np.save(f, arr)
+            os.replace(path + ".tmp", path) # Open memory maps keep the old file
+        self.meta["columns"][name] = {"dtype": "float64"}
+
+    def append(self, data):
+        """
+        Appends one chunk. data is a dict of equal-length columns or a list of row dicts
+        (missing keys become NaN / None).
+        """
+        if isinstance(data, list):
+            keys = list(dict.fromkeys(k for row in data for k in row))
+            data = {k: [row.get(k) for row in data] for k in keys}
+        n_rows = len(next(iter(data.values()))) if data else 0
+        if n_rows == 0:
+            return
+        index = len(self.meta["chunks"])
+        chunk_dir = f"chunk-{index:06d}"
+        os.makedirs(os.path.join(self.path, chunk_dir), exist_ok=True)
+        stats = {}
+        for name, values in data.items():
+            if len(values) != n_rows:
+                raise ValueError(f"Column '{name}' has {len(values)} rows, expected {n_rows}.")
+            arr = self._encode(name, values)
+            if arr is None:
+                continue
+            np.save(os.path.join(self.path, chunk_dir, name + ".npy"), arr)
+            if arr.dtype.kind == "f" and np.isfinite(arr).any():
+                finite = arr[np.isfinite(arr)]
+                stats[name] = [float(finite.min()), float(finite.max())]
+            elif arr.dtype.kind == "i" and self.meta["columns"][name]["dtype"] != "str":
+                stats[name] = [int(arr.min()), int(arr.max())]
+        self.meta["chunks"].append({"dir": chunk_dir, "start": self.meta["total_rows"], "rows": n_rows, "stats": stats})
+        self.meta["total_rows"] += n_rows
+        self._write_meta(self.path, self.meta)
+
+    def truncate(self, n_rows):
+        """Drops whole chunks beyond n_rows (used when resuming from a checkpoint)."""
+        keep = [c for c in self.meta["chunks"] if c["start"] + c["rows"] <= n_rows]
+        for chunk in self.meta["chunks"][len(keep):]:
+            shutil.rmtree(os.path.join(self.path, chunk["dir"]), ignore_errors=True)
+        self.meta["chunks"] = keep
+        self.meta["total_rows"] = sum(c["rows"] for c in keep)
+        self._write_meta(self.path, self.meta)
+
+    # --- Reading ---
+    def __len__(self):
+        return self.meta["total_rows"]
+
+    @property
+    def columns(self):
+        return list(self.meta["columns"])
+
+    def _load(self, chunk, name):
+        """Memory-mapped column of one chunk, or a fill array if the chunk predates the column."""
+        path = os.path.join(self.path, chunk["dir"], name + ".npy")
+        if os.path.exists(path):
+            return np.load(path, mmap_mode="r")
+        spec = self.meta["columns"][name]
+        if spec["dtype"] == "str":
+            return np.full(chunk["rows"], -1, dtype=np.int32)
+        return np.full(chunk["rows"], np.nan)
+
+    def _decode(self, name, arr):
+        spec = self.meta["columns"][name]
+        if spec["dtype"] == "str":
+            categories = np.array(spec["categories"] + [None], dtype=object)
+            return categories[np.asarray(arr)] # Code -1 picks the trailing None
+        return np.asarray(arr)
+
+    def read(self, columns=None, start=0, stop=None):
+        """Random access: decoded columns for rows [start, stop)."""
+        columns = columns or self.columns
+        stop = len(self) if stop is None else min(stop, len(self))
+        parts = {name: [] for name in columns}
+        for chunk in self.meta["chunks"]:
+            lo = max(start, chunk["start"]) - chunk["start"]
+            hi = min(stop, chunk["start"] + chunk["rows"]) - chunk["start"]
+            if lo >= hi:
+                continue
+            for name in columns:
+                parts[name].append(self._decode(name, self._load(chunk, name)[lo:hi]))
+        return {name: (np.concatenate(p) if p else np.array([])) for name, p in parts.items()}
+
+    def _chunk_may_match(self, chunk, clauses):
+        for column, op, value in clauses:
+            bounds = chunk["stats"].get(column)
+            if bounds is None or not isinstance(value, float):
+                continue
+            lo, hi = bounds
+            if (op in (">", ">=") and not _OPS[op](hi, value)) or \
+               (op in ("<", "<=") and not _OPS[op](lo, value)) or \
+               (op == "==" and not lo <= value <= hi):
+                return False
+        return True
+
+    def _mask(self, chunk, clauses):
+        mask = np.ones(chunk["rows"], dtype=bool)
+        for column, op, value in clauses:
+            if column not in self.meta["columns"]:
+                raise KeyError(f"Unknown column '{column}'")
+            spec = self.meta["columns"][column]
+            arr = self._load(chunk, column)
+            if spec["dtype"] == "str":
+                if op not in ("==", "!="):
+                    raise ValueError(f"Only == and != are supported for text column '{column}'")
+                code = spec["categories"].index(value) if value in spec["categories"] else -2
+                mask &= _OPS[op](arr, code)
+            else:
+                mask &= _OPS[op](arr, float(value))
+        return mask
+
+    def query(self, where=None, columns=None, offset=0, limit=None):
+        """
+        Filtered query without loading the whole dataset.
+        Args:
+            where (str | list): Filter expression (see parse_filter) or parsed clauses.
+            columns (list): Columns to return (default: all).
+            offset, limit (int): Paging over the matching rows.
+        Returns:
+            dict: {"rows": decoded columns of the page, "row_index": global row numbers,
+                   "matched": total number of matching rows}
+        """
+        clauses = parse_filter(where) if isinstance(where, str) else (where or [])
+        columns = columns or self.columns
+        page = {name: [] for name in columns}
+        row_index = []
+        matched = 0
+        taken = 0
+        for chunk in self.meta["chunks"]:
+            if not self._chunk_may_match(chunk, clauses):
+                continue
+            hits = np.flatnonzero(self._mask(chunk, clauses))
+            if limit is not None and taken >= limit:
+                matched += len(hits)
+                continue
+            lo = max(0, offset - matched)
+            selected = hits[lo:] if limit is None else hits[lo:lo + (limit - taken)]
+            matched += len(hits)
+            if len(selected) == 0:
+                continue
+            for name in columns:
+                page[name].append(self._decode(name, self._load(chunk, name)[selected]))
+            row_index.append(selected + chunk["start"])
+            taken += len(selected)
+        return {
+            "rows": {name: (np.concatenate(p) if p else np.array([])) for name, p in page.items()},
+            "row_index": np.concatenate(row_index) if row_index else np.array([], dtype=np.int64),
+            "matched": matched,
+        }
@@ -0,0 +1,219 @@
+# single_flight.py
+import hashlib
+import json
+import logging
+import os
+import stat
+import tempfile
+import threading
+import time
+
+try: # POSIX only; without it coalescing is per-process
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+def canonical_key(payload):
+    """Stable hash of a JSON payload (key order and whitespace do not matter)."""
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Collapses concurrent identical computations into one.
+
+    Within a process, the first caller for a key computes and later callers wait
+    on its result. Across worker processes (gunicorn etc.), the in-process leader
+    takes an exclusive file lock on the key in a local shared directory: the
+    process holding it computes and writes the serialized result; the others wait
+    for the lock and then read that result instead of recomputing. A waiter only
+    accepts a result written after it started waiting, i.e. by a computation that
+    was in flight during its request; this is request coalescing, not a cache.
+    A waiter that does not get the lock within lock_timeout_s (a stuck or very
+    slow leader) computes by itself.
+
+    Result files are served verbatim, so the directory must be private: it is
+    created with mode 0700 and, if it already exists, used only when it is a
+    real directory owned by this user with no group/other permissions.
+    Otherwise coalescing stays in-process.
+    """
+
+    def __init__(self, store_dir=None, lock_timeout_s=30.0):
+        self.store_dir = store_dir if store_dir and fcntl is not None and _private_dir(store_dir) else None
+        self.lock_timeout_s = lock_timeout_s
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._last_prune = 0.0
+        self.stats = {
+            "calls": 0, "computed": 0, "errors": 0,
+            "collapsed_in_process": 0, "collapsed_cross_process": 0, "lock_timeouts": 0,
+        }
+
+    def do(self, key, fn):
+        """Returns fn()'s result (a str or bytes), shared with concurrent callers of the same key."""
+        with self._lock:
+            self.stats["calls"] += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.stats["collapsed_in_process"] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._do_shared(key, fn)
+        except Exception as e:
+            call.error = e
+            with self._lock:
+                self.stats["errors"] += 1
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def _compute(self, fn):
+        result = fn()
+        with self._lock:
+            self.stats["computed"] += 1
+        return result
+
+    def _do_shared(self, key, fn):
+        if not self.store_dir or fcntl is None:
+            return self._compute(fn)
+
+        base = os.path.join(self.store_dir, key)
+        started_ns = time.time_ns()
+        with open(base + ".lock", "a+b") as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                # Another process is computing this key; wait for it to finish.
+                if not self._wait_for_lock(lock_file):
+                    with self._lock:
+                        self.stats["lock_timeouts"] += 1
+                    return self._compute(fn)
+                shared = self._read_result(base, not_before_ns=started_ns)
+                if shared is not None:
+                    with self._lock:
+                        self.stats["collapsed_cross_process"] += 1
+                    return shared
+            try:
+                result = self._compute(fn)
+                self._write_result(base, result)
+                return result
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _wait_for_lock(self, lock_file):
+        """Polls for the exclusive lock until lock_timeout_s; True once it is held."""
+        deadline = time.monotonic() + self.lock_timeout_s
+        delay = 0.001
+        while True:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return True
+            except BlockingIOError:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                time.sleep(min(delay, remaining))
+                delay = min(delay * 2, 0.05)
+
+    def _read_result(self, base, not_before_ns):
+        """The stored result if it was written at or after not_before_ns, else None."""
+        path = base + ".result"
+        try:
+            if os.stat(path).st_mtime_ns < not_before_ns:
+                return None
+            with open(path, "rb") as f:
+                return f.read().decode("utf-8")
+        except OSError:
+            return None
+
+    def _write_result(self, base, result):
+        data = result.encode("utf-8") if isinstance(result, str) else result
+        tmp_path = f"{base}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, base + ".result") # Atomic for readers
+        self._prune()
+
+    def _prune(self, max_age_s=60.0):
+        """
+        Removes result files no waiter can still accept, and their lock files
+        when no process holds them. (Losing that race only costs a duplicate
+        computation, never a wrong result.)
+        """
+        now = time.time()
+        if now - self._last_prune < max_age_s / 2:
+            return
+        self._last_prune = now
+        cutoff = now - max(max_age_s, self.lock_timeout_s)
+        try:
+            entries = list(os.scandir(self.store_dir))
+        except OSError:
+            return
+        for entry in entries:
+            if not entry.name.endswith(".result"):
+                continue
+            try:
+                if entry.stat().st_mtime >= cutoff:
+                    continue
+                os.remove(entry.path)
+                lock_path = entry.path[:-len(".result")] + ".lock"
+                with open(lock_path, "a+b") as lock_file:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    os.remove(lock_path)
+            except OSError: # Includes BlockingIOError: lock in use, keep it
+                pass
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self.stats)
+            stats["in_flight"] = len(self._calls)
+        stats["collapsed_total"] = stats["collapsed_in_process"] + stats["collapsed_cross_process"]
+        stats["cross_process"] = bool(self.store_dir and fcntl is not None)
+        return stats
+
+
+def _private_dir(path):
+    """Creates path with mode 0700 if needed; True if it is safe to trust files in it."""
+    try:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        st = os.lstat(path)
+    except OSError as e:
+        logging.getLogger(__name__).warning("Single-flight store %s unusable (%s); coalescing in-process only", path, e)
+        return False
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        logging.getLogger(__name__).warning(
+            "Single-flight store %s is not a private directory owned by this user (mode 0700); "
+            "coalescing in-process only", path)
+        return False
+    return True
+
+
+def default_store_dir():
+    """SINGLE_FLIGHT_DIR, else a per-user directory (never one shared between users)."""
+    if os.environ.get("SINGLE_FLIGHT_DIR"):
+        return os.environ["SINGLE_FLIGHT_DIR"]
+    if os.environ.get("XDG_RUNTIME_DIR"): # Per-user, 0700, tmpfs
+        return os.path.join(os.environ["XDG_RUNTIME_DIR"], "structural_single_flight")
+    uid = os.getuid() if hasattr(os, "getuid") else os.getpid()
+    return os.path.join(tempfile.gettempdir(), f"structural_single_flight-{uid}")
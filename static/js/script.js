@@ -44,6 +44,7 @@ document.addEventListener('DOMContentLoaded', function () {
     const effLengthFactorKyValueDisplay = document.getElementById('effLengthFactorKyValue');
 
     const calculateButton = document.getElementById('calculateButton');
+    const liveUpdateToggle = document.getElementById('liveUpdateToggle');
     const errorDisplay = document.getElementById('errorDisplay');
     const summaryResultsDiv = document.getElementById('summaryResults');
     const failureChecksListDiv = document.getElementById('failureChecksList');
@@ -105,6 +106,16 @@ document.addEventListener('DOMContentLoaded', function () {
     let currentResultsData = null; // Store last successful calculation data
     let currentInputPayloadData = null; // Store last input payload
 
+    // Render state reused across updates (see plotDiagram and scheduleCanvasDraw)
+    const PLOT_CONFIG = { responsive: true, displaylogo: false };
+    const plotDivs = [sfdPlotDiv, bmdPlotDiv, deflectionPlotDiv];
+    const plotLayouts = new Map(); // div id -> layout last passed to Plotly
+    const pendingCanvasDraws = new Map(); // canvas id -> draw callback
+    let canvasFrameRequested = false;
+    let canvasState = {}; // element / crossSection -> what was last painted
+    let beamStaticLayer = null; // Offscreen canvas
+    let beamStaticLayerKey = null;
+
     function setTheme(theme) {
         document.documentElement.setAttribute('data-theme', theme);
         localStorage.setItem('theme', theme);
@@ -118,9 +129,11 @@ document.addEventListener('DOMContentLoaded', function () {
             themeIconDark.style.display = 'none';
         }
 
-        // Re-render Plotly charts and Canvas diagrams if data exists
+        // Recolor plots in place and repaint the canvases from the last results
+        restylePlots();
         if (currentResultsData && currentInputPayloadData) {
-            displayResults(currentResultsData, currentInputPayloadData, false); // false to prevent clearing inputs
+            invalidateCanvasCaches();
+            renderCanvases(currentResultsData, currentInputPayloadData);
         } else {
             // If no results yet, just ensure canvas placeholders are correctly styled if needed
             // (though they should adapt via CSS vars for color)
@@ -130,9 +143,8 @@ document.addEventListener('DOMContentLoaded', function () {
     }
     
     function clearDiagramsOnly() {
-        if (sfdPlotDiv && typeof Plotly !== 'undefined' && sfdPlotDiv.data) Plotly.purge(sfdPlotDiv);
-        if (bmdPlotDiv && typeof Plotly !== 'undefined' && bmdPlotDiv.data) Plotly.purge(bmdPlotDiv);
-        if (deflectionPlotDiv && typeof Plotly !== 'undefined' && deflectionPlotDiv.data) Plotly.purge(deflectionPlotDiv);
+        purgePlots();
+        invalidateCanvasCaches();
         if (elementCtx) elementCtx.clearRect(0, 0, elementDiagramCanvas.width, elementDiagramCanvas.height);
         if (csCtx) csCtx.clearRect(0, 0, crossSectionCanvas.width, crossSectionCanvas.height);
         if(elementDiagramPlaceholder) elementDiagramPlaceholder.style.display = 'block';
@@ -265,14 +277,8 @@ document.addEventListener('DOMContentLoaded', function () {
 
     calculateButton.addEventListener('click', performCalculation);
 
-    async function performCalculation() {
-        errorDisplay.style.display = 'none'; errorDisplay.textContent = '';
-        placeholderTexts.forEach(el => el.style.display = 'none'); // Hide all placeholders
-
-        calculateButton.disabled = true;
-        calculateButton.innerHTML = '<span class="spinner"></span> Calculating...';
-
-        const payload = { /* ... (same as before) ... */
+    function buildPayload() {
+        const payload = {
             elementType: elementTypeSelect.value,
             length: parseFloat(lengthInput.value),
             material: materialSelect.value,
@@ -285,6 +291,8 @@ document.addEventListener('DOMContentLoaded', function () {
         if (payload.elementType === 'beam') {
             payload.beamSupportType = beamSupportTypeSelect.value;
             payload.beamLoadType = beamLoadTypeSelect.value;
+            // Server downsamples diagrams to ~2 points (min/max) per horizontal pixel
+            payload.maxPlotPoints = Math.max(100, Math.round((sfdPlotDiv.clientWidth || 600) * 2));
             if (payload.beamLoadType === 'pointLoad' || payload.beamLoadType === 'pointLoadEnd') {
                 payload.pointLoad = parseFloat(pointLoadInput.value);
                 if (payload.beamLoadType === 'pointLoad') payload.pointLoadPositionRatio = parseFloat(pointLoadPositionRatioInput.value);
@@ -294,15 +302,30 @@ document.addEventListener('DOMContentLoaded', function () {
             payload.effLengthFactorKx = parseFloat(effLengthFactorKxInput.value);
             payload.effLengthFactorKy = parseFloat(effLengthFactorKyInput.value);
         }
+        return payload;
+    }
+
+    let calculationSeq = 0; // Responses from superseded requests are ignored
+
+    async function performCalculation() {
+        errorDisplay.style.display = 'none'; errorDisplay.textContent = '';
+        placeholderTexts.forEach(el => el.style.display = 'none'); // Hide all placeholders
+
+        calculateButton.disabled = true;
+        calculateButton.innerHTML = '<span class="spinner"></span> Calculating...';
+
+        const payload = buildPayload();
+        const seq = ++calculationSeq;
 
         try {
             const response = await fetch('/calculate', { method: 'POST', headers: { 'Content-Type': 'application/json' }, body: JSON.stringify(payload) });
             const data = await response.json();
+            if (seq !== calculationSeq) return; // A newer calculation was started
             if (!response.ok || data.error) throw new Error(data.error || `Server error: ${response.status}`);
             
             currentResultsData = data; // Store for theme changes
             currentInputPayloadData = payload; // Store for theme changes
-            displayResults(data, payload, true); // true to clear previous results fully
+            displayResults(data, payload);
 
         } catch (err) {
             console.error("Calculation error:", err);
@@ -316,6 +339,99 @@ document.addEventListener('DOMContentLoaded', function () {
         }
     }
 
+    // --- Live Update (SSE stream + POST updates) ---
+    // The server coalesces rapid updates and pushes only the newest result;
+    // diagrams with unchanged x coordinates arrive as bare value arrays (delta).
+    const DIAGRAM_VALUE_KEYS = { sfd_points: 'v', bmd_points: 'm', deflection_points: 'd' };
+    let liveSource = null;
+    let liveSessionId = null;
+    let liveSeq = 0;
+    let liveDisplayedSeq = 0;
+    let livePayloads = new Map(); // seq -> payload, for the pushed result
+    let liveLastFrame = null; // Last full live result: the server's delta base (a manual Calculate is not)
+    let liveUpdateScheduled = false;
+
+    function applyLiveDelta(delta) {
+        const data = { ...delta, results: { ...delta.results } };
+        for (const [key, values] of Object.entries(delta.diagram_values || {})) {
+            const valueKey = DIAGRAM_VALUE_KEYS[key];
+            const previous = liveLastFrame.results[key];
+            data.results[key] = previous.map((p, i) => ({ x: p.x, [valueKey]: values[i] }));
+        }
+        delete data.diagram_values;
+        return data;
+    }
+
+    function handleLiveMessage(event) {
+        const message = JSON.parse(event.data);
+        if (message.seq <= liveDisplayedSeq) return; // Stale
+        const payload = livePayloads.get(message.seq);
+        for (const seq of livePayloads.keys()) if (seq <= message.seq) livePayloads.delete(seq);
+        if (!payload) return;
+        let data = message.data;
+        if (message.delta) {
+            if (!liveLastFrame) { restartLive(); return; } // No base to apply it to; a new session starts with a full frame
+            data = applyLiveDelta(message.delta);
+        }
+        liveDisplayedSeq = message.seq;
+        if (data.error) {
+            errorDisplay.textContent = `Error: ${data.error}`;
+            errorDisplay.style.display = 'block';
+            return;
+        }
+        errorDisplay.style.display = 'none';
+        liveLastFrame = data;
+        currentResultsData = data;
+        currentInputPayloadData = payload;
+        displayResults(data, payload);
+    }
+
+    function sendLiveUpdate() {
+        liveUpdateScheduled = false;
+        if (!liveSource || !liveSessionId) return;
+        const payload = buildPayload();
+        const seq = ++liveSeq;
+        livePayloads.set(seq, payload);
+        fetch('/live/update', { method: 'POST', headers: { 'Content-Type': 'application/json' }, body: JSON.stringify({ session: liveSessionId, seq, payload }) })
+            .then(response => { if (response.status === 404) restartLive(); })
+            .catch(err => console.error("Live update error:", err));
+    }
+
+    function scheduleLiveUpdate() {
+        if (!liveSource || liveUpdateScheduled) return;
+        liveUpdateScheduled = true; // At most one POST per animation frame
+        requestAnimationFrame(sendLiveUpdate);
+    }
+
+    function startLive() {
+        stopLive();
+        liveSource = new EventSource('/live/stream?delta=1');
+        liveSource.addEventListener('session', (event) => {
+            liveSessionId = JSON.parse(event.data).session;
+            liveSeq = 0; liveDisplayedSeq = 0; livePayloads.clear(); liveLastFrame = null;
+            placeholderTexts.forEach(el => el.style.display = 'none');
+            sendLiveUpdate();
+        });
+        liveSource.addEventListener('result', handleLiveMessage);
+        liveSource.onerror = () => console.warn("Live stream interrupted; the browser will reconnect.");
+    }
+
+    function stopLive() {
+        if (liveSource) liveSource.close();
+        liveSource = null; liveSessionId = null;
+    }
+
+    function restartLive() {
+        if (liveUpdateToggle && liveUpdateToggle.checked) startLive();
+    }
+
+    if (liveUpdateToggle) {
+        liveUpdateToggle.addEventListener('change', () => liveUpdateToggle.checked ? startLive() : stopLive());
+        const controlsMain = document.querySelector('.controls-main');
+        controlsMain.addEventListener('input', (event) => { if (event.target !== liveUpdateToggle) scheduleLiveUpdate(); });
+        controlsMain.addEventListener('change', (event) => { if (event.target !== liveUpdateToggle) scheduleLiveUpdate(); });
+    }
+
     function clearResults(fullClear = true) {
         summaryResultsDiv.innerHTML = '';
         failureChecksListDiv.innerHTML = '';
@@ -340,10 +456,8 @@ document.addEventListener('DOMContentLoaded', function () {
                   .map(word => word.charAt(0).toUpperCase() + word.slice(1)).join(' ');
     }
 
-    function displayResults(data, inputPayload, isNewCalculation = true) {
-        if (isNewCalculation) clearResults(true); // Full clear for a new calculation
-        else clearDiagramsOnly(); // Only clear diagrams if re-rendering for theme change
-
+    function displayResults(data, inputPayload) {
+        // Updates plots and canvases in place; see plotDiagram and renderCanvases
         placeholderTexts.forEach(el => el.style.display = 'none');
         if(elementDiagramPlaceholder) elementDiagramPlaceholder.style.display = 'none';
         if(csCanvasPlaceholder) csCanvasPlaceholder.style.display = 'none';
@@ -365,25 +479,24 @@ document.addEventListener('DOMContentLoaded', function () {
             summaryHtml += `<p><strong>Max Bending Stress (abs):</strong> ${(Math.max(Math.abs(results.max_bending_stress_Pa || 0), Math.abs(results.min_bending_stress_Pa || 0))/1e6).toFixed(2)} MPa</p>`;
             summaryHtml += `<p><strong>Max Shear Stress (approx):</strong> ${((results.max_shear_stress_Pa || 0)/1e6).toFixed(2)} MPa</p>`;
 
-            const x_sfd = results.sfd_points.map(p => p.x); const v_sfd = results.sfd_points.map(p => p.v / 1000);
-            const x_bmd = results.bmd_points.map(p => p.x); const m_bmd = results.bmd_points.map(p => p.m / 1000);
-            const x_defl = results.deflection_points.map(p => p.x); const d_defl = results.deflection_points.map(p => p.d * 1000);
+            const sfd = diagramSeries(results.sfd_points, 'v', 1 / 1000);
+            const bmd = diagramSeries(results.bmd_points, 'm', 1 / 1000);
+            const defl = diagramSeries(results.deflection_points, 'd', 1000);
 
-            plotDiagram(sfdPlotDiv, x_sfd, v_sfd, 'Position (m)', 'Shear Force (kN)', 'Shear Force Diagram (SFD)');
-            plotDiagram(bmdPlotDiv, x_bmd, m_bmd, 'Position (m)', 'Bending Moment (kNm)', 'Bending Moment Diagram (BMD)', true);
-            plotDiagram(deflectionPlotDiv, x_defl, d_defl, 'Position (m)', 'Deflection (mm)', 'Deflection Diagram', results.max_deflection_m < 0);
-            drawBeamDiagram(element_info, results, inputPayload);
-            drawCrossSectionStress(element_info, results, inputPayload.elementType);
+            plotDiagram(sfdPlotDiv, sfd.x, sfd.y, 'Position (m)', 'Shear Force (kN)', 'Shear Force Diagram (SFD)');
+            plotDiagram(bmdPlotDiv, bmd.x, bmd.y, 'Position (m)', 'Bending Moment (kNm)', 'Bending Moment Diagram (BMD)', true);
+            plotDiagram(deflectionPlotDiv, defl.x, defl.y, 'Position (m)', 'Deflection (mm)', 'Deflection Diagram', results.max_deflection_m < 0);
         } else if (inputPayload.elementType === 'column') {
             summaryHtml += `<p><strong>Axial Load (P):</strong> ${(inputPayload.axialLoad).toFixed(1)} kN</p>`;
             summaryHtml += `<p><strong>Axial Stress (σ):</strong> ${((results.axial_stress_Pa || 0) / 1e6).toFixed(2)} MPa</p>`;
             summaryHtml += `<p><strong>Min Critical Buckling Load (Pcr):</strong> ${((results.min_critical_buckling_load_N || 0) / 1000).toFixed(1)} kN</p>`;
             summaryHtml += `<p style="padding-left: 15px;">• Pcr,x: ${((results.critical_buckling_load_Pcr_x_N || 0) / 1000).toFixed(1)} kN (Kx=${element_info.Kx !== undefined ? element_info.Kx.toFixed(2) : 'N/A'})</p>`;
             summaryHtml += `<p style="padding-left: 15px;">• Pcr,y: ${((results.critical_buckling_load_Pcr_y_N || 0) / 1000).toFixed(1)} kN (Ky=${element_info.Ky !== undefined ? element_info.Ky.toFixed(2) : 'N/A'})</p>`;
-            drawColumnDiagram(element_info, results, inputPayload);
-            drawCrossSectionStress(element_info, results, inputPayload.elementType);
+            purgePlots(); // No diagrams for columns
         }
         summaryResultsDiv.innerHTML = summaryHtml;
+        describeCrossSectionStress(element_info, results, inputPayload.elementType);
+        renderCanvases(data, inputPayload);
 
         let failureHtml = '<ul>';
         if (results.failure_checks && Object.keys(results.failure_checks).length > 0) {
@@ -408,123 +521,277 @@ document.addEventListener('DOMContentLoaded', function () {
         failureChecksListDiv.innerHTML = failureHtml;
     }
 
-    function plotDiagram(divElement, xData, yData, xAxisTitle, yAxisTitle, plotTitle, invertY = false) {
-        const trace = {
-            x: xData, y: yData, type: 'scatter', mode: 'lines+markers',
-            marker: { size: 6, color: themeColors.primaryHover || '#0056b3' },
-            line: { color: themeColors.primary || '#007bff', width: 2.5 }
-        };
-        const layout = {
+    // --- Plotly Diagrams ---
+    // Plots are created once and then updated with Plotly.react (typed arrays,
+    // cached layout, datarevision bump), so an update re-renders the traces
+    // instead of rebuilding the plot; uirevision keeps the user's zoom.
+    function diagramSeries(points, valueKey, scale) {
+        const x = new Float64Array(points.length); const y = new Float64Array(points.length);
+        for (let i = 0; i < points.length; i++) { x[i] = points[i].x; y[i] = points[i][valueKey] * scale; }
+        return { x, y };
+    }
+
+    function buildPlotLayout(xAxisTitle, yAxisTitle, plotTitle, invertY) {
+        return {
             title: { text: plotTitle, font: { family: themeColors.fontFamily, size: 18, color: themeColors.text }, x: 0.05, xanchor: 'left', y: 0.95, yanchor: 'top'},
             xaxis: { title: { text: xAxisTitle, font: { family: themeColors.fontFamily, size: 14, color: themeColors.mutedText } }, zeroline: true, zerolinewidth:1.5, zerolinecolor: themeColors.diagramGridLineColor, gridcolor: themeColors.diagramGridLineColor, tickfont: { family: themeColors.fontFamily, color: themeColors.textLight }, linecolor: themeColors.border, mirror: true },
             yaxis: { title: { text: yAxisTitle, font: { family: themeColors.fontFamily, size: 14, color: themeColors.mutedText } }, zeroline: true, zerolinewidth:1.5, zerolinecolor: themeColors.diagramGridLineColor, autorange: invertY ? 'reversed' : true, gridcolor: themeColors.diagramGridLineColor, tickfont: { family: themeColors.fontFamily, color: themeColors.textLight }, linecolor: themeColors.border, mirror: true },
             margin: { l: 75, r: 30, t: 70, b: 65 },
             paper_bgcolor: themeColors.cardBackground,
             plot_bgcolor: themeColors.cardBackground,
-            font: { family: themeColors.fontFamily, color: themeColors.text }
+            font: { family: themeColors.fontFamily, color: themeColors.text },
+            uirevision: plotTitle,
+            datarevision: 0
+        };
+    }
+
+    function plotDiagram(divElement, xData, yData, xAxisTitle, yAxisTitle, plotTitle, invertY = false) {
+        const trace = {
+            x: xData, y: yData, type: 'scatter', mode: 'lines+markers',
+            marker: { size: 6, color: themeColors.primaryHover || '#0056b3' },
+            line: { color: themeColors.primary || '#007bff', width: 2.5 }
         };
-        Plotly.newPlot(divElement, [trace], layout, {responsive: true, displaylogo: false});
+        const cached = plotLayouts.get(divElement.id);
+        let layout;
+        if (cached && divElement.data && cached.title.text === plotTitle && cached.xaxis.title.text === xAxisTitle && cached.yaxis.title.text === yAxisTitle) {
+            layout = { ...cached, yaxis: { ...cached.yaxis, autorange: invertY ? 'reversed' : true }, datarevision: cached.datarevision + 1 };
+        } else layout = buildPlotLayout(xAxisTitle, yAxisTitle, plotTitle, invertY);
+        plotLayouts.set(divElement.id, layout);
+        Plotly.react(divElement, [trace], layout, PLOT_CONFIG);
+    }
+
+    function restylePlots() {
+        // Theme change: recolor the existing plots in place (one Plotly.update each)
+        if (typeof Plotly === 'undefined') return;
+        const traceUpdate = { 'marker.color': themeColors.primaryHover || '#0056b3', 'line.color': themeColors.primary || '#007bff' };
+        const layoutUpdate = {
+            'title.font.family': themeColors.fontFamily, 'title.font.color': themeColors.text,
+            paper_bgcolor: themeColors.cardBackground, plot_bgcolor: themeColors.cardBackground,
+            'font.family': themeColors.fontFamily, 'font.color': themeColors.text
+        };
+        for (const axis of ['xaxis', 'yaxis']) {
+            Object.assign(layoutUpdate, {
+                [`${axis}.title.font.family`]: themeColors.fontFamily, [`${axis}.title.font.color`]: themeColors.mutedText,
+                [`${axis}.zerolinecolor`]: themeColors.diagramGridLineColor, [`${axis}.gridcolor`]: themeColors.diagramGridLineColor,
+                [`${axis}.tickfont.family`]: themeColors.fontFamily, [`${axis}.tickfont.color`]: themeColors.textLight,
+                [`${axis}.linecolor`]: themeColors.border
+            });
+        }
+        plotDivs.forEach(div => {
+            if (!div || !div.data) return;
+            Plotly.update(div, traceUpdate, layoutUpdate);
+            plotLayouts.set(div.id, div.layout); // Plotly.update applies the changes to div.layout
+        });
+    }
+
+    function purgePlots() {
+        if (typeof Plotly === 'undefined') return;
+        plotDivs.forEach(div => { if (div && div.data) Plotly.purge(div); });
+        plotLayouts.clear();
+    }
+
+    // --- Canvas Rendering ---
+    // Canvas draws are queued and run in requestAnimationFrame, at most once per
+    // canvas per frame (the latest request wins). Each canvas remembers what it
+    // last painted: unchanged diagrams are skipped, and on the beam diagram a
+    // change confined to the load annotation repaints only the band above the
+    // beam, over a cached layer holding the outline, supports and dimension line.
+    function scheduleCanvasDraw(canvas, draw) {
+        pendingCanvasDraws.set(canvas.id, draw);
+        if (canvasFrameRequested) return;
+        canvasFrameRequested = true;
+        requestAnimationFrame(() => {
+            canvasFrameRequested = false;
+            const draws = [...pendingCanvasDraws.values()];
+            pendingCanvasDraws.clear();
+            draws.forEach(draw => draw());
+        });
+    }
+
+    function invalidateCanvasCaches() {
+        pendingCanvasDraws.clear();
+        canvasState = {};
+        beamStaticLayerKey = null;
+    }
+
+    function renderCanvases(data, inputPayload) {
+        const { element_info, results } = data;
+        if (inputPayload.elementType === 'beam') scheduleCanvasDraw(elementDiagramCanvas, () => drawBeamDiagram(element_info, results, inputPayload));
+        else if (inputPayload.elementType === 'column') scheduleCanvasDraw(elementDiagramCanvas, () => drawColumnDiagram(element_info, results, inputPayload));
+        else return;
+        scheduleCanvasDraw(crossSectionCanvas, () => drawCrossSectionStress(element_info, results, inputPayload.elementType));
     }
 
-    // --- Canvas Drawing Functions ---
     // (Make sure these functions use the themeColors object for all color assignments)
-    function drawBeamDiagram(element_info, results, inputs) {
-        elementCtx.clearRect(0, 0, elementDiagramCanvas.width, elementDiagramCanvas.height);
-        if(elementDiagramPlaceholder) elementDiagramPlaceholder.style.display = 'none';
+    function beamDiagramGeometry(element_info) {
         const L_px = elementDiagramCanvas.width * 0.8;
         const L_m = element_info.length_m;
         const scale = L_m > 0 ? L_px / L_m : L_px;
-        const margin_x = elementDiagramCanvas.width * 0.1;
-        const y_beam_centerline = elementDiagramCanvas.height * 0.4;
-        const y_deflected_beam_center = elementDiagramCanvas.height * 0.75;
         let section_depth_m = 0.1;
         if (element_info.cross_section.cy_top_m !== undefined && element_info.cross_section.cy_bottom_m !== undefined) section_depth_m = element_info.cross_section.cy_top_m + element_info.cross_section.cy_bottom_m;
         else if (element_info.cross_section.type.toLowerCase() === "circular" && element_info.cross_section.cx_right_m !== undefined) section_depth_m = 2 * element_info.cross_section.cx_right_m;
-        const beam_thickness_px = Math.max(10, Math.min(30, section_depth_m * scale * 0.35 + 6));
+        return {
+            L_px, L_m, scale,
+            margin_x: elementDiagramCanvas.width * 0.1,
+            y_beam_centerline: elementDiagramCanvas.height * 0.4,
+            y_deflected_beam_center: elementDiagramCanvas.height * 0.75,
+            beam_thickness_px: Math.max(10, Math.min(30, section_depth_m * scale * 0.35 + 6)),
+            support_size: 18
+        };
+    }
 
-        const moment_values = results.bmd_points ? results.bmd_points.map(p => p.m || 0) : [];
-        const max_abs_moment_val = moment_values.length > 0 ? Math.max(...moment_values.map(m => Math.abs(m))) : 0;
-        if (max_abs_moment_val > 0 && results.bmd_points) {
-            for (let i = 0; i < results.bmd_points.length - 1; i++) {
-                const p1 = results.bmd_points[i]; const p2 = results.bmd_points[i+1];
+    function beamDiagramPlan(geom, results) {
+        // Pixel-space content of the moment gradient and deflected shape (what gets painted)
+        const { scale, margin_x } = geom;
+        const gradient = []; // [x_px, width_px, color]
+        const bmd_points = results.bmd_points || [];
+        let max_abs_moment_val = 0;
+        for (const p of bmd_points) max_abs_moment_val = Math.max(max_abs_moment_val, Math.abs(p.m || 0));
+        if (max_abs_moment_val > 0) {
+            for (let i = 0; i < bmd_points.length - 1; i++) {
+                const p1 = bmd_points[i]; const p2 = bmd_points[i+1];
                 const x1_px = margin_x + (p1.x || 0) * scale; const x2_px = margin_x + (p2.x || 0) * scale;
                 const segment_moment_avg = (p1.m + p2.m) / 2;
-                const color = getColorForMomentGradient(Math.abs(segment_moment_avg), 0, max_abs_moment_val);
-                elementCtx.fillStyle = color;
-                elementCtx.fillRect(x1_px, y_beam_centerline - beam_thickness_px / 2, (x2_px - x1_px + 1), beam_thickness_px);
+                gradient.push([x1_px, x2_px - x1_px + 1, getColorForMomentGradient(Math.abs(segment_moment_avg), 0, max_abs_moment_val)]);
             }
         }
-        elementCtx.strokeStyle = themeColors.diagramSupportColor; elementCtx.lineWidth = 2;
-        elementCtx.strokeRect(margin_x, y_beam_centerline - beam_thickness_px / 2, L_px, beam_thickness_px);
-        elementCtx.lineWidth = 1;
+        const deflection_points = results.deflection_points || [];
+        const deflected = new Float64Array(2 * deflection_points.length); // x0, y0, x1, y1, ...
+        let max_abs_deflection_m = 0;
+        for (const p of deflection_points) max_abs_deflection_m = Math.max(max_abs_deflection_m, Math.abs(p.d || 0));
+        let exaggeration_factor = max_abs_deflection_m > 0 ? (elementDiagramCanvas.height * 0.20) / max_abs_deflection_m : 0;
+        exaggeration_factor = Math.min(exaggeration_factor, 7000);
+        for (let i = 0; i < deflection_points.length; i++) {
+            deflected[2 * i] = margin_x + (deflection_points[i].x || 0) * scale;
+            deflected[2 * i + 1] = geom.y_deflected_beam_center + (deflection_points[i].d || 0) * exaggeration_factor;
+        }
+        return { gradient, deflected };
+    }
+
+    function sameBeamPlan(a, b) {
+        const tol_px = 0.01;
+        if (a.gradient.length !== b.gradient.length || a.deflected.length !== b.deflected.length) return false;
+        for (let i = 0; i < a.gradient.length; i++) {
+            const [ax, aw, ac] = a.gradient[i]; const [bx, bw, bc] = b.gradient[i];
+            if (ac !== bc || Math.abs(ax - bx) > tol_px || Math.abs(aw - bw) > tol_px) return false;
+        }
+        for (let i = 0; i < a.deflected.length; i++) if (Math.abs(a.deflected[i] - b.deflected[i]) > tol_px) return false;
+        return true;
+    }
+
+    function paintBeamStaticLayer(ctx, geom, inputs) {
+        const { L_px, L_m, margin_x, y_beam_centerline, beam_thickness_px, support_size } = geom;
+        ctx.strokeStyle = themeColors.diagramSupportColor; ctx.lineWidth = 2;
+        ctx.strokeRect(margin_x, y_beam_centerline - beam_thickness_px / 2, L_px, beam_thickness_px);
+        ctx.lineWidth = 1;
 
-        const support_size = 18;
         if (inputs.beamSupportType === 'simplySupported') {
-            drawTriangleSupport(elementCtx, margin_x, y_beam_centerline + beam_thickness_px / 2, support_size, themeColors.diagramSupportColor);
-            drawRollerSupport(elementCtx, margin_x + L_px, y_beam_centerline + beam_thickness_px / 2, support_size, themeColors.diagramSupportColor);
+            drawTriangleSupport(ctx, margin_x, y_beam_centerline + beam_thickness_px / 2, support_size, themeColors.diagramSupportColor);
+            drawRollerSupport(ctx, margin_x + L_px, y_beam_centerline + beam_thickness_px / 2, support_size, themeColors.diagramSupportColor);
         } else if (inputs.beamSupportType === 'cantilever') {
-            elementCtx.fillStyle = themeColors.diagramSupportColor;
-            elementCtx.fillRect(margin_x - support_size, y_beam_centerline - beam_thickness_px*1.3, support_size, beam_thickness_px * 2.6);
-            elementCtx.strokeStyle = themeColors.diagramSupportColor;
-            elementCtx.strokeRect(margin_x - support_size, y_beam_centerline - beam_thickness_px*1.3, support_size, beam_thickness_px * 2.6);
+            ctx.fillStyle = themeColors.diagramSupportColor;
+            ctx.fillRect(margin_x - support_size, y_beam_centerline - beam_thickness_px*1.3, support_size, beam_thickness_px * 2.6);
+            ctx.strokeStyle = themeColors.diagramSupportColor;
+            ctx.strokeRect(margin_x - support_size, y_beam_centerline - beam_thickness_px*1.3, support_size, beam_thickness_px * 2.6);
             for (let i = 0; i < 6; i++) {
-                elementCtx.beginPath();
-                elementCtx.moveTo(margin_x - support_size, y_beam_centerline - beam_thickness_px * 1.3 + i * (beam_thickness_px * 2.6 / 5));
-                elementCtx.lineTo(margin_x - support_size - 6, y_beam_centerline - beam_thickness_px * 1.3 + i * (beam_thickness_px * 2.6 / 5) + 6);
-                elementCtx.stroke();
+                ctx.beginPath();
+                ctx.moveTo(margin_x - support_size, y_beam_centerline - beam_thickness_px * 1.3 + i * (beam_thickness_px * 2.6 / 5));
+                ctx.lineTo(margin_x - support_size - 6, y_beam_centerline - beam_thickness_px * 1.3 + i * (beam_thickness_px * 2.6 / 5) + 6);
+                ctx.stroke();
             }
         }
+
+        ctx.strokeStyle = themeColors.diagramDimensionLineColor; ctx.lineWidth = 0.75;
+        const dimY = y_beam_centerline + beam_thickness_px / 2 + support_size + 25;
+        ctx.beginPath(); ctx.moveTo(margin_x, dimY - 5); ctx.lineTo(margin_x, dimY + 5);
+        ctx.moveTo(margin_x + L_px, dimY - 5); ctx.lineTo(margin_x + L_px, dimY + 5);
+        ctx.moveTo(margin_x, dimY); ctx.lineTo(margin_x + L_px, dimY); ctx.stroke();
+        ctx.fillStyle = themeColors.diagramDimensionLineColor; ctx.textAlign = 'center';
+        ctx.font = "12px " + themeColors.fontFamily;
+        ctx.fillText(`L = ${L_m.toFixed(1)} m`, margin_x + L_px / 2, dimY - 8);
+        ctx.textAlign = 'start'; ctx.lineWidth = 1;
+    }
+
+    function paintBeamLoads(ctx, geom, inputs) {
+        const { L_px, margin_x, y_beam_centerline, beam_thickness_px } = geom;
         const load_arrow_top_y = y_beam_centerline - beam_thickness_px / 2 - 30;
         const load_arrow_bottom_y = y_beam_centerline - beam_thickness_px / 2 - 3;
-        elementCtx.textAlign = 'center'; elementCtx.font = "13px " + themeColors.fontFamily; elementCtx.fillStyle = themeColors.diagramTextColor;
+        ctx.textAlign = 'center'; ctx.font = "13px " + themeColors.fontFamily; ctx.fillStyle = themeColors.diagramTextColor;
 
         if (inputs.beamLoadType.includes('pointLoad')) {
             const load_x_ratio = inputs.beamLoadType === 'pointLoadEnd' ? 1.0 : (inputs.pointLoadPositionRatio || 0.5);
             const load_x_px = margin_x + L_px * load_x_ratio;
-            drawArrow(elementCtx, load_x_px, load_arrow_top_y, load_x_px, load_arrow_bottom_y, themeColors.diagramLoadColor, 12);
-            elementCtx.fillStyle = themeColors.diagramLoadColor;
-            elementCtx.fillText(`${inputs.pointLoad || 0} kN`, load_x_px, load_arrow_top_y - 8);
+            drawArrow(ctx, load_x_px, load_arrow_top_y, load_x_px, load_arrow_bottom_y, themeColors.diagramLoadColor, 12);
+            ctx.fillStyle = themeColors.diagramLoadColor;
+            ctx.fillText(`${inputs.pointLoad || 0} kN`, load_x_px, load_arrow_top_y - 8);
         } else if (inputs.beamLoadType === 'udl') {
             const numArrows = Math.min(12, Math.max(5, Math.floor(L_px / 50)));
             const udlRectTopY = load_arrow_top_y + 5; const udlRectBottomY = load_arrow_bottom_y;
-            elementCtx.fillStyle = themeColors.diagramUdlColor.replace(')', ', 0.15)'); // Add alpha
-            elementCtx.fillRect(margin_x, udlRectTopY, L_px, udlRectBottomY - udlRectTopY);
-            elementCtx.strokeStyle = themeColors.diagramUdlColor.replace(')', ', 0.6)'); // Add alpha
-            elementCtx.strokeRect(margin_x, udlRectTopY, L_px, udlRectBottomY - udlRectTopY);
+            ctx.fillStyle = themeColors.diagramUdlColor.replace(')', ', 0.15)'); // Add alpha
+            ctx.fillRect(margin_x, udlRectTopY, L_px, udlRectBottomY - udlRectTopY);
+            ctx.strokeStyle = themeColors.diagramUdlColor.replace(')', ', 0.6)'); // Add alpha
+            ctx.strokeRect(margin_x, udlRectTopY, L_px, udlRectBottomY - udlRectTopY);
             const arrowSpacing = L_px / (numArrows +1) ;
             for (let i = 1; i <= numArrows; i++) {
                 const arrowX = margin_x + i * arrowSpacing;
-                drawArrow(elementCtx, arrowX, udlRectTopY, arrowX, udlRectBottomY, themeColors.diagramUdlColor, 7);
+                drawArrow(ctx, arrowX, udlRectTopY, arrowX, udlRectBottomY, themeColors.diagramUdlColor, 7);
             }
-            elementCtx.fillStyle = themeColors.diagramUdlColor;
-            elementCtx.fillText(`${inputs.udlValue || 0} kN/m`, margin_x + L_px / 2, udlRectTopY - 8);
+            ctx.fillStyle = themeColors.diagramUdlColor;
+            ctx.fillText(`${inputs.udlValue || 0} kN/m`, margin_x + L_px / 2, udlRectTopY - 8);
         }
-        elementCtx.textAlign = 'start';
+        ctx.textAlign = 'start';
+    }
+
+    function drawBeamDiagram(element_info, results, inputs) {
+        if(elementDiagramPlaceholder) elementDiagramPlaceholder.style.display = 'none';
+        const width = elementDiagramCanvas.width; const height = elementDiagramCanvas.height;
+        const geom = beamDiagramGeometry(element_info);
+        const staticKey = JSON.stringify([geom.L_m, geom.beam_thickness_px, inputs.beamSupportType]);
+        const loadKey = JSON.stringify([inputs.beamLoadType, inputs.pointLoadPositionRatio, inputs.pointLoad, inputs.udlValue]);
+        const plan = beamDiagramPlan(geom, results);
+
+        const last = canvasState.element;
+        if (last && last.type === 'beam' && last.staticKey === staticKey && sameBeamPlan(last.plan, plan)) {
+            if (last.loadKey !== loadKey) {
+                // Loads, arrows and their labels live above the beam; nothing else drawn there changes
+                const band_height = Math.floor(geom.y_beam_centerline - geom.beam_thickness_px / 2 - 1);
+                elementCtx.save();
+                elementCtx.beginPath(); elementCtx.rect(0, 0, width, band_height); elementCtx.clip();
+                elementCtx.clearRect(0, 0, width, band_height);
+                elementCtx.drawImage(beamStaticLayer, 0, 0, width, band_height, 0, 0, width, band_height);
+                paintBeamLoads(elementCtx, geom, inputs);
+                elementCtx.restore();
+                last.loadKey = loadKey;
+            }
+            return;
+        }
+
+        if (!beamStaticLayer || beamStaticLayerKey !== staticKey) {
+            beamStaticLayer = beamStaticLayer || document.createElement('canvas');
+            beamStaticLayer.width = width; beamStaticLayer.height = height; // Also clears it
+            paintBeamStaticLayer(beamStaticLayer.getContext('2d'), geom, inputs);
+            beamStaticLayerKey = staticKey;
+        }
+        canvasState.element = { type: 'beam', staticKey, loadKey, plan };
+
+        elementCtx.clearRect(0, 0, width, height);
+        for (const [x_px, width_px, color] of plan.gradient) {
+            elementCtx.fillStyle = color;
+            elementCtx.fillRect(x_px, geom.y_beam_centerline - geom.beam_thickness_px / 2, width_px, geom.beam_thickness_px);
+        }
+        elementCtx.drawImage(beamStaticLayer, 0, 0);
+        paintBeamLoads(elementCtx, geom, inputs);
 
-        const deflection_points = results.deflection_points;
-        if (deflection_points && deflection_points.length > 0) {
-            const max_abs_deflection_m = Math.max(...deflection_points.map(p => Math.abs(p.d || 0)));
-            let exaggeration_factor = max_abs_deflection_m > 0 ? (elementDiagramCanvas.height * 0.20) / max_abs_deflection_m : 0;
-            exaggeration_factor = Math.min(exaggeration_factor, 7000); 
+        if (plan.deflected.length > 0) {
             elementCtx.beginPath();
-            elementCtx.moveTo(margin_x + (deflection_points[0].x || 0) * scale, y_deflected_beam_center + (deflection_points[0].d || 0) * exaggeration_factor);
-            for (let i = 1; i < deflection_points.length; i++) elementCtx.lineTo(margin_x + (deflection_points[i].x || 0) * scale, y_deflected_beam_center + (deflection_points[i].d || 0) * exaggeration_factor);
+            elementCtx.moveTo(plan.deflected[0], plan.deflected[1]);
+            for (let i = 2; i < plan.deflected.length; i += 2) elementCtx.lineTo(plan.deflected[i], plan.deflected[i + 1]);
             elementCtx.strokeStyle = themeColors.diagramDeflectedShapeColor + 'AA';
             elementCtx.lineWidth = 2.5; elementCtx.stroke(); elementCtx.lineWidth = 1;
         }
-        elementCtx.strokeStyle = themeColors.diagramDimensionLineColor; elementCtx.lineWidth = 0.75;
-        const dimY = y_beam_centerline + beam_thickness_px / 2 + support_size + 25;
-        elementCtx.beginPath(); elementCtx.moveTo(margin_x, dimY - 5); elementCtx.lineTo(margin_x, dimY + 5);
-        elementCtx.moveTo(margin_x + L_px, dimY - 5); elementCtx.lineTo(margin_x + L_px, dimY + 5);
-        elementCtx.moveTo(margin_x, dimY); elementCtx.lineTo(margin_x + L_px, dimY); elementCtx.stroke();
-        elementCtx.fillStyle = themeColors.diagramDimensionLineColor; elementCtx.textAlign = 'center';
-        elementCtx.font = "12px " + themeColors.fontFamily;
-        elementCtx.fillText(`L = ${L_m.toFixed(1)} m`, margin_x + L_px / 2, dimY - 8);
-        elementCtx.textAlign = 'start';
     }
 
     function drawColumnDiagram(element_info, results, inputs) {
-        elementCtx.clearRect(0, 0, elementDiagramCanvas.width, elementDiagramCanvas.height);
         if(elementDiagramPlaceholder) elementDiagramPlaceholder.style.display = 'none';
         const H_px = elementDiagramCanvas.height * 0.75; const H_m = element_info.length_m;
         const scale_y = H_m > 0 ? H_px / H_m : H_px;
@@ -537,14 +804,25 @@ document.addEventListener('DOMContentLoaded', function () {
 
         const axial_stress_Pa = results.axial_stress_Pa || 0;
         const yield_strength_Pa = element_info.material.Fy_Pa || Infinity;
-        if (yield_strength_Pa > 0 && yield_strength_Pa !== Infinity) {
-            const color = getColorForStress(-axial_stress_Pa, yield_strength_Pa);
-            elementCtx.fillStyle = color;
-            elementCtx.fillRect(x_col_center - col_width_px / 2, margin_y_top, col_width_px, H_px);
-        } else {
-            elementCtx.fillStyle = themeColors.mutedText.replace(')', ', 0.3)'); // Default grey translucent
-            elementCtx.fillRect(x_col_center - col_width_px / 2, margin_y_top, col_width_px, H_px);
-        }
+        const fill_color = (yield_strength_Pa > 0 && yield_strength_Pa !== Infinity)
+            ? getColorForStress(-axial_stress_Pa, yield_strength_Pa)
+            : themeColors.mutedText.replace(')', ', 0.3)'); // Default grey translucent
+
+        const P_applied = (inputs.axialLoad || 0) * 1000;
+        const P_crit = results.min_critical_buckling_load_N || 0;
+        let buckling_mode_visible = false;
+        if(results.failure_checks && results.failure_checks.euler_buckling && results.failure_checks.euler_buckling.ratio > 0.3 && P_crit > 0) buckling_mode_visible = true;
+        const buckling_exaggeration_px = buckling_mode_visible ? col_width_px * 1.8 * Math.min(1.8, P_applied / P_crit) : 0;
+        const K_factor_for_shape_approx = Math.min(element_info.Kx, element_info.Ky);
+
+        const key = JSON.stringify([H_m, col_width_px, fill_color, buckling_exaggeration_px, K_factor_for_shape_approx, inputs.axialLoad || 0]);
+        const last = canvasState.element;
+        if (last && last.type === 'column' && last.key === key) return;
+        canvasState.element = { type: 'column', key };
+
+        elementCtx.clearRect(0, 0, elementDiagramCanvas.width, elementDiagramCanvas.height);
+        elementCtx.fillStyle = fill_color;
+        elementCtx.fillRect(x_col_center - col_width_px / 2, margin_y_top, col_width_px, H_px);
         elementCtx.strokeStyle = themeColors.diagramSupportColor; elementCtx.lineWidth = 2;
         elementCtx.strokeRect(x_col_center - col_width_px / 2, margin_y_top, col_width_px, H_px);
         elementCtx.lineWidth = 1;
@@ -558,15 +836,8 @@ document.addEventListener('DOMContentLoaded', function () {
         elementCtx.fillText(`${inputs.axialLoad || 0} kN`, x_col_center, margin_y_top - 38);
         elementCtx.textAlign = 'start';
 
-        const P_applied = (inputs.axialLoad || 0) * 1000;
-        const P_crit = results.min_critical_buckling_load_N || 0;
-        let buckling_mode_visible = false;
-        if(results.failure_checks && results.failure_checks.euler_buckling && results.failure_checks.euler_buckling.ratio > 0.3 && P_crit > 0) buckling_mode_visible = true;
-        
         if (buckling_mode_visible) {
-            const buckling_exaggeration_px = col_width_px * 1.8 * Math.min(1.8, P_applied / P_crit);
             elementCtx.beginPath(); elementCtx.moveTo(x_col_center, margin_y_top);
-            let K_factor_for_shape_approx = Math.min(element_info.Kx, element_info.Ky);
             if (K_factor_for_shape_approx <= 0.6) for (let y_rel = 0; y_rel <= H_px; y_rel++) elementCtx.lineTo(x_col_center + buckling_exaggeration_px * 0.5 * (1 - Math.cos(2 * Math.PI * (y_rel / H_px))), margin_y_top + y_rel);
             else if (K_factor_for_shape_approx >= 1.8) for (let y_rel = 0; y_rel <= H_px; y_rel++) elementCtx.lineTo(x_col_center + buckling_exaggeration_px * (1 - Math.cos( (Math.PI / 2) * (y_rel / H_px))), margin_y_top + y_rel);
             else for (let y_rel = 0; y_rel <= H_px; y_rel++) elementCtx.lineTo(x_col_center + buckling_exaggeration_px * Math.sin(Math.PI * (y_rel / H_px)), margin_y_top + y_rel);
@@ -619,96 +890,118 @@ document.addEventListener('DOMContentLoaded', function () {
         ctx.closePath(); ctx.fill(); ctx.lineWidth = 1;
     }
 
+    function crossSectionDimensions(cs) {
+        // Drawable extent (m) of a section, or null when it cannot be drawn
+        const type = (cs.type || '').toLowerCase();
+        if (type === "rectangular") return { type, b_m: (cs.cx_left_m || 0) + (cs.cx_right_m || 0), h_m: (cs.cy_top_m || 0) + (cs.cy_bottom_m || 0) };
+        if (type === "circular") { const d_m = (cs.cx_left_m || 0) + (cs.cx_right_m || 0); return { type, b_m: d_m, h_m: d_m }; }
+        return null;
+    }
+
+    function governingVizMoment(results) {
+        let M_for_viz = results.max_moment_Nm || 0;
+        if (results.min_moment_Nm && Math.abs(results.min_moment_Nm) > Math.abs(M_for_viz)) M_for_viz = results.min_moment_Nm;
+        if (Math.max(Math.abs(results.max_moment_Nm || 0), Math.abs(results.min_moment_Nm || 0)) === 0) M_for_viz = 0;
+        return M_for_viz;
+    }
+
+    function describeCrossSectionStress(element_info, results, elementType) {
+        // Text half of the cross-section panel; updated synchronously with the summary
+        const cs = element_info.cross_section;
+        const dims = crossSectionDimensions(cs);
+        let stressText = `<h4>Stress Distribution (${toTitleCase(cs.type || 'N/A')})</h4>`;
+        if (!dims) stressText += "<p>Cross-section type not drawable yet.</p>";
+        else if (dims.b_m === 0 || dims.h_m === 0) stressText += "<p>Invalid section dimensions.</p>";
+        else if (elementType === 'beam') {
+            const sigma_max_abs_val = Math.max(Math.abs(results.max_bending_stress_Pa || 0), Math.abs(results.min_bending_stress_Pa || 0));
+            const M_for_viz = governingVizMoment(results);
+            stressText += `<p><strong>Governing Moment (Viz):</strong> ${(M_for_viz/1000).toFixed(2)} kNm</p>`;
+            stressText += `<p><strong>Max Bending Stress (abs):</strong> ${(sigma_max_abs_val/1e6).toFixed(2)} MPa</p>`;
+            const sigma_top_Pa = cs.Ix_m4 > 0 ? (- (M_for_viz * (cs.cy_top_m||0)) / cs.Ix_m4) : 0;
+            const sigma_bottom_Pa = cs.Ix_m4 > 0 ? (- (M_for_viz * (-(cs.cy_bottom_m||0))) / cs.Ix_m4) : 0;
+            stressText += `<p><strong>Top Fiber Stress:</strong> ${(sigma_top_Pa / 1e6).toFixed(2)} MPa (${sigma_top_Pa >= 0 ? 'Tension' : 'Compression'})</p>`;
+            stressText += `<p><strong>Bottom Fiber Stress:</strong> ${(sigma_bottom_Pa / 1e6).toFixed(2)} MPa (${sigma_bottom_Pa >= 0 ? 'Tension' : 'Compression'})</p>`;
+        } else if (elementType === 'column') {
+            const axial_stress_Pa = results.axial_stress_Pa || 0;
+            stressText += `<p><strong>Axial Stress:</strong> ${(axial_stress_Pa / 1e6).toFixed(2)} MPa (${axial_stress_Pa >= 0 ? 'Compression' : 'Tension'})</p>`;
+        }
+        crossSectionStressInfoDiv.innerHTML = stressText;
+    }
+
     function drawCrossSectionStress(element_info, results, elementType) {
-        csCtx.clearRect(0, 0, crossSectionCanvas.width, crossSectionCanvas.height);
         if(csCanvasPlaceholder) csCanvasPlaceholder.style.display = 'none';
-        crossSectionStressInfoDiv.innerHTML = ''; // Clear previous text
-
         const cs = element_info.cross_section; const material = element_info.material;
         const canvasWidth = crossSectionCanvas.width; const canvasHeight = crossSectionCanvas.height;
         const margin = 25; const availableWidth = canvasWidth - 2 * margin; const availableHeight = canvasHeight - 2 * margin;
-        let scale, cs_width_px, cs_height_px, origin_x, origin_y;
-        let stressText = `<h4>Stress Distribution (${toTitleCase(cs.type || 'N/A')})</h4>`;
+        const dims = crossSectionDimensions(cs);
+        if (!dims || dims.b_m === 0 || dims.h_m === 0) {
+            csCtx.clearRect(0, 0, canvasWidth, canvasHeight);
+            canvasState.crossSection = null;
+            return;
+        }
+        const scale = Math.min(availableWidth / dims.b_m, availableHeight / dims.h_m) * 0.85;
+        const cs_width_px = dims.b_m * scale; const cs_height_px = dims.h_m * scale;
+        const origin_x = canvasWidth / 2; const origin_y = canvasHeight / 2;
         const num_gradient_strips = 60;
-        csCtx.font = "11px " + themeColors.fontFamily; csCtx.fillStyle = themeColors.diagramTextColor;
-
-        if (cs.type.toLowerCase() === "rectangular") {
-            const b_m = (cs.cx_left_m || 0) + (cs.cx_right_m || 0); const h_m = (cs.cy_top_m || 0) + (cs.cy_bottom_m || 0);
-            if (b_m === 0 || h_m === 0) { stressText += "<p>Invalid section dimensions.</p>"; crossSectionStressInfoDiv.innerHTML = stressText; return; }
-            scale = Math.min(availableWidth / b_m, availableHeight / h_m) * 0.85;
-            cs_width_px = b_m * scale; cs_height_px = h_m * scale;
-            origin_x = canvasWidth / 2; origin_y = canvasHeight / 2;
-            csCtx.strokeStyle = themeColors.diagramSupportColor; csCtx.lineWidth = 2;
-            csCtx.strokeRect(origin_x - cs_width_px / 2, origin_y - cs_height_px / 2, cs_width_px, cs_height_px);
-        } else if (cs.type.toLowerCase() === "circular") {
-            const d_m = (cs.cx_left_m || 0) + (cs.cx_right_m || 0);
-            if (d_m === 0) { stressText += "<p>Invalid section dimensions.</p>"; crossSectionStressInfoDiv.innerHTML = stressText; return; }
-            scale = Math.min(availableWidth / d_m, availableHeight / d_m) * 0.85;
-            const r_px = (d_m / 2) * scale;
-            cs_width_px = cs_height_px = 2 * r_px;
-            origin_x = canvasWidth / 2; origin_y = canvasHeight / 2;
-            csCtx.strokeStyle = themeColors.diagramSupportColor; csCtx.lineWidth = 2;
-            csCtx.beginPath(); csCtx.arc(origin_x, origin_y, r_px, 0, 2 * Math.PI); csCtx.stroke();
-        } else { stressText += "<p>Cross-section type not drawable yet.</p>"; crossSectionStressInfoDiv.innerHTML = stressText; return; }
-
-        csCtx.strokeStyle = themeColors.diagramNeutralAxisColor; csCtx.setLineDash([3, 3]); csCtx.lineWidth = 1.5;
-        csCtx.beginPath(); csCtx.moveTo(origin_x - cs_width_px / 2 - 15, origin_y); csCtx.lineTo(origin_x + cs_width_px / 2 + 15, origin_y); csCtx.stroke();
-        csCtx.fillStyle = themeColors.diagramNeutralAxisColor;
-        csCtx.fillText("NA (X)", origin_x + cs_width_px / 2 + 18, origin_y + 4);
-        csCtx.setLineDash([]); csCtx.lineWidth = 1;
 
+        // Fill: bending stress strips (beam) or a uniform axial stress color (column)
+        const strips = []; // [y_center_px, height_px, width_px, color]
+        let fill_color = null;
         if (elementType === 'beam') {
-            const M_max_abs_val = Math.max(Math.abs(results.max_moment_Nm || 0), Math.abs(results.min_moment_Nm || 0));
             const sigma_max_abs_val = Math.max(Math.abs(results.max_bending_stress_Pa || 0), Math.abs(results.min_bending_stress_Pa || 0));
-            let M_for_viz = results.max_moment_Nm || 0;
-            if (results.min_moment_Nm && Math.abs(results.min_moment_Nm) > Math.abs(M_for_viz)) M_for_viz = results.min_moment_Nm;
-            if (M_max_abs_val === 0) M_for_viz = 0;
-
-            stressText += `<p><strong>Governing Moment (Viz):</strong> ${(M_for_viz/1000).toFixed(2)} kNm</p>`;
-            stressText += `<p><strong>Max Bending Stress (abs):</strong> ${(sigma_max_abs_val/1e6).toFixed(2)} MPa</p>`;
+            const M_for_viz = governingVizMoment(results);
             if (sigma_max_abs_val > 0 && cs.Ix_m4 > 0) {
                 const y_top_m = cs.cy_top_m || 0; const y_bottom_m = cs.cy_bottom_m || 0;
                 for (let i = 0; i < num_gradient_strips; i++) {
                     const y_norm_strip = (i + 0.5) / num_gradient_strips;
                     const y_m_from_na = -y_bottom_m + y_norm_strip * (y_top_m + y_bottom_m);
                     const sigma_Pa = - (M_for_viz * y_m_from_na) / cs.Ix_m4;
-                    const color = getColorForStress(sigma_Pa, sigma_max_abs_val || material.Fy_Pa);
-                    csCtx.fillStyle = color;
-                    const strip_y_center_px = origin_y - (y_m_from_na * scale);
-                    const strip_height_px = ((y_top_m + y_bottom_m) * scale / num_gradient_strips) + 0.5;
                     let strip_width_px = cs_width_px;
-                    if (cs.type.toLowerCase() === "circular") {
+                    if (dims.type === "circular") {
                         const r_section_m = (cs.cx_right_m || 0);
                         strip_width_px = Math.abs(y_m_from_na) <= r_section_m ? 2 * Math.sqrt(r_section_m**2 - y_m_from_na**2) * scale : 0;
                     }
-                    if (strip_width_px > 0) csCtx.fillRect(origin_x - strip_width_px / 2, strip_y_center_px - strip_height_px / 2, strip_width_px, strip_height_px);
+                    strips.push([origin_y - (y_m_from_na * scale), ((y_top_m + y_bottom_m) * scale / num_gradient_strips) + 0.5, strip_width_px, getColorForStress(sigma_Pa, sigma_max_abs_val || material.Fy_Pa)]);
                 }
-                 csCtx.strokeStyle = themeColors.diagramSupportColor; csCtx.lineWidth = 2;
-                 if (cs.type.toLowerCase() === "rectangular") csCtx.strokeRect(origin_x - cs_width_px / 2, origin_y - cs_height_px / 2, cs_width_px, cs_height_px);
-                 if (cs.type.toLowerCase() === "circular") { csCtx.beginPath(); csCtx.arc(origin_x, origin_y, (cs.cx_right_m || 0)*scale, 0, 2*Math.PI); csCtx.stroke(); }
             }
-            const sigma_top_Pa = cs.Ix_m4 > 0 ? (- (M_for_viz * (cs.cy_top_m||0)) / cs.Ix_m4) : 0;
-            const sigma_bottom_Pa = cs.Ix_m4 > 0 ? (- (M_for_viz * (-(cs.cy_bottom_m||0))) / cs.Ix_m4) : 0;
-            stressText += `<p><strong>Top Fiber Stress:</strong> ${(sigma_top_Pa / 1e6).toFixed(2)} MPa (${sigma_top_Pa >= 0 ? 'Tension' : 'Compression'})</p>`;
-            stressText += `<p><strong>Bottom Fiber Stress:</strong> ${(sigma_bottom_Pa / 1e6).toFixed(2)} MPa (${sigma_bottom_Pa >= 0 ? 'Tension' : 'Compression'})</p>`;
         } else if (elementType === 'column') {
             const axial_stress_Pa = results.axial_stress_Pa || 0;
-            stressText += `<p><strong>Axial Stress:</strong> ${(axial_stress_Pa / 1e6).toFixed(2)} MPa (${axial_stress_Pa >= 0 ? 'Compression' : 'Tension'})</p>`;
-            if (Math.abs(axial_stress_Pa) > 0 && material.Fy_Pa > 0) {
-                const stress_for_color_viz = -axial_stress_Pa;
-                const color = getColorForStress(stress_for_color_viz, material.Fy_Pa);
+            if (Math.abs(axial_stress_Pa) > 0 && material.Fy_Pa > 0) fill_color = getColorForStress(-axial_stress_Pa, material.Fy_Pa);
+        }
+
+        // Load-only changes usually leave the normalized stress picture untouched
+        const key = JSON.stringify([dims, scale, strips, fill_color]);
+        if (canvasState.crossSection === key) return;
+        canvasState.crossSection = key;
+
+        csCtx.clearRect(0, 0, canvasWidth, canvasHeight);
+        csCtx.font = "11px " + themeColors.fontFamily; csCtx.fillStyle = themeColors.diagramTextColor;
+        const strokeOutline = () => {
+            csCtx.strokeStyle = themeColors.diagramSupportColor; csCtx.lineWidth = 2;
+            if (dims.type === "rectangular") csCtx.strokeRect(origin_x - cs_width_px / 2, origin_y - cs_height_px / 2, cs_width_px, cs_height_px);
+            else { csCtx.beginPath(); csCtx.arc(origin_x, origin_y, cs_width_px / 2, 0, 2 * Math.PI); csCtx.stroke(); }
+        };
+        strokeOutline();
+
+        csCtx.strokeStyle = themeColors.diagramNeutralAxisColor; csCtx.setLineDash([3, 3]); csCtx.lineWidth = 1.5;
+        csCtx.beginPath(); csCtx.moveTo(origin_x - cs_width_px / 2 - 15, origin_y); csCtx.lineTo(origin_x + cs_width_px / 2 + 15, origin_y); csCtx.stroke();
+        csCtx.fillStyle = themeColors.diagramNeutralAxisColor;
+        csCtx.fillText("NA (X)", origin_x + cs_width_px / 2 + 18, origin_y + 4);
+        csCtx.setLineDash([]); csCtx.lineWidth = 1;
+
+        if (strips.length > 0) {
+            for (const [strip_y_center_px, strip_height_px, strip_width_px, color] of strips) {
                 csCtx.fillStyle = color;
-                if (cs.type.toLowerCase() === "rectangular") {
-                    csCtx.fillRect(origin_x - cs_width_px / 2, origin_y - cs_height_px / 2, cs_width_px, cs_height_px);
-                    csCtx.strokeStyle = themeColors.diagramSupportColor; csCtx.lineWidth = 2; csCtx.strokeRect(origin_x - cs_width_px / 2, origin_y - cs_height_px / 2, cs_width_px, cs_height_px);
-                } else if (cs.type.toLowerCase() === "circular") {
-                    csCtx.beginPath(); csCtx.arc(origin_x, origin_y, ((cs.cx_right_m||0) + (cs.cx_left_m||0))/2*scale, 0, 2*Math.PI);
-                    csCtx.fill();
-                    csCtx.strokeStyle = themeColors.diagramSupportColor; csCtx.lineWidth = 2; csCtx.stroke();
-                }
+                if (strip_width_px > 0) csCtx.fillRect(origin_x - strip_width_px / 2, strip_y_center_px - strip_height_px / 2, strip_width_px, strip_height_px);
             }
+            strokeOutline();
+        } else if (fill_color) {
+            csCtx.fillStyle = fill_color;
+            if (dims.type === "rectangular") csCtx.fillRect(origin_x - cs_width_px / 2, origin_y - cs_height_px / 2, cs_width_px, cs_height_px);
+            else { csCtx.beginPath(); csCtx.arc(origin_x, origin_y, cs_width_px / 2, 0, 2 * Math.PI); csCtx.fill(); }
+            strokeOutline();
         }
-        crossSectionStressInfoDiv.innerHTML = stressText;
+        csCtx.lineWidth = 1;
     }
 
     function getColorForStress(stress_Pa, max_abs_stress_Pa_scale) {